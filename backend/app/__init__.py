@@ -5,10 +5,18 @@ from flask.cli import with_appcontext
 from flask_sqlalchemy import SQLAlchemy
 from flask_migrate import Migrate
 from dotenv import load_dotenv
+from app.services.etags import GenerationETags
+from app.services.geometry import GeometryRegistry
+from app.services.response_cache import ResponseCache
+from app.services.sqlite_profile import ReadRoutingSession, SQLiteProfile
 
 # Extensions
-db = SQLAlchemy()
+db = SQLAlchemy(session_options={"class_": ReadRoutingSession})
 migrate = Migrate()
+geometry_registry = GeometryRegistry()
+generation_etags = GenerationETags()
+response_cache = ResponseCache()
+sqlite_profile = SQLiteProfile()
 
 
 def create_app(test_config=None):
@@ -38,7 +46,11 @@ def create_app(test_config=None):
 
     # Initialize extensions
     db.init_app(app)
+    sqlite_profile.init_app(app, db)
     migrate.init_app(app, db)
+    geometry_registry.init_app(app)
+    generation_etags.init_app(app)
+    response_cache.init_app(app)
 
     # Register Blueprints
     from app.routes.status import bp as status_bp
@@ -46,20 +58,64 @@ def create_app(test_config=None):
     from app.routes.geojson_region import bp as geojson_bp
     from app.routes.regional_data import bp as regional_bp
     from app.routes.heatmap import bp as heatmap_bp
+    from app.routes.map_tiles import bp as map_tiles_bp
+    from app.routes.export import bp as export_bp
+    from app.routes.bootstrap import bp as bootstrap_bp
 
     app.register_blueprint(status_bp)
     app.register_blueprint(trends_bp)
     app.register_blueprint(geojson_bp)
     app.register_blueprint(regional_bp)
     app.register_blueprint(heatmap_bp)
+    app.register_blueprint(map_tiles_bp)
+    app.register_blueprint(export_bp)
+    app.register_blueprint(bootstrap_bp)
 
     # CLI: Ingest data command
     @app.cli.command("ingest-data")
     @click.argument("data_folder", type=click.Path(exists=True))
+    @click.option("--chunksize", type=int, default=None,
+                  help="Rows per CSV chunk; 0 loads whole files at once.")
+    @click.option("--incremental", is_flag=True,
+                  help="Upsert new and changed rows instead of reloading.")
+    @click.option("--workers", type=int, default=None,
+                  help="Processes preparing the files; defaults to INGEST_WORKERS.")
     @with_appcontext
-    def ingest_data_cli(data_folder):
+    def ingest_data_cli(data_folder, chunksize, incremental, workers):
         from app.services.data_ingestion import ingest
-        ingest(data_folder)
+        ingest(data_folder, chunksize=chunksize, incremental=incremental,
+               workers=workers)
         click.secho("CSV/TSV ingestion complete!", fg="green")
 
+    # CLI: Rebuild the materialized regions GeoJSON without re-ingesting
+    @app.cli.command("build-geojson")
+    @with_appcontext
+    def build_geojson_cli():
+        from app.services.geojson import build_regions_geojson
+        artifact = build_regions_geojson()
+        click.secho(f"GeoJSON written to {artifact['path']}", fg="green")
+
+    # CLI: Serve the API with a multi-threaded production WSGI server
+    @app.cli.command("serve")
+    @click.option("--host", default="127.0.0.1", show_default=True)
+    @click.option("--port", type=int, default=5000, show_default=True)
+    @click.option("--threads", type=int, default=None,
+                  help="Request threads; defaults to SERVE_THREADS.")
+    def serve_cli(host, port, threads):
+        from waitress import serve
+        serve(app, host=host, port=port,
+              threads=threads or app.config.get("SERVE_THREADS", 8))
+
+    # CLI: Rebuild the week/month/year rollups, e.g. after migrating an
+    # existing database
+    @app.cli.command("build-rollups")
+    @with_appcontext
+    def build_rollups_cli():
+        from app.services.data_generation import bump_generation
+        from app.services.rollups import rebuild_rollups
+        rebuild_rollups()
+        bump_generation()
+        db.session.commit()
+        click.secho("Rollups rebuilt.", fg="green")
+
     return app
@@ -10,14 +10,94 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
 
     RAW_SHP_DIR = os.path.join(BASE_DIR, 'data', 'raw', 'shapefiles')
+    REGIONS_SHAPEFILE = os.path.join(RAW_SHP_DIR, 'Deutsch.shp')
     PROCESSED_GEOJSON = os.path.join(BASE_DIR, 'data', 'processed', 
                                      'regions_with_sentiment.geojson')
 
+    # Parse the region shapefile in create_app instead of on first request
+    PRELOAD_GEOMETRY = False
+
+    # Simplification tolerances (degrees) of the coarser map geometry levels
+    GEOMETRY_TOLERANCES = (0.005, 0.02, 0.05)
+
+    # Grid steps per axis used to quantize TopoJSON arcs
+    TOPOJSON_QUANTIZATION = 100000
+
+    # Pragmas run on every new SQLite connection; {} keeps SQLite's
+    # defaults. WAL lets API readers and the ingest writer work at the
+    # same time, and NORMAL sync is durable under WAL except for the last
+    # commits before a power loss. Negative cache_size is in KiB.
+    SQLITE_PRAGMAS = {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 256 * 1024 * 1024,
+        'cache_size': -64 * 1024,
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,
+    }
+
+    # Serve requests from a separate pool of read-only SQLite connections;
+    # ingestion and other CLI commands use the default (writing) engine
+    SQLITE_READ_POOL = True
+    SQLITE_READ_POOL_SIZE = 12
+
+    # Ingestion: rows read per CSV chunk (0 reads whole files) and rows
+    # per INSERT executemany
+    INGEST_CHUNKSIZE = 50000
+    INGEST_BATCH_SIZE = 10000
+
+    # Processes reading, cleaning and validating the source files during
+    # ingestion; None uses one per CPU, 1 does it all in-process
+    INGEST_WORKERS = None
+
+    # Keep a Parquet copy of each raw input, keyed by its content hash, so
+    # unchanged files are not parsed again; defaults to instance/ingest_cache
+    INGEST_CACHE = True
+    INGEST_CACHE_DIR = None
+
+    # Incremental ingestion re-checks this many days before the stored
+    # high-watermark for late corrections
+    INGEST_LOOKBACK_DAYS = 7
+
+    # Vector tiles: highest zoom served and number of encoded tiles cached
+    MAX_TILE_ZOOM = 14
+    TILE_CACHE_SIZE = 4096
+
+    # Serve regional reads from the in-memory regions x days NumPy cube
+    # instead of SQL; it reloads after each ingest
+    TIMESERIES_CUBE = True
+
+    # Response cache of the JSON read endpoints: 'memory' (per process),
+    # 'sqlite' (shared by all workers through RESPONSE_CACHE_PATH, which
+    # defaults to instance/response_cache.sqlite) or 'none'. Entries expire
+    # after RESPONSE_CACHE_TTL seconds and are dropped after each ingest.
+    RESPONSE_CACHE_BACKEND = 'memory'
+    RESPONSE_CACHE_PATH = None
+    RESPONSE_CACHE_SIZE = 1024
+    RESPONSE_CACHE_TTL = 3600
+
+    # Rows per Arrow record batch (and Parquet row group) of /api/export
+    EXPORT_BATCH_SIZE = 50000
+
+    # NDJSON/CSV streaming: rows fetched per cursor round trip and written
+    # per response chunk
+    STREAM_BATCH_SIZE = 2000
+
+    # Threads rendering the parts of /api/bootstrap concurrently
+    BOOTSTRAP_WORKERS = 4
+
+    # Request threads of `flask serve`. Together with the bootstrap
+    # threads this stays below the 15 connections SQLAlchemy's default
+    # pool hands out, so no request waits for a connection.
+    SERVE_THREADS = 8
+
 
 class ProductionConfig(Config):
     """Production-specific configuration."""
     SQLALCHEMY_DATABASE_URI = os.environ.get('DATABASE_URL', 
                                              'sqlite:///instance/flaskr.sqlite')
+    PRELOAD_GEOMETRY = True
+    RESPONSE_CACHE_BACKEND = 'sqlite'
 
 
 class DevelopmentConfig(Config):
@@ -5,14 +5,23 @@ from sqlalchemy import func
 
 class GlobalStats(db.Model):
     __tablename__ = "global_stats"
+    __table_args__ = (
+        # country lookups and /trends/global for a single country
+        db.Index("ux_global_stats_country_date", "country",
+                 "item_date_published", unique=True),
+        # Date ranges ordered by (date, country), latest snapshot and
+        # totals for /status; covers every column
+        db.Index("ix_global_stats_date_covering", "item_date_published",
+                 "country", "av_sents", "num_news", "num_feeds",
+                 "num_newspaper"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    country = db.Column(db.String, default="Germany", index=True)
+    country = db.Column(db.String, default="Germany")
     item_date_published = db.Column(
         db.DateTime(timezone=True),
         server_default=func.now(),
-        default=lambda: datetime.now(timezone.utc),
-        index=True
+        default=lambda: datetime.now(timezone.utc)
     )
     num_newspaper = db.Column(db.Integer, default=0)
     num_feeds = db.Column(db.Integer, default=0)
@@ -25,15 +34,22 @@ class GlobalStats(db.Model):
 
 class RegionalData(db.Model):
     __tablename__ = "regional_data"
+    __table_args__ = (
+        # One region over a date range (region details, latest per region)
+        db.Index("ux_regional_data_region_date", "region_id",
+                 "item_date_published", unique=True),
+        # Several regions or all regions on a date range in date order
+        # (/trends/regional, map values); covers the *_av metrics
+        db.Index("ix_regional_data_date_region", "item_date_published",
+                 "region_id", "rauh_sents_av", "happiness_av", "val_av"),
+    )
 
     id = db.Column(db.Integer, primary_key=True)
-    region_id = db.Column(db.Integer, db.ForeignKey("regions.region_id"),
-                          index=True)
+    region_id = db.Column(db.Integer, db.ForeignKey("regions.region_id"))
     item_date_published = db.Column(
         db.DateTime(timezone=True),
         server_default=func.now(),
-        default=lambda: datetime.now(timezone.utc),
-        index=True
+        default=lambda: datetime.now(timezone.utc)
     )
     num_words = db.Column(db.Float, default=0.0)
     rauh_sents_share = db.Column(db.Float, default=0.0)
@@ -53,8 +69,119 @@ class Regions(db.Model):
     __tablename__ = "regions"
 
     region_id = db.Column(db.Integer, primary_key=True)
-    region_name = db.Column(db.String, default="None")
+    region_name = db.Column(db.String, default="None", index=True)
     country = db.Column(db.String, default="None")
 
     def __repr__(self):
         return f"<Regions {self.region_id}, {self.region_name}, {self.country}>"
+
+
+class DataGeneration(db.Model):
+    """Single-row counter bumped whenever ingestion changes the data."""
+    __tablename__ = "data_generation"
+
+    id = db.Column(db.Integer, primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self):
+        return f"<DataGeneration {self.generation}, {self.updated_at}>"
+
+
+class IngestWatermark(db.Model):
+    """Latest item_date_published loaded into each table."""
+    __tablename__ = "ingest_watermarks"
+
+    table_name = db.Column(db.String, primary_key=True)
+    high_watermark = db.Column(db.DateTime(timezone=True))
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self):
+        return f"<IngestWatermark {self.table_name}, {self.high_watermark}>"
+
+
+class RegionalRollup(db.Model):
+    """Per-region week/month/year aggregate of one RegionalData metric."""
+    __tablename__ = "regional_rollups"
+    __table_args__ = (
+        db.Index("ux_regional_rollups_region_period_metric", "region_id",
+                 "period", "metric", "period_start", unique=True),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    region_id = db.Column(db.Integer, db.ForeignKey("regions.region_id"),
+                          nullable=False)
+    period = db.Column(db.String, nullable=False)
+    period_start = db.Column(db.DateTime(timezone=True), nullable=False)
+    metric = db.Column(db.String, nullable=False)
+    value_sum = db.Column(db.Float)
+    value_mean = db.Column(db.Float)
+    value_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (f"<RegionalRollup {self.region_id}, {self.period} "
+                f"{self.period_start}, {self.metric}>")
+
+
+class GlobalRollup(db.Model):
+    """Per-country week/month/year aggregate of one GlobalStats metric."""
+    __tablename__ = "global_rollups"
+    __table_args__ = (
+        db.Index("ux_global_rollups_country_period_metric", "country",
+                 "period", "metric", "period_start", unique=True),
+    )
+
+    id = db.Column(db.Integer, primary_key=True)
+    country = db.Column(db.String, nullable=False)
+    period = db.Column(db.String, nullable=False)
+    period_start = db.Column(db.DateTime(timezone=True), nullable=False)
+    metric = db.Column(db.String, nullable=False)
+    value_sum = db.Column(db.Float)
+    value_mean = db.Column(db.Float)
+    value_count = db.Column(db.Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        return (f"<GlobalRollup {self.country}, {self.period} "
+                f"{self.period_start}, {self.metric}>")
+
+
+class DashboardSummary(db.Model):
+    """Single-row /api/status snapshot, refreshed with every data change."""
+    __tablename__ = "dashboard_summary"
+
+    id = db.Column(db.Integer, primary_key=True)
+    total_news = db.Column(db.BigInteger, nullable=False, default=0)
+    last_update = db.Column(db.DateTime(timezone=True))
+    channels_count = db.Column(db.Integer, nullable=False, default=0)
+    sources_count = db.Column(db.Integer, nullable=False, default=0)
+    updated_at = db.Column(
+        db.DateTime(timezone=True),
+        server_default=func.now(),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self):
+        return f"<DashboardSummary {self.total_news}, {self.last_update}>"
+
+
+class DailyCounter(db.Model):
+    """News count and sentiment of one published day over all countries."""
+    __tablename__ = "daily_counters"
+
+    day = db.Column(db.DateTime(timezone=True), primary_key=True)
+    num_news = db.Column(db.Integer, nullable=False, default=0)
+    av_sents = db.Column(db.Float)
+
+    def __repr__(self):
+        return f"<DailyCounter {self.day}, {self.num_news}>"
@@ -0,0 +1,57 @@
+import orjson
+from flask import Blueprint, Response, request
+from app.services.bootstrap import render_views
+
+bp = Blueprint('bootstrap', __name__, url_prefix='/api/bootstrap')
+
+# Countries of the trends page on first load
+DEFAULT_COUNTRIES = 'Deutschland,Schweiz,Österreich'
+
+
+@bp.route('', methods=['GET'])
+def bootstrap():
+    """
+    Everything the dashboard needs for its first paint in one response.
+
+    Query parameters:
+        countries (str): global trend countries, comma-separated.
+            Defaults to 'Deutschland,Schweiz,Österreich'.
+        metric (str): global trend metric. Defaults to 'sentiment'.
+        map_metric (str): heatmap metric. Defaults to 'sentiment_mean'.
+
+    Returns:
+        JSON object with the bodies of
+            - status: GET /api/status
+            - regions: GET /api/trends/regions
+            - map: GET /api/map/heat?metric=<map_metric>
+            - global_trends: GET /api/trends/global?countries=..&metric=..
+
+    The parts are rendered concurrently, each with its own database
+    session, through the same views (and their caches) as the separate
+    endpoints; their bodies are spliced together without re-encoding.
+
+    Response codes:
+        200 OK on success
+        Otherwise the status of the first failing part, with
+        {"error": "<part>: <message>"}.
+    """
+    parts = render_views({
+        'status': ('/api/status', {}),
+        'regions': ('/api/trends/regions', {}),
+        'map': ('/api/map/heat', {'metric': request.args.get('map_metric', 'sentiment_mean')}),
+        'global_trends': ('/api/trends/global', {
+            'countries': request.args.get('countries', DEFAULT_COUNTRIES),
+            'metric': request.args.get('metric', 'sentiment'),
+        }),
+    })
+
+    for name, (code, body) in parts.items():
+        if code != 200:
+            message = orjson.loads(body).get('error', 'failed') if body else 'failed'
+            return Response(orjson.dumps({"error": f"{name}: {message}"}), status=code,
+                            mimetype="application/json")
+
+    body = b"{" + b",".join(
+        orjson.dumps(name) + b":" + part for name, (_, part) in parts.items()
+    ) + b"}"
+    return Response(body, status=200, mimetype="application/json")
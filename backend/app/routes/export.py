@@ -0,0 +1,75 @@
+from flask import Blueprint, Response, jsonify, request, stream_with_context
+from datetime import datetime
+from app.services.export import (
+    EXPORT_FORMATS, EXPORTS, arrow_schema, record_batches, stream_export
+)
+
+bp = Blueprint('export', __name__, url_prefix='/api/export')
+
+
+@bp.route('/<any(regional_data, global_stats):table>', methods=['GET'])
+def export_table(table):
+    """
+    Streams a fact table as Arrow IPC or Parquet in one response.
+
+    Path parameter:
+        table (str): 'regional_data' or 'global_stats'.
+
+    Query parameters:
+        regions (str): regional_data only; comma-separated region IDs.
+            Defaults to all regions.
+        countries (str): global_stats only; comma-separated country names.
+            Defaults to all countries.
+        metrics (str): comma-separated metric columns. Defaults to all.
+        from, to (str): YYYY-MM-DD bounds of item_date_published.
+            Default to the whole history.
+        format (str): 'arrow' (default, Arrow IPC stream) or 'parquet'.
+
+    Returns:
+        The entity column, item_date_published and the metrics, ordered by
+        entity and date, written in record batches as they are read, e.g.
+        pyarrow.ipc.open_stream(body).read_pandas() or
+        pandas.read_parquet(io.BytesIO(body)).
+
+    Response codes:
+        200 OK: Stream follows.
+        400 Bad Request: Invalid query paramters.
+    """
+    model, entity, metric_columns = EXPORTS[table]
+
+    fmt = request.args.get('format', 'arrow')
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": f"Invalid format. Must be one of: {', '.join(EXPORT_FORMATS)}."}), 400
+
+    metrics_param = request.args.get('metrics')
+    if metrics_param:
+        metrics = list(dict.fromkeys(m.strip() for m in metrics_param.split(',')))
+        invalid = [m for m in metrics if m not in metric_columns]
+        if invalid:
+            return jsonify({"error": f"Invalid metric names: {invalid}"}), 400
+    else:
+        metrics = metric_columns
+
+    entities = None
+    if table == 'regional_data' and request.args.get('regions'):
+        try:
+            entities = [int(r) for r in request.args['regions'].split(',')]
+        except ValueError:
+            return jsonify({"error": "Invalid region IDs. Must be integers."}), 400
+    elif table == 'global_stats' and request.args.get('countries'):
+        entities = [c.strip() for c in request.args['countries'].split(',')]
+
+    try:
+        start = datetime.fromisoformat(request.args['from']) if 'from' in request.args else None
+        end = datetime.fromisoformat(request.args['to']) if 'to' in request.args else None
+    except ValueError:
+        return jsonify({"error": "Invalid date format. Use YYYY-MM-DD."}), 400
+
+    columns = [entity, 'item_date_published', *metrics]
+    batches = record_batches(model, columns, entity, entities, start, end)
+    mimetype, extension = EXPORT_FORMATS[fmt]
+    return Response(
+        stream_with_context(stream_export(batches, arrow_schema(model, columns), fmt)),
+        mimetype=mimetype,
+        headers={"Content-Disposition": f'attachment; filename="{table}.{extension}"'},
+    )
@@ -1,13 +1,49 @@
 # app/routes/geojson_region.py
 
-from flask import Blueprint, Response
-from app.services.geojson import generate_regions_geojson
-from app import db
+from flask import Blueprint, jsonify, request, send_file
+from app import generation_etags, geometry_registry
+from app.services.geojson import FORMATS, build_regions_geojson, current_regions_geojson
 
 bp = Blueprint("geojson_region", __name__, url_prefix="/api/geojson")
 
 @bp.route("/regions-with-sentiment")
+@generation_etags.exempt
 def regions_with_sentiment():
-    # Always regenerate the GeoJSON on each request
-    geojson_str = generate_regions_geojson()
-    return Response(geojson_str, mimetype="application/json")
+    """
+    Serves the GeoJSON materialized by the last ingest.
+
+    Query parameters:
+        - zoom (optional): web map zoom level; picks simplified geometry
+          that is still accurate to about one pixel.
+        - tolerance (optional): maximum simplification tolerance in
+          degrees. Takes precedence over zoom.
+        - format (optional): 'geojson' (default) or 'topojson'.
+
+    The file is built on first use if no ingest has produced it yet.
+    Responses carry ETag/Last-Modified and return 304 Not Modified when
+    the client's copy is current.
+    """
+    fmt = request.args.get("format", "geojson")
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Invalid format. Must be one of: {', '.join(FORMATS)}."}), 400
+
+    try:
+        level = geometry_registry.level_for(
+            zoom=request.args.get("zoom"),
+            tolerance=request.args.get("tolerance"),
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    artifact = current_regions_geojson(level, fmt)
+    if artifact is None:
+        build_regions_geojson()
+        artifact = current_regions_geojson(level, fmt)
+
+    return send_file(
+        artifact["path"],
+        mimetype="application/json",
+        etag=artifact["etag"],
+        conditional=True,
+        max_age=0,
+    )
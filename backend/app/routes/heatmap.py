@@ -1,11 +1,9 @@
-import os
-import json
-import geopandas as gpd
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, Response, request, jsonify
 from datetime import datetime
 from sqlalchemy import func
-from app import db
+from app import db, geometry_registry, response_cache
 from app.models.data_models import RegionalData, Regions
+from app.services.timeseries_cube import cube_store
 
 bp = Blueprint('heatmap', __name__, url_prefix='/api/map/heat')
 
@@ -15,13 +13,70 @@ METRIC_MAP = {
     'happiness_mean': RegionalData.happiness_av
 }
 
+FORMATS = ('geojson', 'topojson')
+
+
+def resolve_target_date(date_str):
+    """
+    Parse the optional ?date query param in YYYY-MM-DD.
+    Defaults to the latest date with regional data.
+    Returns (target_date, error_response, status_code).
+    """
+    if date_str:
+        try:
+            return datetime.fromisoformat(date_str).date(), None, None
+        except ValueError:
+            return None, jsonify({"error": "Invalid date format. Use YYYY-MM-DD."}), 400
+
+    cube = cube_store.get()
+    if cube is not None:
+        latest = cube.latest_day()
+    else:
+        latest = db.session.query(func.max(RegionalData.item_date_published)).scalar()
+    if not latest:
+        return None, jsonify({"error": "No data available."}), 404
+    return latest, None, None
+
+
+def metric_values(metric_key, target_date) -> dict:
+    """Returns region_id -> value of one METRIC_MAP metric on target_date."""
+    cube = cube_store.get()
+    if cube is not None:
+        return cube.day_values(METRIC_MAP[metric_key].key, target_date)
+    if not isinstance(target_date, datetime):
+        # Rows are stored as timestamps at midnight
+        target_date = datetime.combine(target_date, datetime.min.time())
+    metric_col = METRIC_MAP[metric_key].label('value')
+    value_rows = (
+        db.session.query(RegionalData.region_id, metric_col)
+        .filter(RegionalData.item_date_published == target_date)
+        .all()
+    )
+    return {rid: val for rid, val in value_rows}
+
+
+def region_names() -> dict:
+    """Returns region_id -> region name."""
+    cube = cube_store.get()
+    if cube is not None:
+        return cube.region_names
+    name_rows = db.session.query(Regions.region_id, Regions.region_name).all()
+    return {rid: name for rid, name in name_rows}
+
+
 @bp.route('', methods=["GET"])
+@response_cache.cached()
 def heatmap():
     """
     GET /api/map/heat
     Query parameters:
         - metric (str): one of the keys in METRIC_MAP
         - date (optional): YYYY-MM-DD. Defaults to the latest available date.
+        - zoom (optional): web map zoom level; picks simplified geometry
+          that is still accurate to about one pixel.
+        - tolerance (optional): maximum simplification tolerance in
+          degrees. Takes precedence over zoom.
+        - format (optional): 'geojson' (default) or 'topojson'.
 
     Returns:
         GeoJSON FeatureCollection with:
@@ -29,6 +84,8 @@ def heatmap():
         - region_id
         - region name (from DB)
         - selected metric value
+        With format=topojson, a Topology whose "regions" object holds the
+        same features with shared borders encoded once as arcs.
     """
 
     # Metric validation
@@ -36,49 +93,43 @@ def heatmap():
     if metric_key not in METRIC_MAP:
         return jsonify({"error": "Invalid metric key"}), 400
 
-    # Date handling
-    date_str = request.args.get('date')
-    if date_str:
-        try:
-            target_date = datetime.fromisoformat(date_str).date()
-        except ValueError:
-            return jsonify({"error": "Invalid date format. Use YYYY-MM-DD."}), 400
-    else:
-        latest = db.session.query(func.max(RegionalData.item_date_published)).scalar()
-        if not latest:
-            return jsonify({"error": "No data available."}), 404
-        target_date = latest
+    fmt = request.args.get('format', 'geojson')
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Invalid format. Must be one of: {', '.join(FORMATS)}."}), 400
 
-    # Query metric values
-    metric_col = METRIC_MAP[metric_key].label('value')
-    value_rows = (
-        db.session.query(RegionalData.region_id, metric_col)
-        .filter(RegionalData.item_date_published == target_date)
-        .all()
-    )
-    value_map = {rid: val for rid, val in value_rows}
+    # Geometry resolution
+    try:
+        level = geometry_registry.level_for(
+            zoom=request.args.get('zoom'),
+            tolerance=request.args.get('tolerance')
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
-    # Query region names
-    name_rows = db.session.query(Regions.region_id, Regions.region_name).all()
-    name_map = {rid: name for rid, name in name_rows}
+    # Date handling
+    target_date, err, code = resolve_target_date(request.args.get('date'))
+    if err:
+        return err, code
+
+    # Query metric values and region names
+    value_map = metric_values(metric_key, target_date)
+    name_map = region_names()
 
-    # Load shapefile
-    shp_path = os.path.join(current_app.root_path, 'data', 'raw', 'shapefiles', 'Deutsch.shp')
+    # Splice values into the pre-rendered region features
     try:
-        regions_gdf = gpd.read_file(shp_path)[['ROR1217', 'geometry']]
+        if fmt == 'topojson':
+            properties = {
+                rid: {"value": value_map.get(rid, 0), "NAME": name_map.get(rid, "Unknown")}
+                for rid in geometry_registry.geometries
+            }
+            body = geometry_registry.render_topology(
+                properties, level, date=target_date.isoformat()
+            )
+        else:
+            body = geometry_registry.render_feature_collection(
+                value_map, name_map, level, date=target_date.isoformat()
+            )
     except Exception as e:
         return jsonify({"error": f"Error reading shapefile: {str(e)}"}), 500
 
-    regions_gdf = regions_gdf.rename(columns={'ROR1217': 'region_id'}).set_index('region_id')
-
-    # Merge values and names
-    regions_gdf['value'] = regions_gdf.index.map(lambda rid: value_map.get(rid, 0))
-    regions_gdf['NAME'] = regions_gdf.index.map(lambda rid: name_map.get(rid, "Unknown"))
-
-    # Return GeoJSON with metadata
-    geojson = json.loads(regions_gdf.to_json())
-    return jsonify({
-        "date": target_date.isoformat(),
-        "type": geojson["type"],
-        "features": geojson["features"]
-    }), 200
+    return Response(body, status=200, mimetype="application/json")
@@ -0,0 +1,45 @@
+from flask import Blueprint, Response, request, jsonify, current_app
+from app.routes.heatmap import METRIC_MAP, resolve_target_date, metric_values, region_names
+from app.services.data_generation import current_generation
+from app.services.vector_tiles import MVT_MIMETYPE, render_tile, tile_cache
+
+bp = Blueprint('map_tiles', __name__, url_prefix='/api/map/tiles')
+
+
+@bp.route('/<int:z>/<int:x>/<int:y>.mvt', methods=["GET"])
+def vector_tile(z, x, y):
+    """
+    GET /api/map/tiles/<z>/<x>/<y>.mvt
+    Query parameters:
+        - metric (str): one of the keys in METRIC_MAP
+        - date (optional): YYYY-MM-DD. Defaults to the latest available date.
+
+    Returns:
+        Mapbox Vector Tile with a "regions" layer. Each feature carries
+        region_id, NAME and the selected metric as value. 204 No Content
+        if no region intersects the tile.
+
+    Tiles are cached per (metric, date, z/x/y) until the next ingest.
+    """
+    metric_key = request.args.get('metric')
+    if metric_key not in METRIC_MAP:
+        return jsonify({"error": "Invalid metric key"}), 400
+
+    max_zoom = current_app.config.get("MAX_TILE_ZOOM", 14)
+    if not (0 <= z <= max_zoom and 0 <= x < 2 ** z and 0 <= y < 2 ** z):
+        return jsonify({"error": "Tile out of range"}), 404
+
+    target_date, err, code = resolve_target_date(request.args.get('date'))
+    if err:
+        return err, code
+
+    key = (metric_key, target_date.isoformat(), z, x, y, current_generation())
+    tile = tile_cache.get(key)
+    if tile is None:
+        tile = render_tile(z, x, y, metric_values(metric_key, target_date),
+                           region_names())
+        tile_cache.put(key, tile)
+
+    if not tile:
+        return Response(status=204)
+    return Response(tile, status=200, mimetype=MVT_MIMETYPE)
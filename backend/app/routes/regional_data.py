@@ -1,7 +1,15 @@
 from flask import Blueprint, jsonify, request
 from datetime import datetime, date
-from app import db
+from sqlalchemy import select
+from app import db, response_cache
 from app.models.data_models import RegionalData, Regions
+from app.services.columnar import FORMATS, columnar_response, columns_from_rows
+from app.services.downsampling import downsample, parse_downsampling
+from app.services.rollups import rollup_series
+from app.services.streaming import (
+    downsample_groups, requested_stream_type, stream_batch_size, stream_rows
+)
+from app.services.timeseries_cube import cube_store
 
 bp = Blueprint('regions', __name__, url_prefix='/api/regions')
 
@@ -15,6 +23,8 @@ METRIC_MAP = {
 }
 
 @bp.route('/region/<int:region_id>', methods=['GET'])
+@response_cache.cached(list_params=("metrics",), defaults={
+    "from": "2019-01-01", "to": lambda: date.today().isoformat()})
 def region_details(region_id):
     """
     Retrieve time-series metrics for a specific region.
@@ -35,6 +45,17 @@ def region_details(region_id):
         to (str):
             End date in YYYY-MM-DD format.
             Defaults to today.
+        resolution (str):
+            'day', 'week', 'month' or 'year'. Coarser values are
+            num_news-weighted means read from the rollup tables, dated by
+            the first day of the period; periods overlapping from/to are
+            returned whole.
+            Defaults to 'day'.
+        points (int):
+            Maximum number of entries in data, selected with
+            Largest-Triangle-Three-Buckets. Defaults to all.
+        format (str):
+            'rows' (default) or 'columnar'.
 
     Returns:
         JSON response containing the region's metrics data.
@@ -42,6 +63,11 @@ def region_details(region_id):
             - region_id: ID of the region
             - region_name: Name of the region
             - data: List of dictionaries with date and metric values
+        With format=columnar, data is replaced by:
+            - dates: List of ISO dates
+            - series: Metric -> list of values aligned with dates
+        With Accept: application/x-ndjson or text/csv, only the entries of
+        data are streamed, one per line, from a server-side cursor.
 
      Response codes:
         200 OK: Successful retrieval of data.
@@ -50,8 +76,13 @@ def region_details(region_id):
 
     """
 
-    region = db.session.get(Regions, region_id)
-    if not region:
+    cube = cube_store.get()
+    if cube is not None:
+        region_name = cube.region_names.get(region_id)
+    else:
+        region = db.session.get(Regions, region_id)
+        region_name = region.region_name if region else None
+    if region_name is None:
         return jsonify({"error": "Region not found"}), 404
 
     metrics_param = request.args.get('metrics')
@@ -78,6 +109,92 @@ def region_details(region_id):
     else:
         end_date = datetime.combine(date.today(), datetime.min.time())
 
+    try:
+        resolution, points = parse_downsampling(request.args.get('resolution'),
+                                                request.args.get('points'))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    fmt = request.args.get('format', 'rows')
+    if fmt not in FORMATS:
+        return jsonify({"error": f"Invalid format. Must be one of: {', '.join(FORMATS)}."}), 400
+
+    stream_type = requested_stream_type()
+    if stream_type:
+        rows = _stream_region_series(region_id, metrics, resolution, start_date, end_date)
+        return stream_rows(downsample_groups(rows, metrics, points), ['date', *metrics],
+                           stream_type)
+
+    if fmt == 'columnar' and cube is not None and resolution == 'day' and points is None:
+        _, dates, values = cube.block([region_id], [METRIC_MAP[m].key for m in metrics],
+                                      start_date, end_date)
+        return columnar_response({
+            "region_id": region_id,
+            "region_name": region_name,
+            "dates": dates,
+            "series": {m: values[METRIC_MAP[m].key].reshape(-1) for m in metrics},
+        })
+
+    if resolution != 'day':
+        rows = rollup_series(RegionalData, [region_id],
+                             {m: METRIC_MAP[m].key for m in metrics},
+                             resolution, start_date, end_date)
+        data = [{'date': r['date'], **{m: r[m] for m in metrics}} for r in rows]
+    elif cube is not None:
+        dates, columns = cube.series(
+            region_id, [METRIC_MAP[m].key for m in metrics], start_date, end_date
+        )
+        data = [{'date': d} for d in dates]
+        for key in metrics:
+            for entry, value in zip(data, columns[METRIC_MAP[key].key]):
+                entry[key] = value
+    else:
+        data = _query_region_series(region_id, metrics, start_date, end_date)
+    data = downsample(data, metrics, points=points)
+
+    if fmt == 'columnar':
+        dates, series = columns_from_rows(data, metrics)
+        return columnar_response({
+            "region_id": region_id,
+            "region_name": region_name,
+            "dates": dates,
+            "series": series,
+        })
+    return jsonify({
+        "region_id": region_id,
+        "region_name": region_name,
+        "data": data
+    })
+
+
+def _stream_region_series(region_id, metrics, resolution, start_date, end_date):
+    """Yields region_details data entries in date order."""
+    if resolution != 'day':
+        rows = rollup_series(RegionalData, [region_id],
+                             {m: METRIC_MAP[m].key for m in metrics},
+                             resolution, start_date, end_date)
+        for r in rows:
+            yield {'date': r['date'], **{m: r[m] for m in metrics}}
+        return
+
+    stmt = (
+        select(RegionalData.item_date_published, *(METRIC_MAP[m] for m in metrics))
+        .where(
+            RegionalData.region_id == region_id,
+            RegionalData.item_date_published >= start_date,
+            RegionalData.item_date_published <= end_date
+        )
+        .order_by(RegionalData.item_date_published)
+        .execution_options(yield_per=stream_batch_size())
+    )
+    for published, *values in db.session.connection().execute(stmt):
+        entry = {'date': published.date().isoformat()}
+        entry.update(zip(metrics, values))
+        yield entry
+
+
+def _query_region_series(region_id, metrics, start_date, end_date) -> list:
+    """SQL fallback of region_details when the time-series cube is disabled."""
     cols = [RegionalData.item_date_published]
     cols += [METRIC_MAP[m] for m in metrics]
 
@@ -98,9 +215,4 @@ def region_details(region_id):
         for idx, key in enumerate(metrics, start=1):
             entry[key] = row[idx]
         data.append(entry)
-    
-    return jsonify({
-        "region_id": region.region_id,
-        "region_name": region.region_name,
-        "data": data
-    })
+    return data
@@ -1,7 +1,8 @@
 from flask import Blueprint, jsonify, current_app
 from datetime import date
-from app import db
+from app import db, generation_etags, response_cache
 from app.models.data_models import GlobalStats
+from app.services.dashboard_summary import status_cache
 from sqlalchemy import func
 
 bp = Blueprint('status', __name__, url_prefix="/api/status")
@@ -26,12 +27,20 @@ def get_status():
     - Considers records from 2019 and onwars, reads latest row explicitly,
     no query parameter is needed.
 
+    Served from the dashboard summary maintained by ingestion and cached
+    in memory until the data generation or the day changes; databases
+    without a summary yet fall back to querying global_stats.
+
 
     Resposnse code:
     - 200 OK on success
     """
     current_app.logger.info(" get_status() called")
     try:
+        payload = status_cache.get()
+        if payload is not None:
+            return jsonify(payload), 200
+
         # Cumulative total_news
         total_news = db.session \
             .query(func.coalesce(func.sum(GlobalStats.num_news), 0)) \
@@ -86,3 +95,21 @@ def get_status():
             "error": str(e),
             "type": type(e).__name__
         }), 500
+
+
+@bp.route("/cache", methods=["GET"])
+@generation_etags.exempt
+def get_cache_stats():
+    """
+    Response cache counters of the serving process.
+
+    Returns a JSON object with:
+    - backend (str): 'memory', 'sqlite' or 'none'
+    - entries (int): cached responses currently stored
+    - hits, misses, evictions (int): counts since the process started;
+    evictions include expired entries dropped by the sqlite backend
+
+    Resposnse code:
+    - 200 OK
+    """
+    return jsonify(response_cache.stats()), 200
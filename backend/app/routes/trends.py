@@ -2,12 +2,30 @@
 
 from flask import Blueprint, jsonify, request
 from datetime import datetime, date
-from sqlalchemy import func
-from app import db
+from sqlalchemy import func, select
+from app import db, response_cache
 from app.models.data_models import RegionalData, GlobalStats, Regions
+from app.services.columnar import FORMATS, columnar_response, columns_from_rows
+from app.services.downsampling import downsample, parse_downsampling
+from app.services.rollups import rollup_series
+from app.services.streaming import (
+    downsample_groups, requested_stream_type, stream_batch_size, stream_rows
+)
+from app.services.timeseries_cube import cube_store
 
 bp = Blueprint('trends', __name__, url_prefix='/api/trends')
 
+# Response key -> RegionalData column of the regional trend series
+TREND_METRICS = {
+    "rauh":      "rauh_sents_av",
+    "happiness": "happiness_av",
+    "valenz":    "val_av",
+}
+
+
+# Query defaults resolved before keying the response cache
+DATE_DEFAULTS = {"from": "2019-01-01", "to": lambda: date.today().isoformat()}
+
 
 def _parse_dates():
     """
@@ -23,12 +41,43 @@ def _parse_dates():
     return start, end, None, None
 
 
+def _parse_downsampling():
+    """
+    Parse optional query params ?resolution (day|week|month|year) & ?points.
+    Returns (resolution, points, error_response, status_code).
+    """
+    try:
+        resolution, points = parse_downsampling(request.args.get('resolution'),
+                                                request.args.get('points'))
+    except ValueError as e:
+        return None, None, jsonify({"error": str(e)}), 400
+    return resolution, points, None, None
+
+
+def _parse_format():
+    """
+    Parse optional query param ?format (rows|columnar).
+    Returns (format, error_response, status_code).
+    """
+    fmt = request.args.get('format', 'rows')
+    if fmt not in FORMATS:
+        return None, jsonify({"error": f"Invalid format. Must be one of: {', '.join(FORMATS)}."}), 400
+    return fmt, None, None
+
+
 @bp.route('/regional', methods=['GET'])
+@response_cache.cached(list_params=("regions",), defaults=DATE_DEFAULTS)
 def regional_trends():
     """
     GET /trends/regional
       - regions (required): comma-separated region IDs, e.g. regions=101,102
       - from, to  (optional, YYYY-MM-DD)
+      - resolution (optional): day (default), week, month or year; coarser
+        values are num_news-weighted means from the rollup tables, dated
+        by the period start. Periods overlapping from/to are returned whole.
+      - points (optional): keep at most this many points per region,
+        selected with Largest-Triangle-Three-Buckets
+      - format (optional): rows (default) or columnar
     Returns a list of daily values for each region:
       [
         {
@@ -41,8 +90,25 @@ def regional_trends():
         },
         ...
       ]
+    With format=columnar, one array per region and metric on a shared date
+    axis, null where a region has no value:
+      {
+        "dates": ["2025-04-01", ...],
+        "regions": {"101": "Schleswig-Holstein Mitte"},
+        "series": {"101": {"rauh": [0.12, ...], "happiness": [...], "valenz": [...]}}
+      }
+    With Accept: application/x-ndjson or text/csv (preferred over
+    application/json), the same rows are streamed one per line from a
+    server-side cursor, ordered by region and then date; this takes
+    precedence over format.
     """
     start, end, err, code = _parse_dates()
+    if err:
+        return err, code
+    resolution, points, err, code = _parse_downsampling()
+    if err:
+        return err, code
+    fmt, err, code = _parse_format()
     if err:
         return err, code
 
@@ -54,6 +120,115 @@ def regional_trends():
     except ValueError:
         return jsonify({"error": "Invalid region IDs. Must be integers."}), 400
 
+    stream_type = requested_stream_type()
+    if stream_type:
+        rows = downsample_groups(_stream_regional_trends(region_ids, resolution, start, end),
+                                 list(TREND_METRICS), points, "region_id")
+        return stream_rows(rows, ["date", "region_id", "region_name", *TREND_METRICS],
+                           stream_type)
+
+    cube = cube_store.get()
+    if fmt == 'columnar' and cube is not None and resolution == 'day' and points is None:
+        return _cube_columnar_trends(cube, region_ids, start, end)
+    if resolution != 'day':
+        result = _rollup_regional_trends(region_ids, resolution, start, end)
+    elif cube is not None:
+        result = _cube_regional_trends(cube, region_ids, start, end)
+    else:
+        result = _query_regional_trends(region_ids, start, end)
+    result = downsample(result, list(TREND_METRICS), points=points,
+                        group_key="region_id")
+
+    if fmt == 'columnar':
+        dates, series = columns_from_rows(result, list(TREND_METRICS), "region_id")
+        return columnar_response({
+            "dates": dates,
+            "regions": {row["region_id"]: row["region_name"] for row in result},
+            "series": series,
+        })
+    return jsonify(result), 200
+
+
+def _stream_regional_trends(region_ids, resolution, start, end):
+    """Yields regional_trends rows ordered by region, then date."""
+    if resolution != 'day':
+        rows = _rollup_regional_trends(region_ids, resolution, start, end)
+        yield from sorted(rows, key=lambda row: row["region_id"])
+        return
+
+    names = dict(
+        db.session.query(Regions.region_id, Regions.region_name)
+        .filter(Regions.region_id.in_(region_ids))
+        .all()
+    )
+    stmt = (
+        select(RegionalData.region_id, RegionalData.item_date_published,
+               *(getattr(RegionalData, c) for c in TREND_METRICS.values()))
+        .where(
+            RegionalData.item_date_published.between(start, end),
+            RegionalData.region_id.in_(region_ids)
+        )
+        .order_by(RegionalData.region_id, RegionalData.item_date_published)
+        .execution_options(yield_per=stream_batch_size())
+    )
+    for region_id, published, *values in db.session.connection().execute(stmt):
+        row = {"date": published.date().isoformat(), "region_id": region_id,
+               "region_name": names.get(region_id)}
+        row.update(zip(TREND_METRICS, values))
+        yield row
+
+
+def _cube_columnar_trends(cube, region_ids, start, end):
+    """Columnar regional_trends response built from cube arrays."""
+    ids, dates, values = cube.block(sorted(set(region_ids)),
+                                    list(TREND_METRICS.values()), start, end)
+    return columnar_response({
+        "dates": dates,
+        "regions": {rid: cube.region_names[rid] for rid in ids},
+        "series": {
+            rid: {key: values[metric][i] for key, metric in TREND_METRICS.items()}
+            for i, rid in enumerate(ids)
+        },
+    })
+
+
+def _rollup_regional_trends(region_ids, period, start, end) -> list:
+    """regional_trends rows read from the week/month/year rollups."""
+    rows = rollup_series(RegionalData, sorted(set(region_ids)), TREND_METRICS,
+                         period, start, end)
+    names = dict(
+        db.session.query(Regions.region_id, Regions.region_name)
+        .filter(Regions.region_id.in_(region_ids))
+        .all()
+    )
+    return [{
+        "date":        r["date"],
+        "region_id":   r["region_id"],
+        "region_name": names.get(r["region_id"]),
+        **{key: r[key] for key in TREND_METRICS},
+    } for r in rows]
+
+
+def _cube_regional_trends(cube, region_ids, start, end) -> list:
+    """regional_trends rows sliced from the time-series cube, by date."""
+    series = []
+    for rid in sorted(set(region_ids)):
+        if rid not in cube.region_names:
+            continue
+        dates, columns = cube.series(rid, list(TREND_METRICS.values()), start, end)
+        for i, date_str in enumerate(dates):
+            row = {"date": date_str, "region_id": rid,
+                   "region_name": cube.region_names[rid]}
+            for key, metric in TREND_METRICS.items():
+                row[key] = columns[metric][i]
+            series.append(row)
+    # Stable sort keeps regions in id order within a day
+    series.sort(key=lambda row: row["date"])
+    return series
+
+
+def _query_regional_trends(region_ids, start, end) -> list:
+    """SQL fallback of regional_trends when the time-series cube is disabled."""
     rows = (
         db.session.query(
             func.date(RegionalData.item_date_published).label('date'),
@@ -68,7 +243,9 @@ def regional_trends():
             RegionalData.item_date_published.between(start, end),
             RegionalData.region_id.in_(region_ids)
         )
-        .order_by(RegionalData.item_date_published)
+        # Region-major order comes straight off ux_regional_data_region_date;
+        # the date-major response order is restored below without a SQL sort
+        .order_by(RegionalData.region_id, RegionalData.item_date_published)
         .all()
     )
 
@@ -83,17 +260,20 @@ def regional_trends():
             "happiness":   float(r.happiness),
             "valenz":      float(r.valenz),
         })
-
-    return jsonify(result), 200
+    # Stable merge of the per-region runs keeps regions in id order within a day
+    result.sort(key=lambda row: row["date"])
+    return result
 
 
 @bp.route('/global', methods=['GET'])
+@response_cache.cached(list_params=("countries",), defaults=DATE_DEFAULTS)
 def global_trends():
     """
     GET /trends/global
       • countries (required): comma-separated country names, e.g. countries=Schweiz,Österreich
       • metric       (optional): one of sentiment, happiness, valenz (defaults to sentiment)
       • from, to     (optional, YYYY-MM-DD)
+      • resolution, points, format (optional): as for /trends/regional
     Returns a list of daily values for each country:
       [
         {
@@ -102,8 +282,18 @@ def global_trends():
           "<metric>": 0.07
         },
       ]
+    With format=columnar:
+      { "dates": [...], "series": {"Schweiz": {"<metric>": [0.07, ...]}} }
+    Streamed as NDJSON or CSV like /trends/regional, ordered by country
+    and then date.
     """
     start, end, err, code = _parse_dates()
+    if err:
+        return err, code
+    resolution, points, err, code = _parse_downsampling()
+    if err:
+        return err, code
+    fmt, err, code = _parse_format()
     if err:
         return err, code
 
@@ -114,11 +304,23 @@ def global_trends():
 
     metric = request.args.get('metric', 'sentiment')
     col_map = {
-        'sentiment': GlobalStats.av_sents.label('value'),
+        'sentiment': GlobalStats.av_sents,
     }
     if metric not in col_map:
         return jsonify({"error": f"Invalid metric '{metric}'. Must be one of: {', '.join(col_map.keys())}."}), 400
-    value_col = col_map[metric]
+
+    stream_type = requested_stream_type()
+    if stream_type:
+        rows = _stream_global_trends(countries, col_map[metric], metric, resolution, start, end)
+        return stream_rows(downsample_groups(rows, [metric], points, "country"),
+                           ["date", "country", metric], stream_type)
+
+    if resolution != 'day':
+        result = rollup_series(GlobalStats, sorted(set(countries)),
+                               {metric: col_map[metric].key}, resolution, start, end)
+        result = downsample(result, [metric], points=points, group_key="country")
+        return _global_response(result, metric, fmt)
+    value_col = col_map[metric].label('value')
 
     rows = (
         db.session.query(
@@ -130,7 +332,9 @@ def global_trends():
             GlobalStats.item_date_published.between(start, end),
             GlobalStats.country.in_(countries)
         )
-        .order_by(GlobalStats.item_date_published, GlobalStats.country)
+        # Country-major order comes straight off ux_global_stats_country_date;
+        # the (date, country) response order is restored below
+        .order_by(GlobalStats.country, GlobalStats.item_date_published)
         .all()
     )
 
@@ -142,11 +346,42 @@ def global_trends():
             "country": r.country,
             metric:    float(r.value)
         })
+    result.sort(key=lambda row: row["date"])
+    result = downsample(result, [metric], points=points, group_key="country")
 
-    return jsonify(result), 200
+    return _global_response(result, metric, fmt)
+
+
+def _stream_global_trends(countries, column, metric, resolution, start, end):
+    """Yields global_trends rows ordered by country, then date."""
+    if resolution != 'day':
+        rows = rollup_series(GlobalStats, sorted(set(countries)), {metric: column.key},
+                             resolution, start, end)
+        yield from sorted(rows, key=lambda row: row["country"])
+        return
+
+    stmt = (
+        select(GlobalStats.country, GlobalStats.item_date_published, column)
+        .where(
+            GlobalStats.item_date_published.between(start, end),
+            GlobalStats.country.in_(countries)
+        )
+        .order_by(GlobalStats.country, GlobalStats.item_date_published)
+        .execution_options(yield_per=stream_batch_size())
+    )
+    for country, published, value in db.session.connection().execute(stmt):
+        yield {"date": published.date().isoformat(), "country": country, metric: value}
+
+
+def _global_response(rows, metric, fmt):
+    if fmt == 'columnar':
+        dates, series = columns_from_rows(rows, [metric], "country")
+        return columnar_response({"dates": dates, "series": series})
+    return jsonify(rows), 200
 
 
 @bp.route('/regions', methods=['GET'])
+@response_cache.cached()
 def list_regions():
     """
     GET /trends/regions
@@ -0,0 +1,55 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+
+_executor = None
+_executor_lock = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    """Pool shared by all requests of this process, created on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=current_app.config.get("BOOTSTRAP_WORKERS", 4),
+                    thread_name_prefix="bootstrap",
+                )
+    return _executor
+
+
+def render_view(app, path: str, query: dict) -> tuple:
+    """
+    Runs the GET view of ``path`` in a request context of its own.
+
+    The context brings its own app context and thus its own database
+    session, which is removed when it is popped. Only the view runs (no
+    before/after_request hooks), so its decorators such as the response
+    cache apply exactly as for a direct request.
+
+    Returns:
+        tuple: (status code, JSON body bytes)
+    """
+    with app.test_request_context(path, query_string=query,
+                                  headers={"Accept": "application/json"}):
+        response = app.make_response(app.dispatch_request())
+        return response.status_code, response.get_data()
+
+
+def render_views(parts: dict) -> dict:
+    """
+    Renders several GET views concurrently on the bootstrap pool.
+
+    Args:
+        parts (dict): name -> (path, query parameters)
+
+    Returns:
+        dict: name -> (status code, JSON body bytes), in the order of parts
+    """
+    app = current_app._get_current_object()
+    futures = {
+        name: _get_executor().submit(render_view, app, path, query)
+        for name, (path, query) in parts.items()
+    }
+    return {name: future.result() for name, future in futures.items()}
@@ -0,0 +1,89 @@
+import io
+from contextlib import contextmanager
+import pandas as pd
+from sqlalchemy import inspect, text
+from app import db
+
+# SQLAlchemy's storage format of DateTime columns on SQLite; bulk rows must
+# match it exactly because SQLite compares the stored strings
+SQLITE_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S.%f"
+
+
+def bulk_insert(table, df: pd.DataFrame):
+    """
+    Appends a DataFrame to a table with the fastest path of the dialect.
+
+    SQLite gets one prepared INSERT executed over plain tuples,
+    PostgreSQL a COPY FROM STDIN of an in-memory CSV buffer; any other
+    dialect falls back to a Core executemany. Runs on the session's
+    connection, inside its transaction; the caller commits.
+
+    Columns are the DataFrame's columns, which must exist in ``table``.
+    """
+    if df.empty:
+        return
+    conn = db.session.connection()
+    dialect = conn.dialect.name
+    if dialect == "sqlite":
+        _sqlite_insert(conn, table, df)
+    elif dialect == "postgresql":
+        _postgres_copy(conn, table, df)
+    else:
+        conn.execute(table.insert(), df.to_dict(orient="records"))
+
+
+@contextmanager
+def dropped_indexes(table):
+    """
+    Drops the secondary indexes of ``table`` for the duration of a load and
+    rebuilds them afterwards, which is cheaper than maintaining them for
+    every inserted row. Only for tables no reader depends on meanwhile,
+    e.g. inside the loading transaction.
+    """
+    conn = db.session.connection()
+    existing = {ix["name"] for ix in inspect(conn).get_indexes(table.name)}
+    indexes = [ix for ix in table.indexes if ix.name in existing]
+    for index in indexes:
+        conn.execute(text(f'DROP INDEX "{index.name}"'))
+    yield
+    for index in indexes:
+        index.create(conn)
+
+
+def _sqlite_insert(conn, table, df: pd.DataFrame):
+    columns = list(df.columns)
+    values = []
+    for name in columns:
+        col = df[name]
+        if pd.api.types.is_datetime64_any_dtype(col):
+            strings = col.dt.strftime(SQLITE_DATETIME_FORMAT)
+            values.append(strings.where(col.notna(), None).tolist())
+        else:
+            values.append(col.astype(object).where(col.notna(), None).tolist())
+
+    names = ", ".join(f'"{name}"' for name in columns)
+    placeholders = ", ".join("?" * len(columns))
+    conn.exec_driver_sql(
+        f'INSERT INTO "{table.name}" ({names}) VALUES ({placeholders})',
+        list(zip(*values)),
+    )
+
+
+def _postgres_copy(conn, table, df: pd.DataFrame):
+    buffer = io.StringIO()
+    # NULL is written as an unquoted \N, so empty strings stay strings
+    df.to_csv(buffer, index=False, header=False, na_rep="\\N",
+              date_format="%Y-%m-%d %H:%M:%S.%f")
+    names = ", ".join(f'"{name}"' for name in df.columns)
+    sql = f'COPY "{table.name}" ({names}) FROM STDIN WITH (FORMAT csv, NULL \'\\N\')'
+
+    cursor = conn.connection.driver_connection.cursor()
+    try:
+        if hasattr(cursor, "copy_expert"):  # psycopg2
+            buffer.seek(0)
+            cursor.copy_expert(sql, buffer)
+        else:  # psycopg 3
+            with cursor.copy(sql) as copy:
+                copy.write(buffer.getvalue())
+    finally:
+        cursor.close()
@@ -0,0 +1,41 @@
+import orjson
+from flask import Response
+
+# Values of the ``format`` query parameter of the series endpoints
+FORMATS = ("rows", "columnar")
+
+
+def columns_from_rows(rows: list, value_keys: list, group_key: str | None = None) -> tuple:
+    """
+    Pivots date-ordered response rows onto one shared date axis.
+
+    Returns:
+        tuple: (ISO dates, columns) where columns is {metric: list} if
+        ``group_key`` is None and {group: {metric: list}} otherwise; days
+        without a row for a series hold None.
+    """
+    dates = list(dict.fromkeys(row["date"] for row in rows))
+    index = {day: i for i, day in enumerate(dates)}
+    series = {}
+    for row in rows:
+        group = row[group_key] if group_key else None
+        columns = series.get(group)
+        if columns is None:
+            columns = series[group] = {key: [None] * len(dates) for key in value_keys}
+        i = index[row["date"]]
+        for key in value_keys:
+            columns[key][i] = row[key]
+    if group_key is None:
+        return dates, series.get(None, {key: [] for key in value_keys})
+    return dates, series
+
+
+def columnar_response(payload: dict, status: int = 200) -> Response:
+    """
+    Serializes a columnar payload with orjson.
+
+    NumPy arrays are written directly (float32 in its shortest form),
+    integer keys become strings and NaN becomes null.
+    """
+    body = orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return Response(body, status=status, mimetype="application/json")
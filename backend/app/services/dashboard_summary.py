@@ -0,0 +1,116 @@
+import threading
+from datetime import date, datetime
+from sqlalchemy import case, delete, func, insert, select
+from app import db
+from app.models.data_models import DailyCounter, DashboardSummary, GlobalStats
+from app.services.data_generation import current_generation
+
+# Primary key of the single DashboardSummary row
+SUMMARY_ID = 1
+
+
+def refresh_summary(since: datetime | None = None):
+    """
+    Brings the dashboard summary and daily counters up to date with
+    global_stats.
+
+    Ingestion (and any other job that writes global_stats) calls this in
+    the transaction that writes the data, so /api/status never sees one
+    without the other. The caller commits.
+
+    Args:
+        since (datetime | None): Earliest day that may have changed; the
+            counters of earlier days are kept. None recomputes all days.
+    """
+    db.session.flush()
+
+    stmt = delete(DailyCounter)
+    if since is not None:
+        since = datetime.combine(since.date(), datetime.min.time())
+        stmt = stmt.where(DailyCounter.day >= since)
+    db.session.execute(stmt)
+
+    weighted = case((GlobalStats.av_sents.is_not(None), GlobalStats.num_news), else_=0)
+    query = (
+        select(
+            GlobalStats.item_date_published,
+            func.coalesce(func.sum(GlobalStats.num_news), 0),
+            func.sum(GlobalStats.av_sents * weighted),
+            func.sum(weighted),
+            func.avg(GlobalStats.av_sents),
+        )
+        .group_by(GlobalStats.item_date_published)
+    )
+    if since is not None:
+        query = query.where(GlobalStats.item_date_published >= since)
+    counters = [{
+        "day": day,
+        "num_news": int(news),
+        # num_news-weighted over countries; plain mean on days without news
+        "av_sents": weighted_sum / weight if weight else mean,
+    } for day, news, weighted_sum, weight, mean in db.session.execute(query)]
+    if counters:
+        db.session.execute(insert(DailyCounter), counters)
+
+    summary = db.session.get(DashboardSummary, SUMMARY_ID)
+    if summary is None:
+        summary = DashboardSummary(id=SUMMARY_ID)
+        db.session.add(summary)
+    summary.total_news = db.session.query(
+        func.coalesce(func.sum(DailyCounter.num_news), 0)
+    ).scalar()
+
+    latest = (
+        db.session.query(GlobalStats)
+        .order_by(GlobalStats.item_date_published.desc())
+        .first()
+    )
+    summary.last_update = latest.item_date_published if latest else None
+    summary.channels_count = latest.num_feeds if latest else 0
+    summary.sources_count = latest.num_newspaper if latest else 0
+    db.session.flush()
+
+
+def read_status() -> dict | None:
+    """
+    The /api/status payload from the summary row and today's counter, or
+    None if no summary has been built yet.
+    """
+    summary = db.session.get(DashboardSummary, SUMMARY_ID)
+    if summary is None:
+        return None
+    today = db.session.get(DailyCounter, datetime.combine(date.today(), datetime.min.time()))
+    return {
+        "last_update":     summary.last_update.date().isoformat() if summary.last_update else None,
+        "total_news":      int(summary.total_news),
+        "channels_count":  summary.channels_count,
+        "sources_count":   summary.sources_count,
+        "news_today":      today.num_news if today else 0,
+        "sentiment_today": today.av_sents if today else None,
+    }
+
+
+class StatusCache:
+    """
+    Keeps the last status payload per database until the data generation
+    or the calendar day changes.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._key = None
+        self._payload = None
+
+    def get(self) -> dict | None:
+        key = (str(db.engine.url), current_generation(), date.today())
+        with self._lock:
+            if key == self._key:
+                return self._payload
+        payload = read_status()
+        if payload is not None:
+            with self._lock:
+                self._key, self._payload = key, payload
+        return payload
+
+
+status_cache = StatusCache()
@@ -0,0 +1,35 @@
+from app import db
+from app.models.data_models import DataGeneration
+
+# Primary key of the single DataGeneration row
+GENERATION_ID = 1
+
+
+def current_generation() -> int:
+    """
+    Returns the current data generation, 0 if no ingest has recorded one.
+
+    In-process caches of data derived from the database key on this value,
+    so they are invalidated across processes when an ingest commits.
+    """
+    row = db.session.get(DataGeneration, GENERATION_ID)
+    return row.generation if row else 0
+
+
+def bump_generation() -> int:
+    """
+    Increments the data generation in the current session.
+
+    The caller commits, so the bump becomes visible together with the data
+    it describes.
+
+    Returns:
+        int: The new generation.
+    """
+    row = db.session.get(DataGeneration, GENERATION_ID)
+    if row is None:
+        row = DataGeneration(id=GENERATION_ID, generation=0)
+        db.session.add(row)
+    row.generation += 1
+    db.session.flush()
+    return row.generation
@@ -1,10 +1,41 @@
 import os
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from datetime import timedelta
+from functools import partial
 import pandas as pd
+import pyarrow as pa
 from flask import current_app
-from app import db
-from sqlalchemy import delete
-from app.models.data_models import Regions, RegionalData, GlobalStats
-from app.services.pipeline.data_readers import read_region_names, read_regional_news, read_global_stats
+from app import db, response_cache
+from sqlalchemy import func, or_
+from sqlalchemy.dialects import postgresql, sqlite
+from app.models.data_models import (
+    GlobalRollup,
+    GlobalStats,
+    IngestWatermark,
+    RegionalData,
+    RegionalRollup,
+    Regions,
+)
+from app.services.bulk_load import bulk_insert
+from app.services.dashboard_summary import refresh_summary
+from app.services.data_generation import bump_generation
+from app.services.geojson import build_regions_geojson
+from app.services.rollups import rebuild_rollups
+from app.services.shadow_tables import (
+    build_shadow_indexes,
+    create_shadow_tables,
+    normalize_indexes,
+    swap_shadow_tables,
+)
+from app.services.pipeline import raw_cache
+from app.services.pipeline.data_readers import (
+    line_ranges,
+    read_range,
+    read_region_names,
+    read_regional_news,
+    read_global_stats,
+)
 from app.services.pipeline.data_cleaning import clean_global_stats_df
 from app.services.pipeline.data_validation import (
     validate_global_stats,
@@ -12,17 +43,140 @@ from app.services.pipeline.data_validation import (
     validate_regional_data,
 )
 
+REGION_COLUMNS = ["region_id", "region_name", "country"]
+
+REGIONAL_COLUMNS = [
+    "region_id",
+    "item_date_published",
+    "num_words",
+    "rauh_sents_share",
+    "rauh_sents_av",
+    "happiness_share",
+    "happiness_av",
+    "val_share",
+    "val_av",
+    "num_papers",
+    "num_news",
+]
+
+GLOBAL_COLUMNS = [
+    "country",
+    "item_date_published",
+    "num_newspaper",
+    "num_feeds",
+    "av_sents",
+    "num_news",
+]
+
+
+# Natural key of each table, used as the upsert conflict target
+NATURAL_KEYS = {
+    Regions: ["region_id"],
+    RegionalData: ["region_id", "item_date_published"],
+    GlobalStats: ["country", "item_date_published"],
+}
+
+# Reloaded tables, parents first; the rollups are derived from the daily
+# tables and swapped in with them
+MODELS = [Regions, RegionalData, GlobalStats, RegionalRollup, GlobalRollup]
+
+
+def ingest(data_folder: str, chunksize: int | None = None,
+           incremental: bool = False, workers: int | None = None):
+    """
+    Reloads regions, regional data and global stats from ``data_folder``.
+
+    A full reload is written to shadow tables, indexed, and swapped in with
+    a single transaction of table renames, so the API keeps serving the
+    previous data until the new data is complete. The week, month and year
+    rollups are rebuilt from the loaded daily rows.
+
+    Reading, cleaning and validation run in a pool of worker processes,
+    one job per file or chunk; this process only writes the prepared
+    frames, in file order and regions first for the foreign keys.
+
+    Args:
+        data_folder (str): Folder with region_names.xlsx, Regional_news.csv
+            and global.stats.csv.
+        chunksize (int | None): Rows per chunk for the two CSV files.
+            Each chunk is cleaned, validated and inserted on its own and
+            committed, so memory stays flat regardless of file size.
+            Defaults to ``INGEST_CHUNKSIZE``; 0 loads each file at once.
+        incremental (bool): Keep existing rows and upsert instead of
+            truncating. Rows dated before the table's high-watermark minus
+            ``INGEST_LOOKBACK_DAYS`` are skipped; rows inside that window
+            only overwrite stored rows whose values differ.
+        workers (int | None): Worker processes. Defaults to
+            ``INGEST_WORKERS``, or one per CPU; 1 prepares everything in
+            this process.
+
+    With ``INGEST_CACHE`` the typed columns of each source file are also
+    saved as Parquet, keyed by the file's content hash; loading unchanged
+    files again reads those instead of parsing CSV and Excel.
+    """
+    if chunksize is None:
+        chunksize = current_app.config.get("INGEST_CHUNKSIZE")
+    if workers is None:
+        workers = current_app.config.get("INGEST_WORKERS") or os.cpu_count() or 1
 
-def ingest(data_folder: str):
-    # Clear existing data 
-    db.session.execute(delete(RegionalData))
-    db.session.execute(delete(GlobalStats))
-    db.session.execute(delete(Regions))
+    if incremental:
+        write_rows = _upsert_rows
+        target = {model: model.__table__ for model in MODELS}
+    else:
+        write_rows = _insert_rows
+        target = create_shadow_tables(MODELS)
+
+    regional_since = _load_since(RegionalData) if incremental else None
+    global_since = _load_since(GlobalStats) if incremental else None
+    staged = []
+    jobs = _source_jobs(data_folder, chunksize, regional_since, global_since,
+                        _raw_cache_dir(), staged)
+
+    # At most two jobs per worker are prepared ahead of the writes, which
+    # bounds the frames held in memory
+    try:
+        with _executor(workers) as pool:
+            for model, df in _ordered_results(pool, jobs, window=2 * workers):
+                write_rows(target[model], df)
+                db.session.commit()
+    except BaseException:
+        for staging, _, _ in staged:
+            raw_cache.discard(staging)
+        raise
+    for staging, entry, count in staged:
+        raw_cache.commit(staging, entry, count)
+
+    # Week/month/year rollups; an incremental load only recomputes the
+    # periods its rows can fall into
+    if regional_since is not None and global_since is not None:
+        rebuild_rollups(since=min(regional_since, global_since))
+    else:
+        rebuild_rollups(target)
+
+    if not incremental:
+        build_shadow_indexes(target)
+        swap_shadow_tables(target)
+
+    _update_watermark(RegionalData)
+    _update_watermark(GlobalStats)
+    refresh_summary(since=global_since)
+    bump_generation()
     db.session.commit()
+    # Entries of older generations are unreachable anyway; this frees them,
+    # including those other workers put into a shared backend
+    response_cache.clear()
+
+    if not incremental:
+        normalize_indexes(MODELS)
+
+    # Materialize the regions-with-sentiment GeoJSON for the map endpoint
+    build_regions_geojson()
 
-    # Ingest Regions 
-    regions_fp = os.path.join(data_folder, "region_names.xlsx")
-    df_regions = read_region_names(regions_fp)
+    print("Data ingestion complete.")
+
+
+def prepare_regions(df_regions: pd.DataFrame) -> pd.DataFrame:
+    """Renames, coerces and validates the raw region names sheet."""
     df_regions = df_regions.rename(columns={
         "Region": "region_id",
         "ROR.NAME": "region_name",
@@ -34,27 +188,19 @@ def ingest(data_folder: str):
     df_regions["region_id"] = df_regions["region_id"].astype(int)
     df_regions["region_name"] = df_regions["region_name"].str.strip()
     df_regions["country"] = df_regions["country"].str.strip()
-    df_regions = validate_region_names(df_regions)
-
-    db.session.bulk_insert_mappings(
-        Regions,
-        df_regions[["region_id", "region_name", "country"]]
-            .drop_duplicates()
-            .to_dict(orient="records")
-    )
-    db.session.commit()
+    return validate_region_names(df_regions)
 
-    # 3) Ingest Regional Data 
-    regional_fp = os.path.join(data_folder, "Regional_news.csv")
-    df_regional = read_regional_news(regional_fp)
-    for col in [
+
+def prepare_regional_data(df_regional: pd.DataFrame) -> pd.DataFrame:
+    """Renames, coerces and validates a (chunk of) Regional_news.csv."""
+    # The reader already typed the columns; missing values count as 0
+    values = [
         "num_words", "rauh_sents_share", "rauh_sents_av",
         "Happiness_share", "Happiness_av",
         "Val_share", "Val_av",
         "num_papers", "num_news"
-    ]:
-        df_regional[col] = pd.to_numeric(df_regional[col], errors="coerce"
-                                         ).fillna(0)
+    ]
+    df_regional[values] = df_regional[values].fillna(0)
 
     df_regional = df_regional.rename(columns={
         "Region": "region_id",
@@ -63,31 +209,13 @@ def ingest(data_folder: str):
         "Val_share":       "val_share",
         "Val_av":          "val_av",
     })
-    df_regional["region_id"] = pd.to_numeric(df_regional["region_id"],
-                                             errors="coerce")
     df_regional = df_regional.dropna(subset=["region_id"])
     df_regional["region_id"] = df_regional["region_id"].astype(int)
-    df_regional = validate_regional_data(df_regional)
-
-    regional_records = df_regional[[
-        "region_id",
-        "item_date_published",
-        "num_words",
-        "rauh_sents_share",
-        "rauh_sents_av",
-        "happiness_share",
-        "happiness_av",
-        "val_share",
-        "val_av",
-        "num_papers",
-        "num_news",
-    ]].to_dict(orient="records")
-    db.session.bulk_insert_mappings(RegionalData, regional_records)
-    db.session.commit()
+    return validate_regional_data(df_regional)
+
 
-    # Ingest Global Stats 
-    global_fp = os.path.join(data_folder, "global.stats.csv")
-    df_global = read_global_stats(global_fp)
+def prepare_global_stats(df_global: pd.DataFrame) -> pd.DataFrame:
+    """Renames, cleans and validates a (chunk of) global.stats.csv."""
     df_global = df_global.rename(columns={
         "Country":       "country",
         "num.newspaper": "num_newspaper",
@@ -96,17 +224,182 @@ def ingest(data_folder: str):
         "num.news":      "num_news",
     })
     df_global = clean_global_stats_df(df_global)
-    df_global = validate_global_stats(df_global)
-
-    global_records = df_global[[
-        "country",
-        "item_date_published",
-        "num_newspaper",
-        "num_feeds",
-        "av_sents",
-        "num_news",
-    ]].to_dict(orient="records")
-    db.session.bulk_insert_mappings(GlobalStats, global_records)
-    db.session.commit()
+    return validate_global_stats(df_global)
 
-    print("Data ingestion complete.")
+
+def _source_jobs(data_folder: str, chunksize: int | None, regional_since,
+                 global_since, cache_dir: str | None, staged: list) -> list:
+    """
+    The (model, function, args) jobs preparing the source files, in the
+    order their rows must be written: regions first, as the other tables
+    reference them, then the chunks of each CSV file.
+
+    Files found in the raw cache are read from their Parquet parts, which
+    keep the chunking of the load that wrote them. The others are parsed,
+    and their parts written to a staging directory appended to ``staged``
+    as (staging, entry, number of parts), for the caller to commit once
+    all is loaded.
+    """
+    sources = [
+        (Regions, read_region_names, prepare_regions, REGION_COLUMNS,
+         "region_names.xlsx", None),
+        (RegionalData, read_regional_news, prepare_regional_data,
+         REGIONAL_COLUMNS, "Regional_news.csv", regional_since),
+        (GlobalStats, read_global_stats, prepare_global_stats,
+         GLOBAL_COLUMNS, "global.stats.csv", global_since),
+    ]
+    jobs = []
+    for model, reader, prepare, columns, name, since in sources:
+        path = os.path.join(data_folder, name)
+        if model is Regions:
+            reads = [partial(reader, path)]
+        else:
+            reads = [partial(read_range, reader, path, start, end)
+                     for start, end in line_ranges(path, chunksize)]
+        parts = [None] * len(reads)
+
+        if cache_dir is not None:
+            entry = raw_cache.entry_path(cache_dir, path, reader)
+            cached = raw_cache.cached_parts(entry)
+            if cached is not None:
+                reads = [partial(raw_cache.read_part, part) for part in cached]
+                parts = [None] * len(reads)
+            else:
+                staging = raw_cache.staging_path(entry)
+                staged.append((staging, entry, len(reads)))
+                parts = [raw_cache.part_path(staging, i) for i in range(len(reads))]
+
+        jobs.extend((model, _load_chunk, (read, prepare, columns, since, part))
+                    for read, part in zip(reads, parts))
+    return jobs
+
+
+def _load_chunk(read, prepare, columns: list, since,
+                cache_part: str | None) -> pd.DataFrame:
+    """
+    Reads, cleans and validates one file or chunk; with ``cache_part`` the
+    raw typed frame is saved there as well. A frame Parquet cannot hold
+    (e.g. mixed-type Excel cells) is only loaded, not cached.
+    """
+    df = read()
+    if cache_part is not None:
+        try:
+            raw_cache.write_part(df, cache_part)
+        except pa.ArrowException:
+            pass
+    df = prepare(df)[columns]
+    if since is not None:
+        df = df[df["item_date_published"] >= since]
+    return df
+
+
+def _raw_cache_dir() -> str | None:
+    """Directory of the raw input cache, or None if it is disabled."""
+    if not current_app.config.get("INGEST_CACHE", True):
+        return None
+    cache_dir = (current_app.config.get("INGEST_CACHE_DIR")
+                 or os.path.join(current_app.instance_path, "ingest_cache"))
+    os.makedirs(cache_dir, exist_ok=True)
+    return cache_dir
+
+
+def _ordered_results(pool: Executor, jobs, window: int):
+    """
+    Submits ``jobs`` with at most ``window`` of them in flight and yields
+    their (model, result) in submission order. A job's exception is
+    raised when its turn comes.
+    """
+    pending = deque()
+    for model, fn, args in jobs:
+        pending.append((model, pool.submit(fn, *args)))
+        if len(pending) >= window:
+            model, future = pending.popleft()
+            yield model, future.result()
+    while pending:
+        model, future = pending.popleft()
+        yield model, future.result()
+
+
+def _executor(workers: int) -> Executor:
+    """
+    Process pool of ``workers`` processes, or an executor running jobs
+    in this process for a single worker. The jobs never use the database,
+    so the forked workers leave the inherited connections alone.
+    """
+    if workers <= 1:
+        return _InlineExecutor()
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+class _InlineExecutor(Executor):
+    """Executor that runs each job right away, in the calling process."""
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+
+def _insert_rows(table, df: pd.DataFrame):
+    """
+    Bulk-loads a DataFrame in batches of ``INGEST_BATCH_SIZE`` rows, so
+    only one batch of row tuples (or COPY buffer) exists at a time.
+    """
+    batch_size = current_app.config.get("INGEST_BATCH_SIZE", 10000)
+    for start in range(0, len(df), batch_size):
+        bulk_insert(table, df.iloc[start:start + batch_size])
+
+
+def _upsert_rows(table, df: pd.DataFrame):
+    """
+    Inserts new rows and updates stored rows whose values changed, keyed on
+    the table's natural key. Unchanged rows are left untouched.
+    """
+    keys = next(keys for model, keys in NATURAL_KEYS.items()
+                if model.__table__ is table)
+    dialect = db.session.get_bind().dialect.name
+    if dialect == "postgresql":
+        base = postgresql.insert(table)
+    elif dialect == "sqlite":
+        base = sqlite.insert(table)
+    else:
+        raise NotImplementedError(f"Incremental ingestion is not supported on {dialect}")
+
+    values = [c for c in df.columns if c not in keys]
+    if values:
+        stmt = base.on_conflict_do_update(
+            index_elements=keys,
+            set_={c: base.excluded[c] for c in values},
+            where=or_(*(table.c[c].is_distinct_from(base.excluded[c]) for c in values)),
+        )
+    else:
+        stmt = base.on_conflict_do_nothing(index_elements=keys)
+
+    batch_size = current_app.config.get("INGEST_BATCH_SIZE", 10000)
+    for start in range(0, len(df), batch_size):
+        records = df.iloc[start:start + batch_size].to_dict(orient="records")
+        db.session.execute(stmt, records)
+
+
+def _load_since(model):
+    """
+    Earliest date an incremental load looks at: the stored high-watermark
+    minus INGEST_LOOKBACK_DAYS, or None to load everything.
+    """
+    mark = db.session.get(IngestWatermark, model.__tablename__)
+    if mark is None or mark.high_watermark is None:
+        return None
+    lookback = current_app.config.get("INGEST_LOOKBACK_DAYS", 7)
+    return mark.high_watermark.replace(tzinfo=None) - timedelta(days=lookback)
+
+
+def _update_watermark(model):
+    latest = db.session.query(func.max(model.item_date_published)).scalar()
+    mark = db.session.get(IngestWatermark, model.__tablename__)
+    if mark is None:
+        mark = IngestWatermark(table_name=model.__tablename__)
+        db.session.add(mark)
+    mark.high_watermark = latest
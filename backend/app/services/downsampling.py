@@ -0,0 +1,151 @@
+import numpy as np
+
+RESOLUTIONS = ("day", "week", "month", "year")
+
+
+def parse_downsampling(resolution: str | None, points: str | None) -> tuple:
+    """
+    Validates the ``resolution`` and ``points`` query parameters.
+
+    Returns:
+        tuple: (resolution, points) with points None when not requested.
+
+    Raises:
+        ValueError: With a message suitable for the API response.
+    """
+    resolution = resolution or "day"
+    if resolution not in RESOLUTIONS:
+        raise ValueError(f"Invalid resolution. Must be one of: {', '.join(RESOLUTIONS)}.")
+    if points is None:
+        return resolution, None
+    try:
+        points = int(points)
+    except ValueError:
+        raise ValueError("Invalid points. Must be an integer.") from None
+    if points < 3:
+        raise ValueError("Invalid points. Must be at least 3.")
+    return resolution, points
+
+
+def downsample(rows: list, value_keys: list, resolution: str = "day",
+               points: int | None = None, group_key: str | None = None) -> list:
+    """
+    Aggregates and/or thins date-ordered response rows per series.
+
+    Rows are dicts with an ISO ``date`` and the numeric ``value_keys``;
+    every other key is treated as a label of the series and copied from
+    its first row. Each series (rows sharing ``group_key``, or all rows if
+    None) is first averaged per week (starting Monday), calendar month or
+    year, dated by the period start, and then reduced to at most ``points`` rows
+    with Largest-Triangle-Three-Buckets.
+
+    Returns:
+        list: The reduced rows, ordered by date and, within a date, by
+        first appearance of their series.
+    """
+    if resolution == "day" and points is None:
+        return rows
+
+    series = {}
+    for row in rows:
+        series.setdefault(row[group_key] if group_key else None, []).append(row)
+
+    result = []
+    for order, group in enumerate(series.values()):
+        labels = {k: v for k, v in group[0].items()
+                  if k != "date" and k not in value_keys}
+        dates = np.array([r["date"] for r in group], dtype="datetime64[D]")
+        values = np.array(
+            [[np.nan if r[k] is None else r[k] for k in value_keys] for r in group],
+            dtype=np.float64
+        ).reshape(len(group), len(value_keys))
+
+        if resolution != "day":
+            dates, values = aggregate(dates, values, resolution)
+        if points is not None and len(dates) > points:
+            keep = lttb(dates.astype(np.float64), values, points)
+            dates, values = dates[keep], values[keep]
+
+        for day, vals in zip(np.datetime_as_string(dates).tolist(), values.tolist()):
+            entry = {"date": day, **labels}
+            for key, val in zip(value_keys, vals):
+                entry[key] = None if val != val else val
+            result.append((day, order, entry))
+
+    result.sort(key=lambda item: item[:2])
+    return [entry for _, _, entry in result]
+
+
+def period_start(dates: np.ndarray, resolution: str) -> np.ndarray:
+    """First day of the week (Monday), month or year containing each date."""
+    if resolution == "week":
+        # 1970-01-01 was a Thursday
+        weekday = (dates.astype(np.int64) + 3) % 7
+        return dates - weekday.astype("timedelta64[D]")
+    if resolution == "month":
+        return dates.astype("datetime64[M]").astype("datetime64[D]")
+    if resolution == "year":
+        return dates.astype("datetime64[Y]").astype("datetime64[D]")
+    return dates
+
+
+def aggregate(dates: np.ndarray, values: np.ndarray, resolution: str) -> tuple:
+    """
+    Averages the rows of ``values`` per period, ignoring NaN.
+
+    Returns:
+        tuple: (period start dates, per-period means); periods without any
+        value in a column get NaN.
+    """
+    periods, inverse = np.unique(period_start(dates, resolution), return_inverse=True)
+    present = ~np.isnan(values)
+    sums = np.zeros((len(periods), values.shape[1]))
+    counts = np.zeros((len(periods), values.shape[1]))
+    np.add.at(sums, inverse, np.where(present, values, 0.0))
+    np.add.at(counts, inverse, present)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return periods, sums / counts
+
+
+def lttb(x: np.ndarray, ys: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets point selection.
+
+    ``ys`` may hold several columns sharing the x axis; each is scaled to
+    [0, 1] and the triangle areas are summed, so the kept points follow
+    the shape of every column.
+
+    Returns:
+        np.ndarray: Sorted indices of the kept points, first and last
+        included.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    ys = ys.reshape(n, -1)
+    lo, hi = np.nanmin(ys, axis=0), np.nanmax(ys, axis=0)
+    span = np.where(hi > lo, hi - lo, 1.0)
+    ys = np.nan_to_num((ys - lo) / span, nan=0.0)
+    x = (x - x[0]) / ((x[-1] - x[0]) or 1.0)
+
+    # Bucket i spans [edges[i], edges[i + 1]); the last bucket is the
+    # final point alone
+    edges = np.arange(n_out - 1) * (n - 2) // (n_out - 2) + 1
+    edges = np.append(edges, n)
+    sizes = np.diff(edges)[:, None]
+    avg_x = np.add.reduceat(x, edges[:-1]) / sizes[:, 0]
+    avg_y = np.add.reduceat(ys, edges[:-1], axis=0) / sizes
+
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        areas = np.abs(
+            (x[a] - avg_x[i + 1]) * (ys[start:end] - ys[a])
+            - (x[a] - x[start:end, None]) * (avg_y[i + 1] - ys[a])
+        ).sum(axis=1)
+        a = start + int(np.argmax(areas))
+        keep[i + 1] = a
+    return keep
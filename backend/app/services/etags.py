@@ -0,0 +1,60 @@
+import hashlib
+from datetime import date
+from flask import Response, current_app, g, request
+
+
+class GenerationETags:
+    """
+    Strong ETags for GET endpoints derived from the data generation.
+
+    A response depends only on the data, the path, the query string and
+    the Accept header (plus "today" for defaulted date ranges), so the tag
+    is a hash of those. It is computed in a before_request hook and a matching
+    If-None-Match is answered with 304 before the view runs.
+    """
+
+    def init_app(self, app):
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+
+    @staticmethod
+    def exempt(view):
+        """Marks a view that sets its own validators."""
+        view._generation_etag_exempt = True
+        return view
+
+    @staticmethod
+    def etag_for(generation: int, path: str, args, accept: str = "") -> str:
+        """Tag of one request; query parameters are order-insensitive."""
+        params = sorted((k, v) for k in args for v in args.getlist(k))
+        key = repr((path, params, accept, date.today().isoformat()))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return f"g{generation}-{digest}"
+
+    def _before_request(self):
+        # Imported here: the models import the extension objects of app
+        from app.services.data_generation import current_generation
+
+        if request.method not in ("GET", "HEAD") or request.endpoint is None:
+            return None
+        view = current_app.view_functions.get(request.endpoint)
+        if getattr(view, "_generation_etag_exempt", False):
+            return None
+
+        g.generation_etag = self.etag_for(current_generation(), request.path, request.args,
+                                          request.headers.get("Accept", ""))
+        if request.if_none_match.contains(g.generation_etag):
+            response = Response(status=304)
+            response.set_etag(g.generation_etag)
+            response.cache_control.no_cache = True
+            return response
+        return None
+
+    @staticmethod
+    def _after_request(response):
+        etag = g.pop("generation_etag", None)
+        if etag and response.status_code == 200 and "ETag" not in response.headers:
+            response.set_etag(etag)
+            response.cache_control.no_cache = True
+            response.vary.add("Accept")
+        return response
@@ -1,15 +1,27 @@
 import os
-import geopandas as gpd
+import glob
+import json
+import hashlib
+import tempfile
+from datetime import datetime, timezone
 import pandas as pd
 from flask import current_app
-from sqlalchemy import func
-from app import db
-from app.models.data_models import RegionalData
+from sqlalchemy.orm import aliased
+from app import db, geometry_registry
+from app.models.data_models import RegionalData, Regions
 
 
-def generate_regions_geojson() -> str:
+# Output formats materialized per geometry level
+FORMATS = ("geojson", "topojson")
+
+# Number of builds whose content-addressed artifacts are kept on disk, so a
+# response that is still streaming an older file is not cut off by a rebuild
+KEEP_BUILDS = 3
+
+
+def generate_regions_geojson(level: int = 0) -> str:
     """
-    Generates a GeoJSON file that maps regions to their most recent sentiment
+    Generates GeoJSON that maps regions to their most recent sentiment
     data.
 
     Steps:
@@ -19,47 +31,35 @@ def generate_regions_geojson() -> str:
         shapefile.
     4. Query the latest sentiment values per region from the database.
     5. Merge the sentiment data into the shapefile's geometry data.
-    6. Save the result as GeoJSON and return it as a JSON string.
-    """
-
-    # Locate shapefile in the configured raw shapefile directory
-    shp_dir = current_app.config["RAW_SHP_DIR"]
-    shp_files = [f for f in os.listdir(shp_dir) if f.lower().endswith(".shp")]
-    if not shp_files:
-        raise FileNotFoundError(f"No .shp file found in {shp_dir}")
-    shp_path = os.path.join(shp_dir, shp_files[0])
+    6. Return the result as a GeoJSON string.
 
-    #  Read shapefile into a GeoDataFrame
-    gdf = gpd.read_file(shp_path)
-
-    #  Ensure GeoDataFrame is using WGS84 (EPSG:4326) for lat/lon compatibility
-    if gdf.crs is None:
-        raise ValueError("Shapefile has no coordinate reference system (CRS) defined.")
-    if gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    Args:
+        level (int): Geometry resolution level of the geometry registry,
+            0 being full resolution.
+    """
+    return _render_regions_geojson(_latest_sentiment(), level)
 
-    # 3) Extract 'region_id' from the 'ROR1217' column
-    if "ROR1217" not in gdf.columns:
-        raise KeyError(f"Expected 'ROR1217' column in shapefile, found: {gdf.columns.tolist()}")
-    gdf["region_id"] = pd.to_numeric(gdf["ROR1217"], errors="coerce").astype("Int64")
 
+def _latest_sentiment() -> pd.DataFrame:
     # 4) Query the most recent sentiment records per region from the database
-    subq = (
-        db.session.query(
-            RegionalData.region_id,
-            func.max(RegionalData.item_date_published).label("latest_ts")
-        )
-        .group_by(RegionalData.region_id)
-        .subquery()
+    # Latest row id per region: one ordered index seek on
+    # ux_regional_data_region_date per region instead of a group-by
+    # over the whole table
+    latest = aliased(RegionalData)
+    latest_id = (
+        db.session.query(latest.id)
+        .filter(latest.region_id == Regions.region_id)
+        .order_by(latest.item_date_published.desc())
+        .limit(1)
+        .correlate(Regions)
+        .scalar_subquery()
     )
 
     latest_rows = (
         db.session.query(RegionalData)
-          .join(
-              subq,
-              (RegionalData.region_id == subq.c.region_id) &
-              (RegionalData.item_date_published == subq.c.latest_ts)
-          )
+        .filter(RegionalData.id.in_(
+            db.session.query(latest_id).select_from(Regions)
+        ))
         .all()
     )
 
@@ -69,15 +69,138 @@ def generate_regions_geojson() -> str:
         "rauh_sents_av": row.rauh_sents_av,
         "happiness_av": row.happiness_av,
         "val_av": row.val_av
-    } for row in latest_rows]).set_index("region_id")
+    } for row in latest_rows], columns=[
+        "region_id", "rauh_sents_av", "happiness_av", "val_av"
+    ]).set_index("region_id")
+    return df
+
+
+def _render_regions_geojson(df: pd.DataFrame, level: int) -> str:
+    # 1-3) Region boundaries in WGS84 with 'region_id', parsed once per
+    # process by the geometry registry, at the requested resolution
+    gdf = geometry_registry.frame.copy()
+    gdf = gdf.set_geometry(geometry_registry.level_geometries(level))
 
     # 5) Merge the sentiment data into the GeoDataFrame by region_id
     gdf = gdf.merge(df, on="region_id", how="left")
 
-    # 6) Write the final GeoDataFrame as GeoJSON to disk and return the content
-    out_path = current_app.config["PROCESSED_GEOJSON"]
-    os.makedirs(os.path.dirname(out_path), exist_ok=True)
-    print("DEBUG: Writing GeoJSON to:", out_path)
-    gdf.to_file(out_path, driver="GeoJSON")
-
+    # 6) Return the content; build_regions_geojson() persists it
     return gdf.to_json()
+
+
+def _render_regions_topojson(df: pd.DataFrame, level: int) -> str:
+    # Same properties as the GeoJSON, attached to the registry's cached
+    # TopoJSON arcs instead of full geometry
+    gdf = geometry_registry.frame.drop(columns="geometry")
+    gdf = gdf.merge(df, on="region_id", how="left")
+    records = json.loads(gdf.to_json(orient="records"))
+    properties = {int(rec["region_id"]): rec for rec in records}
+    return geometry_registry.render_topology(properties, level).decode("utf-8")
+
+
+def build_regions_geojson() -> dict:
+    """
+    Materializes the regions-with-sentiment GeoJSON on disk, once per
+    geometry resolution level and output format (GeoJSON and TopoJSON).
+
+    Each artifact is written under its SHA-256 hash next to
+    ``PROCESSED_GEOJSON`` and a small manifest is switched over atomically,
+    so readers never observe a partially written file.
+
+    Returns:
+        dict: The full-resolution entry (``path``, ``etag``, ``built_at``).
+    """
+    out_dir = os.path.dirname(current_app.config["PROCESSED_GEOJSON"])
+    os.makedirs(out_dir, exist_ok=True)
+
+    renderers = {
+        "geojson": _render_regions_geojson,
+        "topojson": _render_regions_topojson,
+    }
+    df = _latest_sentiment()
+    formats = {}
+    for fmt in FORMATS:
+        formats[fmt] = []
+        for level in range(len(geometry_registry.tolerances)):
+            content = renderers[fmt](df, level).encode("utf-8")
+            digest = hashlib.sha256(content).hexdigest()
+            out_path = os.path.join(out_dir, f"{_artifact_stem()}.{digest[:16]}.{fmt}")
+            if not os.path.exists(out_path):
+                _atomic_write(out_path, content)
+            formats[fmt].append({"path": os.path.basename(out_path), "etag": digest})
+
+    manifest = {
+        "built_at": datetime.now(timezone.utc).isoformat(),
+        "formats": formats,
+    }
+    _atomic_write(_manifest_path(), json.dumps(manifest).encode("utf-8"))
+    _prune_artifacts(out_dir, keep={
+        entry["path"] for entries in formats.values() for entry in entries
+    })
+
+    return _manifest_entry(manifest, 0, "geojson")
+
+
+def current_regions_geojson(level: int = 0, fmt: str = "geojson") -> dict | None:
+    """
+    Returns the manifest entry of the latest materialized artifact at the
+    given resolution level and format, or None if it has not been built
+    yet.
+    """
+    try:
+        with open(_manifest_path(), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+    if level >= len(manifest.get("formats", {}).get(fmt, [])):
+        return None
+    entry = _manifest_entry(manifest, level, fmt)
+    if not os.path.exists(entry["path"]):
+        return None
+    return entry
+
+
+def _manifest_entry(manifest: dict, level: int, fmt: str) -> dict:
+    out_dir = os.path.dirname(current_app.config["PROCESSED_GEOJSON"])
+    entry = manifest["formats"][fmt][level]
+    return {
+        "path": os.path.join(out_dir, entry["path"]),
+        "etag": entry["etag"],
+        "built_at": manifest["built_at"],
+    }
+
+
+def _artifact_stem() -> str:
+    return os.path.splitext(
+        os.path.basename(current_app.config["PROCESSED_GEOJSON"]))[0]
+
+
+def _manifest_path() -> str:
+    base = os.path.splitext(current_app.config["PROCESSED_GEOJSON"])[0]
+    return f"{base}.manifest.json"
+
+
+def _atomic_write(path: str, content: bytes):
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def _prune_artifacts(out_dir: str, keep: set):
+    artifacts = []
+    for fmt in FORMATS:
+        artifacts += glob.glob(os.path.join(out_dir, f"{_artifact_stem()}.*.{fmt}"))
+    artifacts.sort(key=os.path.getmtime, reverse=True)
+    older = [p for p in artifacts if os.path.basename(p) not in keep]
+    stale = older[(KEEP_BUILDS - 1) * len(keep):]
+    for path in stale:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
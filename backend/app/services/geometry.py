@@ -0,0 +1,330 @@
+import os
+import json
+import math
+import threading
+import geopandas as gpd
+import numpy as np
+import pandas as pd
+import shapely
+from shapely.geometry import mapping
+from app.services.topology import build_topology
+
+# Tile size used by the web map, in pixels
+TILE_SIZE = 256
+
+# Earth radius of the spherical Web Mercator projection, in metres
+MERCATOR_RADIUS = 6378137.0
+MERCATOR_MAX_LAT = 85.0511287798
+
+
+class GeometryRegistry:
+    """
+    Process-wide cache of the ROR1217 region boundaries.
+
+    The shapefile is parsed at most once per process, either when the app
+    is created (``PRELOAD_GEOMETRY``) or lazily on first access. Each
+    region's feature is pre-rendered to JSON bytes with slots for
+    ``value`` and ``NAME``, so the map endpoints only splice per-request
+    values into the cached fragments.
+
+    Besides the full-resolution boundaries, simplified levels are built
+    for each tolerance in ``GEOMETRY_TOLERANCES`` (degrees). Level 0 is
+    always the original geometry; higher levels are coarser. A TopoJSON
+    rendering of each level, with shared arcs, is built on first use.
+    """
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self._shp_path = None
+        self._tolerances = ()
+        self._frame = None
+        self._geometries = None
+        self._levels = None
+        self._templates = None
+        self._mercator = {}
+        self._topologies = {}
+        self._quantization = 100000
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        app.extensions["geometry_registry"] = self
+        shp_path = app.config.get("REGIONS_SHAPEFILE")
+        if not shp_path:
+            shp_path = _find_shapefile(app.config["RAW_SHP_DIR"])
+        tolerances = (0.0,) + tuple(sorted(app.config.get("GEOMETRY_TOLERANCES", ())))
+        quantization = app.config.get("TOPOJSON_QUANTIZATION", 100000)
+        if (shp_path, tolerances, quantization) != (
+                self._shp_path, self._tolerances, self._quantization):
+            with self._lock:
+                self._shp_path = shp_path
+                self._tolerances = tolerances
+                self._quantization = quantization
+                self._frame = self._geometries = None
+                self._levels = self._templates = None
+                self._mercator = {}
+                self._topologies = {}
+        if app.config.get("PRELOAD_GEOMETRY"):
+            self.load()
+
+    def load(self):
+        """Read the shapefile once and build the region index."""
+        if self._frame is not None:
+            return
+        with self._lock:
+            if self._frame is not None:
+                return
+
+            gdf = gpd.read_file(self._shp_path)
+
+            # Ensure GeoDataFrame is using WGS84 (EPSG:4326)
+            if gdf.crs is None:
+                raise ValueError("Shapefile has no coordinate reference system (CRS) defined.")
+            if gdf.crs.to_epsg() != 4326:
+                gdf = gdf.to_crs(epsg=4326)
+
+            if "ROR1217" not in gdf.columns:
+                raise KeyError(f"Expected 'ROR1217' column in shapefile, found: {gdf.columns.tolist()}")
+            gdf["region_id"] = pd.to_numeric(gdf["ROR1217"], errors="coerce").astype("Int64")
+            gdf = gdf.dropna(subset=["region_id"])
+
+            levels = [gdf.geometry] + [
+                _simplify(gdf.geometry, tolerance)
+                for tolerance in self._tolerances[1:]
+            ]
+
+            region_ids = [int(rid) for rid in gdf["region_id"]]
+            feature_ids = [str(ror) for ror in gdf["ROR1217"]]
+            templates = [
+                {
+                    rid: _feature_template(fid, geom)
+                    for rid, fid, geom in zip(region_ids, feature_ids, level)
+                }
+                for level in levels
+            ]
+
+            self._geometries = dict(zip(region_ids, gdf.geometry))
+            self._levels = levels
+            self._templates = templates
+            self._frame = gdf
+
+    @property
+    def frame(self) -> gpd.GeoDataFrame:
+        """The full shapefile as a WGS84 GeoDataFrame with ``region_id``."""
+        self.load()
+        return self._frame
+
+    @property
+    def geometries(self) -> dict:
+        """ROR1217 region_id -> shapely geometry."""
+        self.load()
+        return self._geometries
+
+    @property
+    def tolerances(self) -> tuple:
+        """Simplification tolerance (degrees) of each level, level 0 first."""
+        return self._tolerances
+
+    def level_geometries(self, level: int = 0) -> gpd.GeoSeries:
+        """Geometries of one level, aligned with :attr:`frame`."""
+        self.load()
+        return self._levels[level]
+
+    def render_topology(self, properties: dict, level: int = 0,
+                        **members) -> bytes:
+        """
+        Render a TopoJSON Topology with one ``regions`` GeometryCollection.
+
+        Arcs and per-region geometry are pre-rendered once per level; only
+        the properties are encoded per call.
+
+        Args:
+            properties (dict): region_id -> properties dict of that region.
+            level (int): Resolution level, see :meth:`level_for`.
+
+        Extra keyword arguments are added as top-level members.
+        """
+        head, objects, tail = self._topology_template(level)
+        parts = []
+        for rid, object_head in objects:
+            parts.append(object_head + _encode_properties(properties.get(rid, {})) + b"}")
+        members = b"".join(
+            json.dumps(key).encode() + b":" + json.dumps(value).encode() + b","
+            for key, value in members.items()
+        )
+        return b"{" + members + head + b",".join(parts) + tail
+
+    def _topology_template(self, level: int) -> tuple:
+        template = self._topologies.get(level)
+        if template is None:
+            self.load()
+            region_ids = [int(rid) for rid in self._frame["region_id"]]
+            feature_ids = [str(ror) for ror in self._frame["ROR1217"]]
+            transform, arcs, objects = build_topology(
+                region_ids, list(self._levels[level].values), self._quantization
+            )
+            head = (b'"type":"Topology","transform":' + _compact(transform)
+                    + b',"objects":{"regions":{"type":"GeometryCollection","geometries":[')
+            tail = b']}},"arcs":' + _compact(arcs) + b"}"
+            object_heads = [
+                (rid, _compact({**geometry, "id": fid})[:-1] + b',"properties":')
+                for fid, (rid, geometry) in zip(feature_ids, objects)
+            ]
+            template = (head, object_heads, tail)
+            self._topologies[level] = template
+        return template
+
+    def mercator_index(self, level: int = 0) -> tuple:
+        """
+        Web Mercator (EPSG:3857) geometries of one level plus an STRtree
+        over them, used to clip map tiles. Built once per level.
+
+        Returns:
+            tuple: (region_ids, geometries, tree) with matching positions.
+        """
+        index = self._mercator.get(level)
+        if index is None:
+            geoms = self.level_geometries(level)
+            region_ids = [int(rid) for rid in self._frame["region_id"]]
+            projected = shapely.transform(geoms.values, _to_mercator)
+            index = (region_ids, projected, shapely.STRtree(projected))
+            self._mercator[level] = index
+        return index
+
+    def level_for(self, zoom=None, tolerance=None) -> int:
+        """
+        Pick the coarsest level whose tolerance does not exceed the
+        requested one.
+
+        Args:
+            zoom (int | str): Web map zoom; translated to the size of one
+                pixel in degrees at that zoom.
+            tolerance (float | str): Maximum tolerance in degrees.
+
+        Returns:
+            int: Level index, 0 (full resolution) if neither is given.
+
+        Raises:
+            ValueError: If zoom or tolerance are not valid numbers.
+        """
+        if tolerance is not None:
+            try:
+                tolerance = float(tolerance)
+            except ValueError:
+                raise ValueError("tolerance must be a number") from None
+            if not math.isfinite(tolerance) or tolerance < 0:
+                raise ValueError("tolerance must be a non-negative number")
+        elif zoom is not None:
+            try:
+                zoom = int(zoom)
+            except ValueError:
+                raise ValueError("zoom must be an integer") from None
+            if not 0 <= zoom <= 24:
+                raise ValueError("zoom must be between 0 and 24")
+            tolerance = 360.0 / (TILE_SIZE * 2 ** zoom)
+        else:
+            return 0
+
+        level = 0
+        for idx, level_tolerance in enumerate(self._tolerances):
+            if level_tolerance <= tolerance:
+                level = idx
+        return level
+
+    def render_features(self, values: dict, names: dict, level: int = 0,
+                        default_value=0, default_name="Unknown") -> bytes:
+        """
+        Render the comma-joined GeoJSON features for all regions.
+
+        Only the values and names are encoded per call; geometry is copied
+        from the pre-rendered fragments, so the cost depends on the number
+        of regions rather than the number of coordinates.
+
+        Args:
+            values (dict): region_id -> metric value.
+            names (dict): region_id -> region name.
+            level (int): Resolution level, see :meth:`level_for`.
+
+        Returns:
+            bytes: Features ready to be placed inside a JSON array.
+        """
+        self.load()
+        parts = []
+        for rid, (head, middle, tail) in self._templates[level].items():
+            parts.append(b"".join((
+                head,
+                _encode_value(values.get(rid, default_value)),
+                middle,
+                json.dumps(names.get(rid, default_name)).encode(),
+                tail,
+            )))
+        return b",".join(parts)
+
+    def render_feature_collection(self, values: dict, names: dict,
+                                  level: int = 0, **members) -> bytes:
+        """
+        Render a complete FeatureCollection.
+
+        Extra keyword arguments are added as top-level members, e.g.
+        ``date="2025-04-01"``.
+        """
+        head = b"".join(
+            json.dumps(key).encode() + b":" + json.dumps(value).encode() + b","
+            for key, value in members.items()
+        )
+        return (b"{" + head + b'"type":"FeatureCollection","features":['
+                + self.render_features(values, names, level) + b"]}")
+
+
+def _simplify(geometries: gpd.GeoSeries, tolerance: float) -> gpd.GeoSeries:
+    """
+    Simplify the regions as one coverage so that neighbouring regions keep
+    sharing their edges, then round coordinates to the precision that
+    tolerance can still show.
+    """
+    simplified = shapely.coverage_simplify(geometries.values, tolerance)
+    decimals = max(0, math.ceil(-math.log10(tolerance))) + 1
+    rounded = shapely.transform(simplified, lambda coords: np.round(coords, decimals))
+    return gpd.GeoSeries(rounded, index=geometries.index, crs=geometries.crs)
+
+
+def _to_mercator(coords):
+    lon = np.radians(coords[:, 0])
+    lat = np.radians(np.clip(coords[:, 1], -MERCATOR_MAX_LAT, MERCATOR_MAX_LAT))
+    return np.column_stack((
+        MERCATOR_RADIUS * lon,
+        MERCATOR_RADIUS * np.log(np.tan(np.pi / 4 + lat / 2)),
+    ))
+
+
+def _feature_template(feature_id: str, geom) -> tuple:
+    """Split a feature into the byte fragments around its two value slots."""
+    geometry = json.dumps(mapping(geom), separators=(",", ":")).encode()
+    head = (b'{"id":' + json.dumps(feature_id).encode()
+            + b',"type":"Feature","geometry":' + geometry
+            + b',"properties":{"value":')
+    return head, b',"NAME":', b"}}"
+
+
+def _compact(obj) -> bytes:
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _encode_properties(properties: dict) -> bytes:
+    return b"{" + b",".join(
+        json.dumps(key).encode() + b":" + _encode_value(value)
+        for key, value in properties.items()
+    ) + b"}"
+
+
+def _encode_value(value) -> bytes:
+    if value is None or (isinstance(value, float) and not math.isfinite(value)):
+        return b"null"
+    return json.dumps(value).encode()
+
+
+def _find_shapefile(shp_dir: str) -> str:
+    shp_files = sorted(f for f in os.listdir(shp_dir) if f.lower().endswith(".shp"))
+    if not shp_files:
+        raise FileNotFoundError(f"No .shp file found in {shp_dir}")
+    return os.path.join(shp_dir, shp_files[0])
@@ -1,5 +1,38 @@
+import io
 import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pv
+
+# Bytes scanned per read when splitting a file into line ranges
+SCAN_BLOCK_SIZE = 1 << 20
+
+# Column types of the CSV sources; other columns are not read
+REGIONAL_NEWS_TYPES = {
+    "Region": pa.int64(),
+    "item_date_published": pa.timestamp("ns"),
+    "num_words": pa.float64(),
+    "rauh_sents_share": pa.float64(),
+    "rauh_sents_av": pa.float64(),
+    "Happiness_share": pa.float64(),
+    "Happiness_av": pa.float64(),
+    "Val_share": pa.float64(),
+    "Val_av": pa.float64(),
+    "num_papers": pa.int64(),
+    "num_news": pa.int64(),
+}
+
+GLOBAL_STATS_TYPES = {
+    "Country": pa.string(),
+    "item_date_published": pa.timestamp("ns"),
+    "num.newspaper": pa.int64(),
+    "num.feeds": pa.int64(),
+    "av.sents": pa.float64(),
+    "num.news": pa.int64(),
+}
+
+# Field names of the global stats rows, including the unnamed row label
+GLOBAL_STATS_NAMES = ["row", *GLOBAL_STATS_TYPES]
 
 
 def read_region_names(path: str) -> pd.DataFrame:
@@ -25,51 +58,85 @@ def read_region_names(path: str) -> pd.DataFrame:
     )
 
 
-def read_regional_news(path: str) -> pd.DataFrame:
+def read_regional_news(path) -> pd.DataFrame:
     """
-    Reads only the columns we need from the comma-delimited Regional_news.csv.
-    This prevents stray values (like 'Deutschland' in Country) from
-    shifting columns.
+    Reads only the columns we need from the comma-delimited Regional_news.csv
+    with the pyarrow CSV parser, typed by REGIONAL_NEWS_TYPES. This
+    prevents stray values (like 'Deutschland' in Country) from shifting
+    columns; a value that does not fit its column's type raises.
+
+    ``path`` may also be a binary file object, e.g. from read_range().
     """
-    return pd.read_csv(
-        path,
-        sep=",",
-        quotechar='"',
-        usecols=[
-            "Region",
-            "item_date_published",
-            "num_words",
-            "rauh_sents_share",
-            "rauh_sents_av",
-            "Happiness_share",
-            "Happiness_av",
-            "Val_share",
-            "Val_av",
-            "num_papers",
-            "num_news",
-        ],
-        parse_dates=["item_date_published"],
-        engine="c",
-    )
+    return _read_typed_csv(path, REGIONAL_NEWS_TYPES, delimiter=",")
 
 
-def read_global_stats(path: str) -> pd.DataFrame:
+def read_global_stats(path) -> pd.DataFrame:
     """
-    Reads only the six columns we care about from the semicolon-delimited
-    global_stats file.
+    Reads the six columns we care about from the semicolon-delimited
+    global_stats file, typed by GLOBAL_STATS_TYPES.
+
+    Its data rows start with a quoted row label the header has no name
+    for, so the header is replaced by GLOBAL_STATS_NAMES.
     """
-    return pd.read_csv(
+    return _read_typed_csv(path, GLOBAL_STATS_TYPES, delimiter=";",
+                           column_names=GLOBAL_STATS_NAMES)
+
+
+def _read_typed_csv(path, column_types: dict, delimiter: str,
+                    column_names: list | None = None) -> pd.DataFrame:
+    read_options = pv.ReadOptions(column_names=column_names,
+                                  skip_rows=1 if column_names else 0)
+    table = pv.read_csv(
         path,
-        sep=";",
-        quotechar='"',
-        usecols=[
-            "Country",
-            "item_date_published",
-            "num.newspaper",
-            "num.feeds",
-            "av.sents",
-            "num.news",
-        ],
-        parse_dates=["item_date_published"],
-        engine="python",
+        read_options=read_options,
+        parse_options=pv.ParseOptions(delimiter=delimiter),
+        convert_options=pv.ConvertOptions(column_types=column_types,
+                                          include_columns=list(column_types)),
     )
+    return table.to_pandas()
+
+
+def line_ranges(path: str, chunksize: int | None = None) -> list:
+    """
+    Splits the data lines of a delimited file into byte ranges of at most
+    ``chunksize`` lines each, which read_range() can read independently,
+    e.g. in different processes. The header line is not part of any range.
+
+    Assumes one record per line (no quoted line breaks), as in the source
+    CSVs. Without ``chunksize`` a single range covers all data lines.
+
+    Returns:
+        list: (start, end) byte offsets, in file order
+    """
+    ranges = []
+    with open(path, "rb") as f:
+        start = position = len(f.readline())
+        lines = 0
+        while block := f.read(SCAN_BLOCK_SIZE):
+            count = block.count(b"\n")
+            if not chunksize or lines + count < chunksize:
+                lines += count
+            else:
+                index = -1
+                while (index := block.find(b"\n", index + 1)) >= 0:
+                    lines += 1
+                    if lines == chunksize:
+                        end = position + index + 1
+                        ranges.append((start, end))
+                        start, lines = end, 0
+            position += len(block)
+    if position > start:
+        ranges.append((start, position))
+    return ranges
+
+
+def read_range(reader, path: str, start: int, end: int) -> pd.DataFrame:
+    """
+    Reads the lines in the byte range [start, end) of ``path`` with one of
+    the CSV readers above, as if they formed the whole file.
+    """
+    with open(path, "rb") as f:
+        header = f.readline()
+        f.seek(start)
+        data = f.read(end - start)
+    return reader(io.BytesIO(header + data))
@@ -0,0 +1,76 @@
+import hashlib
+import os
+import shutil
+import uuid
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Part of every cache key; bump it when a reader's schema or output
+# changes, so entries written by the old reader are not reused
+CACHE_VERSION = 1
+
+# Bytes hashed per read
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def entry_path(cache_dir: str, path: str, reader) -> str:
+    """
+    Cache entry of a raw input file: a directory of Parquet parts named
+    after the file and the SHA-256 of its content and reader, so any
+    change to the file leads to a different entry.
+    """
+    digest = hashlib.sha256(
+        f"{CACHE_VERSION}:{reader.__module__}.{reader.__qualname__}".encode()
+    )
+    with open(path, "rb") as f:
+        while block := f.read(HASH_BLOCK_SIZE):
+            digest.update(block)
+    return os.path.join(cache_dir, f"{os.path.basename(path)}-{digest.hexdigest()[:24]}")
+
+
+def cached_parts(entry: str) -> list | None:
+    """The Parquet parts of a complete entry in file order, or None."""
+    if not os.path.isdir(entry):
+        return None
+    return [os.path.join(entry, name) for name in sorted(os.listdir(entry))]
+
+
+def staging_path(entry: str) -> str:
+    """Creates a private directory next to ``entry`` to write parts into."""
+    staging = f"{entry}.partial-{uuid.uuid4().hex[:8]}"
+    os.makedirs(staging)
+    return staging
+
+
+def part_path(staging: str, index: int) -> str:
+    return os.path.join(staging, f"part-{index:05d}.parquet")
+
+
+def write_part(df: pd.DataFrame, part: str):
+    pq.write_table(pa.Table.from_pandas(df, preserve_index=False), part)
+
+
+def read_part(part: str) -> pd.DataFrame:
+    return pq.read_table(part).to_pandas()
+
+
+def commit(staging: str, entry: str, parts: int):
+    """
+    Publishes a staging directory as ``entry`` if all ``parts`` were
+    written to it, and removes the older entries (and leftover staging
+    directories) of the same file.
+    """
+    if os.path.isdir(entry) or len(os.listdir(staging)) != parts:
+        shutil.rmtree(staging)
+    else:
+        os.replace(staging, entry)
+    cache_dir, name = os.path.split(entry)
+    prefix = name.rsplit("-", 1)[0] + "-"
+    for other in os.listdir(cache_dir):
+        if other.startswith(prefix) and other != name:
+            shutil.rmtree(os.path.join(cache_dir, other), ignore_errors=True)
+
+
+def discard(staging: str):
+    shutil.rmtree(staging, ignore_errors=True)
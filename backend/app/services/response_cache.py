@@ -0,0 +1,242 @@
+import functools
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from datetime import date
+from urllib.parse import urlencode
+from flask import Response, current_app, request
+from app.services.streaming import requested_stream_type
+
+
+class CacheStats:
+    """Hit/miss/eviction counters of one backend in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def count(self, hits=0, misses=0, evictions=0):
+        with self._lock:
+            self.hits += hits
+            self.misses += misses
+            self.evictions += evictions
+
+    def as_dict(self) -> dict:
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions}
+
+
+class MemoryBackend:
+    """Thread-safe in-process LRU with per-entry expiry."""
+
+    name = "memory"
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+
+    def get(self, key: str):
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= now:
+                del self._entries[key]
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+        self.stats.count(hits=entry is not None, misses=entry is None)
+        return entry[0] if entry is not None else None
+
+    def set(self, key: str, value, ttl: float):
+        evicted = 0
+        with self._lock:
+            self._entries[key] = (value, time.time() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                evicted += 1
+        self.stats.count(evictions=evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+class SQLiteBackend:
+    """
+    LRU with expiry in a SQLite file, shared by all worker processes on a
+    host. Each thread keeps its own connection; counters are per process.
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str, maxsize: int):
+        self.path = path
+        self.maxsize = maxsize
+        self.stats = CacheStats()
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS response_cache ("
+                "key TEXT PRIMARY KEY, body BLOB NOT NULL, mimetype TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS ix_response_cache_accessed_at "
+                "ON response_cache (accessed_at)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str):
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT body, mimetype FROM response_cache WHERE key = ? AND expires_at > ?",
+                (key, now),
+            ).fetchone()
+            if row is not None:
+                conn.execute("UPDATE response_cache SET accessed_at = ? WHERE key = ?",
+                             (now, key))
+        self.stats.count(hits=row is not None, misses=row is None)
+        return (bytes(row[0]), row[1]) if row is not None else None
+
+    def set(self, key: str, value, ttl: float):
+        body, mimetype = value
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO response_cache VALUES (?, ?, ?, ?, ?)",
+                (key, body, mimetype, now + ttl, now),
+            )
+            expired = conn.execute(
+                "DELETE FROM response_cache WHERE expires_at <= ?", (now,)
+            ).rowcount
+            evicted = conn.execute(
+                "DELETE FROM response_cache WHERE key IN ("
+                "SELECT key FROM response_cache ORDER BY accessed_at DESC "
+                "LIMIT -1 OFFSET ?)",
+                (self.maxsize,),
+            ).rowcount
+        self.stats.count(evictions=expired + evicted)
+
+    def clear(self):
+        with self._connect() as conn:
+            conn.execute("DELETE FROM response_cache")
+
+    def __len__(self):
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+
+class ResponseCache:
+    """
+    Caches successful GET responses of decorated views.
+
+    Keys combine the endpoint, path arguments, normalized query
+    parameters, the data generation and the current day, so an ingest
+    makes every older entry unreachable; ``clear`` additionally drops them.
+
+    Requests negotiating a streamed NDJSON/CSV response bypass the cache.
+
+    Backends are chosen by RESPONSE_CACHE_BACKEND: 'memory' (per process),
+    'sqlite' (shared through RESPONSE_CACHE_PATH) or 'none'.
+    """
+
+    def init_app(self, app):
+        kind = app.config.get("RESPONSE_CACHE_BACKEND", "memory")
+        maxsize = app.config.get("RESPONSE_CACHE_SIZE", 1024)
+        if kind == "memory":
+            backend = MemoryBackend(maxsize)
+        elif kind == "sqlite":
+            path = app.config.get("RESPONSE_CACHE_PATH") or os.path.join(
+                app.instance_path, "response_cache.sqlite")
+            backend = SQLiteBackend(path, maxsize)
+        elif kind in (None, "none"):
+            backend = None
+        else:
+            raise ValueError(f"Unknown RESPONSE_CACHE_BACKEND {kind!r}")
+        app.extensions["response_cache"] = backend
+
+    @property
+    def backend(self):
+        return current_app.extensions.get("response_cache")
+
+    def cached(self, list_params=(), defaults=None):
+        """
+        Decorator caching a view's 200 responses.
+
+        Args:
+            list_params (tuple): Comma-separated parameters whose order and
+                duplicates do not matter, e.g. ``regions``.
+            defaults (dict): Parameter -> default value or callable, filled
+                in before keying so explicit defaults share an entry.
+        """
+        def decorator(view):
+            @functools.wraps(view)
+            def wrapper(*args, **kwargs):
+                backend = self.backend
+                if backend is None or requested_stream_type():
+                    return view(*args, **kwargs)
+
+                key = self.key_for(list_params, defaults or {})
+                hit = backend.get(key)
+                if hit is not None:
+                    body, mimetype = hit
+                    return Response(body, status=200, mimetype=mimetype)
+
+                response = current_app.make_response(view(*args, **kwargs))
+                if response.status_code == 200 and not response.direct_passthrough:
+                    ttl = current_app.config.get("RESPONSE_CACHE_TTL", 3600)
+                    backend.set(key, (response.get_data(), response.mimetype), ttl)
+                return response
+            return wrapper
+        return decorator
+
+    @staticmethod
+    def key_for(list_params=(), defaults=None) -> str:
+        """Cache key of the current request."""
+        from app.services.data_generation import current_generation
+
+        params = {}
+        for name, default in (defaults or {}).items():
+            params[name] = [default() if callable(default) else default]
+        for name in request.args:
+            if name in list_params:
+                # Views read the first value only, like request.args.get
+                items = {v.strip() for v in request.args[name].split(",")}
+                params[name] = [",".join(sorted(items))]
+            else:
+                params[name] = request.args.getlist(name)
+        query = urlencode(sorted((k, v) for k, vs in params.items() for v in vs))
+        view_args = urlencode(sorted((request.view_args or {}).items()))
+        return "|".join((request.endpoint, view_args, query,
+                         str(current_generation()), date.today().isoformat()))
+
+    def clear(self):
+        """Drops all entries, e.g. after an ingest."""
+        if self.backend is not None:
+            self.backend.clear()
+
+    def stats(self) -> dict:
+        backend = self.backend
+        if backend is None:
+            return {"backend": "none"}
+        return {"backend": backend.name, "entries": len(backend),
+                **backend.stats.as_dict()}
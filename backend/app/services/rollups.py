@@ -0,0 +1,186 @@
+from contextlib import nullcontext
+from datetime import datetime
+import numpy as np
+import pandas as pd
+from flask import current_app
+from sqlalchemy import delete, select
+from app import db
+from app.models.data_models import GlobalRollup, GlobalStats, RegionalData, RegionalRollup
+from app.services.bulk_load import bulk_insert, dropped_indexes
+from app.services.downsampling import period_start
+
+PERIODS = ("week", "month", "year")
+
+# Rolled-up metric -> whether its mean is weighted by num_news. Sentiment
+# scores are weighted so busy days count more; counts use plain means.
+REGIONAL_METRICS = {
+    "num_words": False,
+    "rauh_sents_share": True,
+    "rauh_sents_av": True,
+    "happiness_share": True,
+    "happiness_av": True,
+    "val_share": True,
+    "val_av": True,
+    "num_papers": False,
+    "num_news": False,
+}
+
+GLOBAL_METRICS = {
+    "num_newspaper": False,
+    "num_feeds": False,
+    "av_sents": True,
+    "num_news": False,
+}
+
+# Daily model -> (rollup model, entity column, metrics)
+ROLLUPS = {
+    RegionalData: (RegionalRollup, "region_id", REGIONAL_METRICS),
+    GlobalStats: (GlobalRollup, "country", GLOBAL_METRICS),
+}
+
+WEIGHT_COLUMN = "num_news"
+
+
+def rebuild_rollups(tables: dict | None = None, since: datetime | None = None):
+    """
+    Recomputes the week, month and year rollups from the daily tables.
+
+    Only periods that contain ``since`` or start after it are replaced, so
+    an incremental ingest touches the few periods its new days fall into.
+    Runs in the current session; the caller commits.
+
+    Args:
+        tables (dict | None): model -> Table overrides, e.g. the shadow
+            tables of a full reload. Defaults to the live tables.
+        since (datetime | None): Earliest changed date; None rebuilds all.
+    """
+    db.session.flush()
+    tables = tables or {}
+    batch_size = current_app.config.get("INGEST_BATCH_SIZE", 10000)
+    for daily, (rollup, entity, metrics) in ROLLUPS.items():
+        source = tables.get(daily, daily.__table__)
+        target = tables.get(rollup, rollup.__table__)
+
+        firsts = {p: _period_first(since, p) for p in PERIODS}
+        earliest = min(firsts.values()) if since is not None else None
+        df = _read_daily(source, entity, metrics, earliest)
+        days = df["item_date_published"].to_numpy().astype("datetime64[D]")
+
+        for period in PERIODS:
+            stmt = delete(target).where(target.c.period == period)
+            if firsts[period] is not None:
+                stmt = stmt.where(target.c.period_start >= firsts[period])
+            db.session.execute(stmt)
+
+        # A full rebuild reloads every row, so its indexes are rebuilt once
+        # afterwards instead of being maintained per row. The deletes above
+        # opened the transaction, which keeps the drop invisible to readers.
+        with dropped_indexes(target) if since is None else nullcontext():
+            for period in PERIODS:
+                subset = df
+                period_days = days
+                if firsts[period] is not None:
+                    keep = days >= np.datetime64(firsts[period], "D")
+                    subset, period_days = df[keep], days[keep]
+                rows = _aggregate(subset, period_days, entity, metrics, period)
+                for start in range(0, len(rows), batch_size):
+                    bulk_insert(target, rows.iloc[start:start + batch_size])
+
+
+def rollup_series(daily_model, entities: list, columns: dict, period: str,
+                  start: datetime, end: datetime) -> list:
+    """
+    Reads rollup means for several entities of one daily model.
+
+    Every period overlapping [start, end] is returned whole.
+
+    Args:
+        daily_model: RegionalData or GlobalStats.
+        entities (list): Region ids or country names.
+        columns (dict): Response key -> rolled-up metric.
+        period (str): One of PERIODS.
+
+    Returns:
+        list: Rows {"date", <entity column>, <key>: mean, ...} ordered by
+        period start, then by position in ``entities``.
+    """
+    rollup, entity, _ = ROLLUPS[daily_model]
+    table = rollup.__table__
+    rows = db.session.execute(
+        select(table.c[entity], table.c.period_start, table.c.metric, table.c.value_mean)
+        .where(
+            table.c[entity].in_(entities),
+            table.c.period == period,
+            table.c.metric.in_(set(columns.values())),
+            table.c.period_start >= _period_first(start, period),
+            table.c.period_start <= end,
+        )
+    ).all()
+
+    cells = {}
+    for key, started, metric, mean in rows:
+        cells.setdefault((started.date().isoformat(), key), {})[metric] = mean
+
+    order = {e: i for i, e in enumerate(dict.fromkeys(entities))}
+    result = []
+    for (day, key), means in sorted(cells.items(), key=lambda c: (c[0][0], order[c[0][1]])):
+        row = {"date": day, entity: key}
+        for out_key, metric in columns.items():
+            row[out_key] = means.get(metric)
+        result.append(row)
+    return result
+
+
+def _period_first(day: datetime | None, period: str) -> datetime | None:
+    """Midnight of the first day of the period containing ``day``."""
+    if day is None:
+        return None
+    first = period_start(np.array([day], dtype="datetime64[D]"), period)[0]
+    return first.astype("datetime64[us]").item()
+
+
+def _read_daily(source, entity: str, metrics: dict, since) -> pd.DataFrame:
+    columns = [entity, "item_date_published", *metrics]
+    stmt = select(*(source.c[c] for c in columns))
+    if since is not None:
+        stmt = stmt.where(source.c.item_date_published >= since)
+    rows = db.session.execute(stmt).all()
+    df = pd.DataFrame(rows, columns=columns)
+    df["item_date_published"] = pd.to_datetime(df["item_date_published"], utc=True
+                                               ).dt.tz_localize(None)
+    return df
+
+
+def _aggregate(df: pd.DataFrame, days: np.ndarray, entity: str, metrics: dict,
+               period: str) -> pd.DataFrame:
+    """Long-format rollup rows of one period length."""
+    if df.empty:
+        return pd.DataFrame()
+    df = df.assign(period_start=period_start(days, period).astype("datetime64[ns]"))
+    keys = [entity, "period_start"]
+    grouped = df.groupby(keys)
+    weights = df[WEIGHT_COLUMN].fillna(0)
+
+    frames = []
+    for metric, weighted in metrics.items():
+        values = df[metric].astype(float)
+        sums = grouped[metric].sum(min_count=1)
+        counts = grouped[metric].count()
+        means = sums / counts
+        if weighted:
+            w = weights.where(values.notna(), 0)
+            weight_sums = w.groupby([df[entity], df["period_start"]]).sum()
+            weighted_means = (values * w).groupby([df[entity], df["period_start"]]).sum() / weight_sums
+            # Periods without any news fall back to the plain mean
+            means = weighted_means.where(weight_sums > 0, means)
+
+        frames.append(pd.DataFrame({
+            entity: sums.index.get_level_values(entity),
+            "period": period,
+            "period_start": sums.index.get_level_values("period_start"),
+            "metric": metric,
+            "value_sum": sums.to_numpy(dtype=float),
+            "value_mean": means.reindex(sums.index).to_numpy(dtype=float),
+            "value_count": counts.to_numpy(),
+        }))
+    return pd.concat(frames, ignore_index=True)
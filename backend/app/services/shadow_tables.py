@@ -0,0 +1,115 @@
+from sqlalchemy import Column, ForeignKey, Index, MetaData, Table, inspect, text
+from app import db
+
+# Full reloads are written to "_shadow_<table>" and swapped in by renaming;
+# the replaced tables are renamed to "_retired_<table>" and dropped.
+SHADOW_PREFIX = "_shadow_"
+RETIRED_PREFIX = "_retired_"
+
+
+def create_shadow_tables(models: list) -> dict:
+    """
+    Creates empty, index-less copies of the given tables.
+
+    Models must be ordered parents first; foreign keys between them point
+    at the parent's shadow table, so the copies can be swapped in as a
+    consistent set. Leftovers from an interrupted reload are dropped first.
+
+    Returns:
+        dict: model -> shadow Table.
+    """
+    normalize_indexes(models)
+
+    metadata = MetaData()
+    shadow = {}
+    for model in models:
+        table = model.__table__
+        columns = []
+        for col in table.columns:
+            fks = [
+                ForeignKey(f"{SHADOW_PREFIX}{fk.column.table.name}.{fk.column.name}")
+                for fk in col.foreign_keys
+            ]
+            columns.append(Column(
+                col.name, col.type, *fks,
+                primary_key=col.primary_key,
+                nullable=col.nullable,
+                server_default=col.server_default.arg if col.server_default else None,
+            ))
+        shadow[model] = Table(SHADOW_PREFIX + table.name, metadata, *columns)
+
+    bind = db.session.connection()
+    for model in reversed(models):
+        shadow[model].drop(bind, checkfirst=True)
+    for model in models:
+        shadow[model].create(bind)
+    db.session.commit()
+    return shadow
+
+
+def build_shadow_indexes(shadow: dict):
+    """Builds the live tables' indexes on the filled shadow tables."""
+    bind = db.session.connection()
+    for model, table in shadow.items():
+        for index in model.__table__.indexes:
+            Index(
+                SHADOW_PREFIX + index.name,
+                *(table.c[col.name] for col in index.columns),
+                unique=index.unique,
+            ).create(bind)
+    db.session.commit()
+
+
+def swap_shadow_tables(shadow: dict):
+    """
+    Replaces the live tables with their shadow copies.
+
+    All renames run in the current session transaction, which the caller
+    commits; readers see either the old or the new tables, never a mix.
+    """
+    conn = db.session.connection()
+    if conn.dialect.name == "sqlite":
+        # pysqlite does not open a transaction for DDL on its own
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    models = list(shadow)
+    # Children first, so dropping the retired set respects foreign keys
+    for model in reversed(models):
+        name = model.__tablename__
+        conn.execute(text(f'ALTER TABLE "{name}" RENAME TO "{RETIRED_PREFIX}{name}"'))
+    for model in models:
+        name = model.__tablename__
+        conn.execute(text(f'ALTER TABLE "{SHADOW_PREFIX}{name}" RENAME TO "{name}"'))
+    for model in reversed(models):
+        conn.execute(text(f'DROP TABLE "{RETIRED_PREFIX}{model.__tablename__}"'))
+
+    if conn.dialect.name == "postgresql":
+        for model in models:
+            for index in model.__table__.indexes:
+                conn.execute(text(
+                    f'ALTER INDEX "{SHADOW_PREFIX}{index.name}" RENAME TO "{index.name}"'
+                ))
+
+
+def normalize_indexes(models: list):
+    """
+    Gives swapped-in indexes their canonical names again.
+
+    SQLite cannot rename indexes, so after a swap each index is rebuilt
+    under its model name and the shadow-named copy dropped. This runs
+    after the swap has committed; queries keep using the shadow-named
+    index in the meantime.
+    """
+    conn = db.session.connection()
+    inspector = inspect(conn)
+    for model in models:
+        table = model.__table__
+        if not inspector.has_table(table.name):
+            continue
+        existing = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name not in existing:
+                index.create(conn)
+            if SHADOW_PREFIX + index.name in existing:
+                conn.execute(text(f'DROP INDEX "{SHADOW_PREFIX}{index.name}"'))
+    db.session.commit()
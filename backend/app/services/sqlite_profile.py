@@ -0,0 +1,76 @@
+from flask import current_app, has_request_context
+from flask_sqlalchemy.session import Session
+from sqlalchemy import create_engine, event
+from sqlalchemy.sql.dml import UpdateBase
+
+# Pragmas that persist in the database file and need write access
+PERSISTENT_PRAGMAS = ("journal_mode",)
+
+
+class SQLiteProfile:
+    """
+    Tunes SQLite connections and splits reads from writes.
+
+    Every new connection of the default engine runs the SQLITE_PRAGMAS
+    (WAL journaling, mmap, page cache, ...). With SQLITE_READ_POOL a
+    second engine of read-only connections to the same file is created;
+    ReadRoutingSession sends the queries of requests there, while the CLI
+    (ingestion) and all flushes keep using the default, writing engine.
+    Under WAL the two never block each other.
+
+    Other databases are left untouched.
+    """
+
+    def init_app(self, app, db):
+        with app.app_context():
+            engine = db.engine
+        app.extensions["sqlite_read_engine"] = None
+        if engine.dialect.name != "sqlite" or engine.url.database in (None, "", ":memory:"):
+            return
+
+        pragmas = app.config.get("SQLITE_PRAGMAS") or {}
+        if pragmas:
+            event.listen(engine, "connect", _pragma_listener(pragmas))
+
+        if app.config.get("SQLITE_READ_POOL", False):
+            read_url = engine.url.set(
+                database=f"file:{engine.url.database}",
+                query={**engine.url.query, "mode": "ro", "uri": "true"},
+            )
+            read_engine = create_engine(
+                read_url, pool_size=app.config.get("SQLITE_READ_POOL_SIZE", 12)
+            )
+            read_pragmas = {k: v for k, v in pragmas.items() if k not in PERSISTENT_PRAGMAS}
+            if read_pragmas:
+                event.listen(read_engine, "connect", _pragma_listener(read_pragmas))
+            app.extensions["sqlite_read_engine"] = read_engine
+
+
+def _pragma_listener(pragmas: dict):
+    statements = [f"PRAGMA {name}={value}" for name, value in pragmas.items()]
+
+    def apply(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+    return apply
+
+
+class ReadRoutingSession(Session):
+    """
+    Session that reads from the read-only engine inside requests.
+
+    Flushes and INSERT/UPDATE/DELETE statements always go to the default
+    engine, so a request that writes still works.
+    """
+
+    def get_bind(self, mapper=None, clause=None, bind=None, **kwargs):
+        if (bind is None and has_request_context() and not self._flushing
+                and not isinstance(clause, UpdateBase)):
+            engine = current_app.extensions.get("sqlite_read_engine")
+            if engine is not None:
+                return engine
+        return super().get_bind(mapper=mapper, clause=clause, bind=bind, **kwargs)
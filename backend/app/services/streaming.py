@@ -0,0 +1,72 @@
+import csv
+import io
+from itertools import groupby, islice
+import orjson
+from flask import Response, current_app, request, stream_with_context
+from app.services.downsampling import downsample
+
+NDJSON = "application/x-ndjson"
+CSV = "text/csv"
+
+# Streamed representations, negotiated against the default JSON array
+STREAM_MIMETYPES = (NDJSON, CSV)
+
+
+def requested_stream_type() -> str | None:
+    """
+    The streamed mimetype the Accept header prefers over application/json,
+    or None for the regular JSON response (also for */* and no header).
+    """
+    best = request.accept_mimetypes.best_match(("application/json", *STREAM_MIMETYPES))
+    return best if best in STREAM_MIMETYPES else None
+
+
+def stream_batch_size() -> int:
+    """Rows fetched per cursor round trip and written per chunk."""
+    return current_app.config.get("STREAM_BATCH_SIZE", 2000)
+
+
+def downsample_groups(rows, value_keys: list, points: int | None,
+                      group_key: str | None = None):
+    """
+    Applies ``downsample`` to each run of rows sharing ``group_key`` (or
+    to all rows if None), so a series-ordered stream only ever holds one
+    series in memory.
+    """
+    if points is None:
+        yield from rows
+        return
+    for _, group in groupby(rows, key=lambda row: row[group_key] if group_key else None):
+        yield from downsample(list(group), value_keys, points=points)
+
+
+def stream_rows(rows, columns: list, mimetype: str) -> Response:
+    """
+    Response writing ``rows`` (an iterable of dicts) as NDJSON or CSV in
+    chunks of stream_batch_size() rows while they are produced.
+
+    The generator runs inside the request context, so rows may come from
+    a cursor that is still being read.
+    """
+    batch_size = stream_batch_size()
+
+    def generate():
+        rows_iter = iter(rows)
+        if mimetype == CSV:
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(columns)
+        while batch := list(islice(rows_iter, batch_size)):
+            if mimetype == NDJSON:
+                yield b"".join(orjson.dumps(row) + b"\n" for row in batch)
+            else:
+                writer.writerows([row.get(c) for c in columns] for row in batch)
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        if mimetype == CSV and buffer.tell():
+            yield buffer.getvalue().encode("utf-8")
+
+    response = Response(stream_with_context(generate()), mimetype=mimetype)
+    response.vary.add("Accept")
+    return response
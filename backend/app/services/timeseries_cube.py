@@ -0,0 +1,198 @@
+import threading
+from datetime import date, datetime
+import numpy as np
+from flask import current_app
+from sqlalchemy import select
+from app import db
+from app.models.data_models import RegionalData, Regions
+from app.services.data_generation import current_generation
+
+# Float metrics of RegionalData held by the cube
+CUBE_METRICS = [
+    "num_words",
+    "rauh_sents_share",
+    "rauh_sents_av",
+    "happiness_share",
+    "happiness_av",
+    "val_share",
+    "val_av",
+]
+
+
+class TimeSeriesCube:
+    """
+    Dense regions x days snapshot of RegionalData.
+
+    Each metric is a float32 array of shape (regions, days); ``present``
+    marks the cells that have a row in the database. Days run contiguously
+    from the first to the last published date.
+    """
+
+    def __init__(self, key, region_ids, region_names, first_day, present, values):
+        self.key = key
+        self.region_ids = region_ids
+        self.region_names = region_names
+        self.region_index = {rid: i for i, rid in enumerate(region_ids.tolist())}
+        self.first_day = first_day
+        self.present = present
+        self.values = values
+        self.days = first_day + np.arange(present.shape[1])
+        self._midnights = self.days.astype("datetime64[us]")
+        self._day_strings = np.datetime_as_string(self.days)
+
+    @classmethod
+    def load(cls, key):
+        """Reads all regions and regional data into a new cube."""
+        region_rows = db.session.execute(
+            select(Regions.region_id, Regions.region_name).order_by(Regions.region_id)
+        ).all()
+        region_ids = np.array([rid for rid, _ in region_rows], dtype=np.int64)
+        region_names = {rid: name for rid, name in region_rows}
+
+        columns = [getattr(RegionalData, m) for m in CUBE_METRICS]
+        rows = db.session.execute(
+            select(RegionalData.region_id, RegionalData.item_date_published, *columns)
+        ).all()
+
+        if rows:
+            region_col, day_col, *metric_cols = zip(*rows)
+            days = np.array(day_col, dtype="datetime64[D]")
+            first_day = days.min()
+            num_days = int((days.max() - first_day).astype(int)) + 1
+        else:
+            region_col, days, metric_cols = (), np.array([], dtype="datetime64[D]"), []
+            first_day = np.datetime64(date.today(), "D")
+            num_days = 0
+
+        lookup = {rid: i for i, rid in enumerate(region_ids.tolist())}
+        row_idx = np.array([lookup.get(rid, -1) for rid in region_col], dtype=np.int64)
+        col_idx = (days - first_day).astype(np.int64)
+        known = row_idx >= 0
+        row_idx, col_idx = row_idx[known], col_idx[known]
+
+        shape = (len(region_ids), num_days)
+        present = np.zeros(shape, dtype=bool)
+        present[row_idx, col_idx] = True
+        values = {}
+        for metric, col in zip(CUBE_METRICS, metric_cols):
+            grid = np.full(shape, np.nan, dtype=np.float32)
+            grid[row_idx, col_idx] = np.array(col, dtype=np.float64)[known]
+            values[metric] = grid
+        return cls(key, region_ids, region_names, first_day, present, values)
+
+    def latest_day(self) -> datetime | None:
+        """Midnight of the last date with data, or None if the cube is empty."""
+        if not len(self.days):
+            return None
+        return self.days[-1].astype("datetime64[us]").item()
+
+    def day_range(self, start: datetime, end: datetime) -> slice:
+        """Column slice of the days d with start <= d (midnight) <= end."""
+        lo = np.searchsorted(self._midnights, np.datetime64(start, "us"), side="left")
+        hi = np.searchsorted(self._midnights, np.datetime64(end, "us"), side="right")
+        return slice(int(lo), int(hi))
+
+    def day_column(self, day) -> int | None:
+        """Column of one date, or None if it is outside the cube."""
+        idx = int((np.datetime64(day, "D") - self.first_day).astype(int))
+        if 0 <= idx < len(self.days):
+            return idx
+        return None
+
+    def series(self, region_id: int, metrics: list, start: datetime,
+               end: datetime) -> tuple:
+        """
+        Stored rows of one region between start and end.
+
+        Returns:
+            tuple: (dates as ISO strings, {metric: list of values}) with
+            NaN values returned as None.
+        """
+        row = self.region_index.get(region_id)
+        if row is None:
+            return [], {m: [] for m in metrics}
+        days = self.day_range(start, end)
+        mask = self.present[row, days]
+        dates = self._day_strings[days][mask].tolist()
+        return dates, {
+            m: to_python_floats(self.values[m][row, days][mask]) for m in metrics
+        }
+
+    def block(self, region_ids: list, metrics: list, start: datetime,
+              end: datetime) -> tuple:
+        """
+        Several regions between start and end on one shared date axis.
+
+        Returns:
+            tuple: (ids of the regions with rows in the range, ISO dates
+            with a row for any of them, {metric: float32 array of shape
+            (regions, dates)}) with NaN where a region has no row.
+        """
+        rows = np.array([self.region_index[rid] for rid in region_ids
+                         if rid in self.region_index], dtype=np.int64)
+        days = self.day_range(start, end)
+        present = self.present[rows, days]
+        rows = rows[present.any(axis=1)]
+        keep = np.flatnonzero(present.any(axis=0)) + days.start
+        return self.region_ids[rows].tolist(), self._day_strings[keep].tolist(), {
+            m: self.values[m][np.ix_(rows, keep)] for m in metrics
+        }
+
+    def day_values(self, metric: str, day) -> dict:
+        """region_id -> value of one metric on one date."""
+        col = self.day_column(day)
+        if col is None:
+            return {}
+        mask = self.present[:, col]
+        return dict(zip(
+            self.region_ids[mask].tolist(),
+            to_python_floats(self.values[metric][mask, col]),
+        ))
+
+
+class CubeStore:
+    """
+    Holds the cube of the current database and data generation; a new
+    ingest (or a different database) triggers a reload on next access.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._cube = None
+
+    def get(self) -> TimeSeriesCube | None:
+        """Returns the current cube, or None if TIMESERIES_CUBE is off."""
+        if not current_app.config.get("TIMESERIES_CUBE", True):
+            return None
+        key = (str(db.engine.url), current_generation())
+        cube = self._cube
+        if cube is None or cube.key != key:
+            with self._lock:
+                cube = self._cube
+                if cube is None or cube.key != key:
+                    cube = TimeSeriesCube.load(key)
+                    self._cube = cube
+        return cube
+
+    def clear(self):
+        with self._lock:
+            self._cube = None
+
+
+cube_store = CubeStore()
+
+
+def to_python_floats(values: np.ndarray) -> list:
+    """
+    Converts float32 values to Python floats rounded to 7 significant
+    digits, the precision float32 holds (0.1, not 0.10000000149), with NaN
+    as None.
+    """
+    floats = values.astype(np.float64)
+    nonzero = np.isfinite(floats) & (floats != 0)
+    magnitude = np.floor(np.log10(np.abs(floats, where=nonzero, out=np.ones_like(floats))))
+    scale = 10.0 ** (6 - magnitude)
+    floats = np.round(floats * scale) / scale
+    if not np.isnan(floats).any():
+        return floats.tolist()
+    return [None if v != v else v for v in floats.tolist()]
@@ -0,0 +1,131 @@
+from collections import defaultdict
+import numpy as np
+from shapely.geometry import MultiPolygon, Polygon
+
+
+def build_topology(region_ids: list, geometries: list,
+                   quantization: int = 100000) -> tuple:
+    """
+    Builds a quantized, delta-encoded TopoJSON topology from polygons.
+
+    Coordinates are snapped to a ``quantization`` x ``quantization`` grid,
+    rings are cut at junctions (points where more than two boundary edges
+    meet) and every arc is stored once, so an edge shared by two regions
+    is encoded a single time and referenced from both sides.
+
+    Args:
+        region_ids (list): Identifier of each geometry, kept in the output.
+        geometries (list): Shapely Polygons / MultiPolygons.
+        quantization (int): Number of grid steps along each axis.
+
+    Returns:
+        tuple: (transform, arcs, objects) where ``objects`` is a list of
+        ``(region_id, geometry_dict)`` without properties.
+    """
+    bounds = np.array([g.bounds for g in geometries if not g.is_empty])
+    minx, miny = bounds[:, 0].min(), bounds[:, 1].min()
+    maxx, maxy = bounds[:, 2].max(), bounds[:, 3].max()
+    kx = (maxx - minx) / (quantization - 1) or 1.0
+    ky = (maxy - miny) / (quantization - 1) or 1.0
+    transform = {"scale": [kx, ky], "translate": [minx, miny]}
+
+    # 1) Quantize every ring
+    shapes = []
+    for geom in geometries:
+        polygons = []
+        for polygon in _polygons(geom):
+            rings = [_quantize(ring.coords, minx, miny, kx, ky)
+                     for ring in (polygon.exterior, *polygon.interiors)]
+            rings = [ring for ring in rings if len(ring) >= 4]
+            if rings:
+                polygons.append(rings)
+        shapes.append(polygons)
+
+    # 2) Junctions: points with more than two distinct neighbours
+    neighbours = defaultdict(set)
+    for polygons in shapes:
+        for rings in polygons:
+            for ring in rings:
+                for a, b in zip(ring, ring[1:]):
+                    neighbours[a].add(b)
+                    neighbours[b].add(a)
+    junctions = {point for point, adjacent in neighbours.items() if len(adjacent) > 2}
+
+    # 3) Cut rings into arcs and store each arc once
+    arcs = []
+    arc_index = {}
+
+    def arc_ref(points: tuple) -> int:
+        ref = arc_index.get(points)
+        if ref is not None:
+            return ref
+        ref = arc_index.get(points[::-1])
+        if ref is not None:
+            return ~ref
+        arc_index[points] = len(arcs)
+        arcs.append(points)
+        return len(arcs) - 1
+
+    objects = []
+    for region_id, polygons in zip(region_ids, shapes):
+        encoded = [[[arc_ref(arc) for arc in _cut_ring(ring, junctions)]
+                    for ring in rings] for rings in polygons]
+        if not encoded:
+            geometry = {"type": None}
+        elif len(encoded) == 1:
+            geometry = {"type": "Polygon", "arcs": encoded[0]}
+        else:
+            geometry = {"type": "MultiPolygon", "arcs": encoded}
+        objects.append((region_id, geometry))
+
+    return transform, [_delta_encode(arc) for arc in arcs], objects
+
+
+def _polygons(geom) -> list:
+    if isinstance(geom, Polygon):
+        return [] if geom.is_empty else [geom]
+    if isinstance(geom, MultiPolygon):
+        return list(geom.geoms)
+    return []
+
+
+def _quantize(coords, minx, miny, kx, ky) -> tuple:
+    """Snap ring coordinates to the grid, dropping repeated points."""
+    points = np.asarray(coords)[:, :2]
+    grid = np.column_stack((
+        np.round((points[:, 0] - minx) / kx),
+        np.round((points[:, 1] - miny) / ky),
+    )).astype(np.int64)
+    keep = np.ones(len(grid), dtype=bool)
+    keep[1:] = np.any(grid[1:] != grid[:-1], axis=1)
+    ring = tuple(map(tuple, grid[keep].tolist()))
+    if ring and ring[0] != ring[-1]:
+        ring += ring[:1]
+    return ring
+
+
+def _cut_ring(ring: tuple, junctions: set) -> list:
+    """
+    Split a closed ring into arcs at its junctions.
+
+    A ring without junctions becomes one arc starting at its smallest
+    point, so identical rings of two regions map onto the same arc.
+    """
+    body = ring[:-1]
+    cuts = [i for i, point in enumerate(body) if point in junctions]
+    if not cuts:
+        start = body.index(min(body))
+        rotated = body[start:] + body[:start]
+        return [rotated + rotated[:1]]
+
+    start = cuts[0]
+    rotated = body[start:] + body[:start] + body[start:start + 1]
+    offsets = [i - start for i in cuts] + [len(body)]
+    return [rotated[a:b + 1] for a, b in zip(offsets, offsets[1:])]
+
+
+def _delta_encode(points: tuple) -> list:
+    encoded = [list(points[0])]
+    for (x0, y0), (x1, y1) in zip(points, points[1:]):
+        encoded.append([x1 - x0, y1 - y0])
+    return encoded
@@ -0,0 +1,98 @@
+import math
+import threading
+from collections import OrderedDict
+import mapbox_vector_tile
+import shapely
+from flask import current_app
+from app import geometry_registry
+from app.services.geometry import MERCATOR_RADIUS
+
+MVT_MIMETYPE = "application/vnd.mapbox-vector-tile"
+LAYER_NAME = "regions"
+
+# Tile coordinate space and the margin kept around each tile, so polygon
+# edges do not show seams at tile borders
+EXTENT = 4096
+BUFFER = 64
+
+WORLD_HALF = math.pi * MERCATOR_RADIUS
+
+
+class TileCache:
+    """Thread-safe LRU cache of encoded tiles, sized by TILE_CACHE_SIZE."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tiles = OrderedDict()
+
+    def get(self, key):
+        with self._lock:
+            tile = self._tiles.get(key)
+            if tile is not None:
+                self._tiles.move_to_end(key)
+            return tile
+
+    def put(self, key, tile: bytes):
+        maxsize = current_app.config.get("TILE_CACHE_SIZE", 4096)
+        with self._lock:
+            self._tiles[key] = tile
+            self._tiles.move_to_end(key)
+            while len(self._tiles) > maxsize:
+                self._tiles.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._tiles.clear()
+
+
+tile_cache = TileCache()
+
+
+def tile_bounds(z: int, x: int, y: int) -> tuple:
+    """Web Mercator bounds (minx, miny, maxx, maxy) of an XYZ tile."""
+    size = 2 * WORLD_HALF / 2 ** z
+    minx = -WORLD_HALF + x * size
+    maxy = WORLD_HALF - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+def render_tile(z: int, x: int, y: int, values: dict, names: dict) -> bytes:
+    """
+    Encodes the regions intersecting one tile as a Mapbox Vector Tile.
+
+    Geometry comes from the coarsest registry level that is still accurate
+    to about one pixel at zoom ``z``, clipped to the tile plus a small
+    buffer and quantized to the tile extent.
+
+    Args:
+        values (dict): region_id -> metric value.
+        names (dict): region_id -> region name.
+
+    Returns:
+        bytes: The encoded tile, empty if no region intersects it.
+    """
+    level = geometry_registry.level_for(zoom=z)
+    region_ids, geoms, tree = geometry_registry.mercator_index(level)
+
+    bounds = tile_bounds(z, x, y)
+    pad = (bounds[2] - bounds[0]) * BUFFER / EXTENT
+    clip = (bounds[0] - pad, bounds[1] - pad, bounds[2] + pad, bounds[3] + pad)
+
+    features = []
+    for idx in tree.query(shapely.box(*clip)):
+        clipped = shapely.clip_by_rect(geoms[idx], *clip)
+        if clipped.is_empty:
+            continue
+        rid = region_ids[idx]
+        properties = {"region_id": rid, "NAME": names.get(rid, "Unknown")}
+        value = values.get(rid, 0)
+        if value is not None:
+            properties["value"] = value
+        features.append({"geometry": clipped, "id": rid, "properties": properties})
+
+    if not features:
+        return b""
+    return mapbox_vector_tile.encode(
+        [{"name": LAYER_NAME, "features": features}],
+        default_options={"quantize_bounds": bounds, "extents": EXTENT},
+    )
@@ -0,0 +1,128 @@
+"""
+Read throughput of the API while an ingest rewrites the database.
+
+Loads DATA_FOLDER into a scratch SQLite database, then measures SQL-bound
+/api/trends/regional requests from several reader threads, first on an
+idle database and then while a full re-ingest runs in another process.
+The tuned profile (the SQLITE_PRAGMAS / SQLITE_READ_POOL defaults) is
+compared with SQLite's defaults.
+
+Usage (from backend/):
+    python benchmarks/read_during_ingest.py ../data [--readers 4] [--seconds 5]
+"""
+import argparse
+import multiprocessing
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from app import create_app, db  # noqa: E402
+from app.config import Config  # noqa: E402
+from app.models.data_models import Regions  # noqa: E402
+
+PROFILES = {
+    "sqlite-defaults": {"SQLITE_PRAGMAS": {"journal_mode": "DELETE", "synchronous": "FULL"},
+                        "SQLITE_READ_POOL": False},
+    "tuned": {"SQLITE_PRAGMAS": Config.SQLITE_PRAGMAS, "SQLITE_READ_POOL": True},
+}
+
+
+def make_app(workdir, profile):
+    return create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{os.path.join(workdir, 'bench.sqlite')}",
+        "PROCESSED_GEOJSON": os.path.join(workdir, "regions.geojson"),
+        # Measure the database, not the in-memory caches in front of it
+        "RESPONSE_CACHE_BACKEND": "none",
+        "TIMESERIES_CUBE": False,
+        **PROFILES[profile],
+    })
+
+
+def run_ingest(workdir, profile, data_folder):
+    app = make_app(workdir, profile)
+    with app.app_context():
+        from app.services.data_ingestion import ingest
+        ingest(data_folder)
+
+
+def read_load(app, region_ids, readers, stop):
+    """Runs reader threads until ``stop`` is set; returns (latencies, errors)."""
+    latencies, errors = [], []
+    lock = threading.Lock()
+
+    def reader(seed):
+        rng = random.Random(seed)
+        client = app.test_client()
+        while not stop.is_set():
+            regions = ",".join(str(r) for r in rng.sample(region_ids, 3))
+            year = rng.choice((2019, 2020, 2021))
+            started = time.perf_counter()
+            resp = client.get(f"/api/trends/regional?regions={regions}"
+                              f"&from={year}-01-01&to={year}-06-30")
+            elapsed = time.perf_counter() - started
+            with lock:
+                (latencies if resp.status_code == 200 else errors).append(elapsed)
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(readers)]
+    for t in threads:
+        t.start()
+    return threads, latencies, errors
+
+
+def report(label, duration, latencies, errors):
+    latencies = sorted(latencies)
+    p95 = latencies[int(len(latencies) * 0.95)] * 1000 if latencies else float("nan")
+    worst = latencies[-1] * 1000 if latencies else float("nan")
+    print(f"  {label:<14} {len(latencies) / duration:8.1f} req/s   "
+          f"p95 {p95:8.1f} ms   max {worst:8.1f} ms   errors {len(errors)}")
+
+
+def bench(profile, data_folder, readers, seconds):
+    with tempfile.TemporaryDirectory() as workdir:
+        app = make_app(workdir, profile)
+        with app.app_context():
+            db.create_all()
+        run_ingest(workdir, profile, data_folder)
+        with app.app_context():
+            region_ids = [rid for (rid,) in db.session.query(Regions.region_id)]
+
+        print(profile)
+        stop = threading.Event()
+        threads, latencies, errors = read_load(app, region_ids, readers, stop)
+        time.sleep(seconds)
+        stop.set()
+        for t in threads:
+            t.join()
+        report("idle", seconds, latencies, errors)
+
+        ctx = multiprocessing.get_context("spawn")
+        writer = ctx.Process(target=run_ingest, args=(workdir, profile, data_folder))
+        stop = threading.Event()
+        started = time.perf_counter()
+        writer.start()
+        threads, latencies, errors = read_load(app, region_ids, readers, stop)
+        writer.join()
+        stop.set()
+        for t in threads:
+            t.join()
+        report("during ingest", time.perf_counter() - started, latencies, errors)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("data_folder")
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--seconds", type=float, default=5.0,
+                        help="Duration of the idle measurement.")
+    args = parser.parse_args()
+    for profile in PROFILES:
+        bench(profile, os.path.abspath(args.data_folder), args.readers, args.seconds)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Add weekly/monthly/yearly rollup tables
+
+Revision ID: 5e1a8f3b6c92
+Revises: 9c4e7b2a1d58
+Create Date: 2026-10-18 15:40:27.915204
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '5e1a8f3b6c92'
+down_revision = '9c4e7b2a1d58'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('global_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(), nullable=False),
+    sa.Column('period', sa.String(), nullable=False),
+    sa.Column('period_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('value_sum', sa.Float(), nullable=True),
+    sa.Column('value_mean', sa.Float(), nullable=True),
+    sa.Column('value_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('global_rollups', schema=None) as batch_op:
+        batch_op.create_index('ux_global_rollups_country_period_metric', ['country', 'period', 'metric', 'period_start'], unique=True)
+
+    op.create_table('regional_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('region_id', sa.Integer(), nullable=False),
+    sa.Column('period', sa.String(), nullable=False),
+    sa.Column('period_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('metric', sa.String(), nullable=False),
+    sa.Column('value_sum', sa.Float(), nullable=True),
+    sa.Column('value_mean', sa.Float(), nullable=True),
+    sa.Column('value_count', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['region_id'], ['regions.region_id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    with op.batch_alter_table('regional_rollups', schema=None) as batch_op:
+        batch_op.create_index('ux_regional_rollups_region_period_metric', ['region_id', 'period', 'metric', 'period_start'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('regional_rollups', schema=None) as batch_op:
+        batch_op.drop_index('ux_regional_rollups_region_period_metric')
+
+    op.drop_table('regional_rollups')
+    with op.batch_alter_table('global_rollups', schema=None) as batch_op:
+        batch_op.drop_index('ux_global_rollups_country_period_metric')
+
+    op.drop_table('global_rollups')
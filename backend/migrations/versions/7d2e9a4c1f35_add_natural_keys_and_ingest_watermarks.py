@@ -0,0 +1,53 @@
+"""Add natural-key unique indexes and ingest watermarks
+
+Revision ID: 7d2e9a4c1f35
+Revises: 3b8f1c2d4a67
+Create Date: 2026-10-18 14:21:47.503118
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '7d2e9a4c1f35'
+down_revision = '3b8f1c2d4a67'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Drop duplicate natural keys (keeping the latest row) so the unique
+    # indexes can be built on existing databases
+    op.execute(
+        "DELETE FROM regional_data WHERE id NOT IN ("
+        "SELECT MAX(id) FROM regional_data "
+        "GROUP BY region_id, item_date_published)"
+    )
+    op.execute(
+        "DELETE FROM global_stats WHERE id NOT IN ("
+        "SELECT MAX(id) FROM global_stats "
+        "GROUP BY country, item_date_published)"
+    )
+
+    op.create_table('ingest_watermarks',
+    sa.Column('table_name', sa.String(), nullable=False),
+    sa.Column('high_watermark', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('table_name')
+    )
+    with op.batch_alter_table('global_stats', schema=None) as batch_op:
+        batch_op.create_index('ux_global_stats_country_date', ['country', 'item_date_published'], unique=True)
+
+    with op.batch_alter_table('regional_data', schema=None) as batch_op:
+        batch_op.create_index('ux_regional_data_region_date', ['region_id', 'item_date_published'], unique=True)
+
+
+def downgrade():
+    with op.batch_alter_table('regional_data', schema=None) as batch_op:
+        batch_op.drop_index('ux_regional_data_region_date')
+
+    with op.batch_alter_table('global_stats', schema=None) as batch_op:
+        batch_op.drop_index('ux_global_stats_country_date')
+
+    op.drop_table('ingest_watermarks')
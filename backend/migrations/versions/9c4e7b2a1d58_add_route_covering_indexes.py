@@ -0,0 +1,46 @@
+"""Add composite and covering indexes for the API queries
+
+Revision ID: 9c4e7b2a1d58
+Revises: 7d2e9a4c1f35
+Create Date: 2026-10-18 15:02:11.284730
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9c4e7b2a1d58'
+down_revision = '7d2e9a4c1f35'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    with op.batch_alter_table('global_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_global_stats_country')
+        batch_op.drop_index('ix_global_stats_item_date_published')
+        batch_op.create_index('ix_global_stats_date_covering', ['item_date_published', 'country', 'av_sents', 'num_news', 'num_feeds', 'num_newspaper'], unique=False)
+
+    with op.batch_alter_table('regional_data', schema=None) as batch_op:
+        batch_op.drop_index('ix_regional_data_item_date_published')
+        batch_op.drop_index('ix_regional_data_region_id')
+        batch_op.create_index('ix_regional_data_date_region', ['item_date_published', 'region_id', 'rauh_sents_av', 'happiness_av', 'val_av'], unique=False)
+
+    with op.batch_alter_table('regions', schema=None) as batch_op:
+        batch_op.create_index(batch_op.f('ix_regions_region_name'), ['region_name'], unique=False)
+
+
+def downgrade():
+    with op.batch_alter_table('regions', schema=None) as batch_op:
+        batch_op.drop_index(batch_op.f('ix_regions_region_name'))
+
+    with op.batch_alter_table('regional_data', schema=None) as batch_op:
+        batch_op.drop_index('ix_regional_data_date_region')
+        batch_op.create_index(batch_op.f('ix_regional_data_region_id'), ['region_id'], unique=False)
+        batch_op.create_index(batch_op.f('ix_regional_data_item_date_published'), ['item_date_published'], unique=False)
+
+    with op.batch_alter_table('global_stats', schema=None) as batch_op:
+        batch_op.drop_index('ix_global_stats_date_covering')
+        batch_op.create_index(batch_op.f('ix_global_stats_item_date_published'), ['item_date_published'], unique=False)
+        batch_op.create_index(batch_op.f('ix_global_stats_country'), ['country'], unique=False)
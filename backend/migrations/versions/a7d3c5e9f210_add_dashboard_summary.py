@@ -0,0 +1,39 @@
+"""Add dashboard summary and daily counters
+
+Revision ID: a7d3c5e9f210
+Revises: 5e1a8f3b6c92
+Create Date: 2026-10-18 16:12:53.407611
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'a7d3c5e9f210'
+down_revision = '5e1a8f3b6c92'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table('daily_counters',
+    sa.Column('day', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('num_news', sa.Integer(), nullable=False),
+    sa.Column('av_sents', sa.Float(), nullable=True),
+    sa.PrimaryKeyConstraint('day')
+    )
+    op.create_table('dashboard_summary',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('total_news', sa.BigInteger(), nullable=False),
+    sa.Column('last_update', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('channels_count', sa.Integer(), nullable=False),
+    sa.Column('sources_count', sa.Integer(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('(CURRENT_TIMESTAMP)'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+
+
+def downgrade():
+    op.drop_table('dashboard_summary')
+    op.drop_table('daily_counters')
@@ -0,0 +1,119 @@
+from datetime import datetime, timedelta
+
+import geopandas as gpd
+import pandas as pd
+import pytest
+from shapely.geometry import box
+
+from app import create_app, db
+from app.models.data_models import GlobalStats, RegionalData, Regions
+from app.services.dashboard_summary import refresh_summary
+from app.services.rollups import rebuild_rollups
+
+START_DATE = datetime(2025, 4, 1)
+NUM_DAYS = 5
+
+
+@pytest.fixture
+def app(tmp_path):
+    shp_dir = tmp_path / "shapefiles"
+    shp_dir.mkdir()
+    gpd.GeoDataFrame(
+        {"ROR1217": [101.0, 102.0]},
+        geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1)],
+        crs="EPSG:4326"
+    ).to_file(str(shp_dir / "regions.shp"))
+
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'test.sqlite'}",
+        "RAW_SHP_DIR": str(shp_dir),
+        "REGIONS_SHAPEFILE": str(shp_dir / "regions.shp"),
+        "PROCESSED_GEOJSON": str(tmp_path / "processed" / "regions.geojson"),
+        # Route tests compare fresh responses; tests/test_response_cache.py
+        # covers the cache itself
+        "RESPONSE_CACHE_BACKEND": "none",
+        "INGEST_CACHE_DIR": str(tmp_path / "ingest_cache"),
+    })
+
+    with app.app_context():
+        db.create_all()
+        _seed()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def data_folder(tmp_path):
+    """Raw input files in the layout expected by ingest()."""
+    folder = tmp_path / "raw"
+    folder.mkdir()
+    pd.DataFrame({
+        "Region": [101, 102],
+        "ROR.NAME": [" Mitte", "Nord "],
+        "Country": ["Germany", "Germany"],
+    }).to_excel(folder / "region_names.xlsx", index=False)
+
+    dates = [(START_DATE + timedelta(days=d)).date().isoformat() for d in range(NUM_DAYS)]
+    regional = pd.DataFrame([{
+        "Region": region_id,
+        "Country": "Deutschland",
+        "item_date_published": day,
+        "num_words": 100.0,
+        "rauh_sents_share": 0.1,
+        "rauh_sents_av": region_id / 1000 + d,
+        "Happiness_share": 0.2,
+        "Happiness_av": 0.3,
+        "Val_share": 0.4,
+        "Val_av": 0.5,
+        "num_papers": 2,
+        "num_news": 10 + d,
+    } for d, day in enumerate(dates) for region_id in (101, 102)])
+    regional.to_csv(folder / "Regional_news.csv", index=False)
+
+    lines = ['"Country";"item_date_published";"num.newspaper";"num.feeds";"av.sents";"num.news"']
+    for d, day in enumerate(dates):
+        lines.append(f'"{d + 1}";"Deutschland";{day};20;30;{0.01 * d};{100 + d}')
+    (folder / "global.stats.csv").write_text("\n".join(lines) + "\n", encoding="utf-8")
+    return folder
+
+
+def _seed():
+    db.session.add_all([
+        Regions(region_id=101, region_name="Mitte", country="Germany"),
+        Regions(region_id=102, region_name="Nord", country="Germany"),
+    ])
+    for day in range(NUM_DAYS):
+        published = START_DATE + timedelta(days=day)
+        for region_id in (101, 102):
+            db.session.add(RegionalData(
+                region_id=region_id,
+                item_date_published=published,
+                num_words=100.0,
+                rauh_sents_share=0.1 * day,
+                rauh_sents_av=region_id / 1000 + day,
+                happiness_share=0.2,
+                happiness_av=0.3 + day,
+                val_share=0.4,
+                val_av=0.5 + day,
+                num_papers=2,
+                num_news=10 + day,
+            ))
+        db.session.add(GlobalStats(
+            country="Deutschland",
+            item_date_published=published,
+            num_newspaper=20,
+            num_feeds=30,
+            av_sents=0.01 * day,
+            num_news=100 + day,
+        ))
+    db.session.commit()
+    rebuild_rollups()
+    refresh_summary()
+    db.session.commit()
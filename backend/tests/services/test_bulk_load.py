@@ -0,0 +1,95 @@
+import math
+import os
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import inspect
+
+from app import create_app, db
+from app.models.data_models import RegionalData, RegionalRollup
+from app.services.bulk_load import bulk_insert, dropped_indexes
+
+# e.g. postgresql+psycopg2://postgres@localhost/sentiment_test
+POSTGRES_URL = os.environ.get("TEST_POSTGRES_URL")
+
+
+def _rows():
+    return pd.DataFrame({
+        "region_id": [101, 102],
+        "item_date_published": [datetime(2025, 5, 1), datetime(2025, 5, 1, 12, 30)],
+        "num_words": [1200.0, 800.0],
+        "rauh_sents_share": [0.25, float("nan")],
+        "rauh_sents_av": [0.1, 0.2],
+        "happiness_share": [0.3, 0.4],
+        "happiness_av": [0.5, 0.6],
+        "val_share": [0.7, 0.8],
+        "val_av": [0.9, 1.0],
+        "num_papers": [3, 4],
+        "num_news": [10, 20],
+    })
+
+
+def _assert_loaded():
+    row = db.session.execute(
+        db.select(RegionalData).filter_by(region_id=101,
+                                          item_date_published=datetime(2025, 5, 1))
+    ).scalar_one()
+    assert row.num_words == 1200.0
+    assert row.num_news == 10
+    other = db.session.execute(
+        db.select(RegionalData).filter_by(region_id=102,
+                                          item_date_published=datetime(2025, 5, 1, 12, 30))
+    ).scalar_one()
+    assert other.rauh_sents_share is None
+    assert math.isclose(other.val_av, 1.0)
+
+
+def test_sqlite_insert_matches_orm_storage(app):
+    bulk_insert(RegionalData.__table__, _rows())
+    db.session.commit()
+    # Equality filters compare against the stored datetime strings
+    _assert_loaded()
+
+
+def test_empty_frame_is_a_noop(app):
+    before = db.session.query(RegionalData).count()
+    bulk_insert(RegionalData.__table__, _rows().iloc[:0])
+    assert db.session.query(RegionalData).count() == before
+
+
+def test_dropped_indexes_are_rebuilt(app):
+    table = RegionalRollup.__table__
+
+    def names():
+        return {ix["name"] for ix in inspect(db.session.connection()).get_indexes(table.name)}
+
+    assert "ux_regional_rollups_region_period_metric" in names()
+    with dropped_indexes(table):
+        assert "ux_regional_rollups_region_period_metric" not in names()
+    assert "ux_regional_rollups_region_period_metric" in names()
+
+
+@pytest.mark.skipif(not POSTGRES_URL, reason="TEST_POSTGRES_URL is not set")
+def test_postgres_copy_round_trip():
+    app = create_app({
+        "TESTING": True,
+        "SQLALCHEMY_DATABASE_URI": POSTGRES_URL,
+        "RESPONSE_CACHE_BACKEND": "none",
+    })
+    with app.app_context():
+        db.drop_all()
+        db.create_all()
+        try:
+            from app.models.data_models import Regions
+            db.session.add_all([
+                Regions(region_id=101, region_name="Nord", country="Germany"),
+                Regions(region_id=102, region_name="Ost", country="Germany"),
+            ])
+            db.session.flush()
+            bulk_insert(RegionalData.__table__, _rows())
+            db.session.commit()
+            _assert_loaded()
+        finally:
+            db.session.remove()
+            db.drop_all()
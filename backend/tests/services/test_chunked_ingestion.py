@@ -0,0 +1,196 @@
+import os
+from datetime import datetime
+
+import pandas as pd
+import pytest
+from sqlalchemy import func, inspect, select
+
+from app import db
+from app.models.data_models import GlobalStats, IngestWatermark, RegionalData, Regions
+from app.services.data_generation import current_generation
+from app.services.data_ingestion import ingest
+from app.services.pipeline import data_readers
+from app.services.pipeline.data_readers import (
+    line_ranges,
+    read_global_stats,
+    read_range,
+    read_regional_news,
+)
+
+
+def _snapshot():
+    regional = db.session.execute(
+        select(RegionalData.region_id, RegionalData.item_date_published,
+               RegionalData.rauh_sents_av, RegionalData.num_news)
+        .order_by(RegionalData.region_id, RegionalData.item_date_published)
+    ).all()
+    global_rows = db.session.execute(
+        select(GlobalStats.country, GlobalStats.item_date_published, GlobalStats.num_news)
+        .order_by(GlobalStats.item_date_published)
+    ).all()
+    return regional, global_rows
+
+
+@pytest.mark.parametrize("chunksize, workers", [(0, 1), (1, 1), (3, 1), (3, 2)])
+def test_chunked_ingest_matches_full_load(app, data_folder, chunksize, workers):
+    app.config["INGEST_BATCH_SIZE"] = 2
+    generation = current_generation()
+
+    ingest(str(data_folder), chunksize=chunksize, workers=workers)
+    regional, global_rows = _snapshot()
+
+    assert db.session.scalar(select(func.count()).select_from(Regions)) == 2
+    assert db.session.get(Regions, 101).region_name == "Mitte"
+    assert len(regional) == 10
+    assert regional[0].rauh_sents_av == pytest.approx(0.101)
+    assert [row.num_news for row in global_rows] == [100, 101, 102, 103, 104]
+    assert current_generation() == generation + 1
+
+
+def test_incremental_ingest_upserts_only_recent_changes(app, data_folder):
+    app.config["INGEST_LOOKBACK_DAYS"] = 1
+    ingest(str(data_folder))
+    ids_before = dict(db.session.execute(
+        select(RegionalData.item_date_published, RegionalData.id)
+        .where(RegionalData.region_id == 101)
+    ).all())
+
+    csv_path = data_folder / "Regional_news.csv"
+    df = pd.read_csv(csv_path)
+    # A correction outside the lookback window is ignored, one inside it
+    # is applied, and a new day is appended
+    df.loc[(df.Region == 101) & (df.item_date_published == "2025-04-01"), "num_news"] = 999
+    df.loc[(df.Region == 101) & (df.item_date_published == "2025-04-04"), "num_news"] = 777
+    new_day = df[df.item_date_published == "2025-04-05"].assign(item_date_published="2025-04-06")
+    pd.concat([df, new_day]).to_csv(csv_path, index=False)
+
+    ingest(str(data_folder), incremental=True)
+
+    rows = dict(db.session.execute(
+        select(RegionalData.item_date_published, RegionalData.num_news)
+        .where(RegionalData.region_id == 101)
+    ).all())
+    assert len(rows) == 6
+    assert rows[datetime(2025, 4, 1)] == 10
+    assert rows[datetime(2025, 4, 4)] == 777
+    assert rows[datetime(2025, 4, 6)] == 14
+    # Existing rows were updated in place, not reinserted
+    ids_after = dict(db.session.execute(
+        select(RegionalData.item_date_published, RegionalData.id)
+        .where(RegionalData.region_id == 101)
+    ).all())
+    assert all(ids_after[day] == row_id for day, row_id in ids_before.items())
+
+    mark = db.session.get(IngestWatermark, "regional_data")
+    assert mark.high_watermark.replace(tzinfo=None) == datetime(2025, 4, 6)
+
+
+def test_full_reload_keeps_serving_old_data_until_swap(app, client, data_folder, monkeypatch):
+    import app.services.data_ingestion as data_ingestion
+
+    ingest(str(data_folder))
+    csv_path = data_folder / "Regional_news.csv"
+    df = pd.read_csv(csv_path)
+    df["num_news"] = 1
+    df.to_csv(csv_path, index=False)
+
+    seen = {}
+    original = data_ingestion.build_shadow_indexes
+
+    def check_live_data(shadow):
+        # The reload is fully loaded into the shadow tables by now
+        response = client.get("/api/regions/region/101?metrics=sentiment_mean")
+        seen["status"] = response.status_code
+        seen["live_news"] = db.session.scalar(select(func.sum(RegionalData.num_news)))
+        original(shadow)
+
+    monkeypatch.setattr(data_ingestion, "build_shadow_indexes", check_live_data)
+    ingest(str(data_folder))
+
+    assert seen == {"status": 200, "live_news": 120}
+    assert db.session.scalar(select(func.sum(RegionalData.num_news))) == 10
+    indexes = {ix["name"] for ix in inspect(db.engine).get_indexes("regional_data")}
+    assert "ux_regional_data_region_date" in indexes
+    assert not any(name.startswith("_shadow_") for name in indexes)
+
+
+def test_line_ranges_split_data_lines(data_folder):
+    path = data_folder / "Regional_news.csv"
+    ranges = line_ranges(str(path), 3)
+    assert len(ranges) == 4  # 10 data lines
+
+    chunks = [read_range(read_regional_news, str(path), start, end) for start, end in ranges]
+    assert [len(chunk) for chunk in chunks] == [3, 3, 3, 1]
+    pd.testing.assert_frame_equal(pd.concat(chunks, ignore_index=True),
+                                  read_regional_news(str(path)))
+    assert line_ranges(str(path)) == [(ranges[0][0], ranges[-1][1])]
+
+
+def test_worker_validation_error_aborts_ingest(app, data_folder):
+    csv_path = data_folder / "Regional_news.csv"
+    df = pd.read_csv(csv_path)
+    df.loc[7, "num_news"] = -1
+    df.to_csv(csv_path, index=False)
+
+    with pytest.raises(ValueError):
+        ingest(str(data_folder), chunksize=3, workers=2)
+    # The live tables still hold the seeded data
+    assert db.session.scalar(select(func.count()).select_from(RegionalData)) == 10
+
+
+def test_typed_readers(data_folder):
+    df = read_global_stats(str(data_folder / "global.stats.csv"))
+    assert list(df.columns) == ["Country", "item_date_published", "num.newspaper",
+                                "num.feeds", "av.sents", "num.news"]
+    assert df["item_date_published"].dtype == "datetime64[ns]"
+    assert df["num.news"].dtype == "int64"
+    assert df["Country"].tolist() == ["Deutschland"] * 5
+
+    csv_path = data_folder / "Regional_news.csv"
+    raw = pd.read_csv(csv_path)
+    raw["num_news"] = raw["num_news"].astype(str)
+    raw.loc[3, "num_news"] = "many"
+    raw.to_csv(csv_path, index=False)
+    with pytest.raises(ValueError, match="invalid value 'many'"):
+        read_regional_news(str(csv_path))
+
+
+def test_reingest_of_unchanged_files_skips_parsing(app, data_folder, monkeypatch):
+    cache_dir = app.config["INGEST_CACHE_DIR"]
+    ingest(str(data_folder), chunksize=3, workers=1)
+    entries = sorted(os.listdir(cache_dir))
+    assert [name.rsplit("-", 1)[0] for name in entries] == [
+        "Regional_news.csv", "global.stats.csv", "region_names.xlsx"]
+    assert len(os.listdir(os.path.join(cache_dir, entries[0]))) == 4
+    expected = _snapshot()
+
+    def parse(*args, **kwargs):
+        raise AssertionError("source file parsed again")
+
+    with monkeypatch.context() as m:
+        m.setattr(data_readers.pv, "read_csv", parse)
+        m.setattr(data_readers.pd, "read_excel", parse)
+        ingest(str(data_folder), workers=1)
+    assert _snapshot() == expected
+    assert sorted(os.listdir(cache_dir)) == entries
+
+    # A changed file gets a new entry, replacing the old one
+    csv_path = data_folder / "Regional_news.csv"
+    df = pd.read_csv(csv_path)
+    df["num_news"] = 1
+    df.to_csv(csv_path, index=False)
+    ingest(str(data_folder), workers=1)
+    assert db.session.scalar(select(func.sum(RegionalData.num_news))) == 10
+    current = sorted(os.listdir(cache_dir))
+    assert len(current) == 3 and current[0] != entries[0]
+
+
+def test_failed_ingest_caches_nothing(app, data_folder):
+    csv_path = data_folder / "Regional_news.csv"
+    df = pd.read_csv(csv_path)
+    df.loc[7, "num_news"] = -1
+    df.to_csv(csv_path, index=False)
+
+    with pytest.raises(ValueError):
+        ingest(str(data_folder), workers=1)
+    assert os.listdir(app.config["INGEST_CACHE_DIR"]) == []
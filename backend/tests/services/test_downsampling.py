@@ -0,0 +1,63 @@
+import numpy as np
+import pytest
+
+from app.services.downsampling import (
+    aggregate,
+    downsample,
+    lttb,
+    parse_downsampling,
+    period_start,
+)
+
+
+def test_parse_downsampling():
+    assert parse_downsampling(None, None) == ("day", None)
+    assert parse_downsampling("month", "50") == ("month", 50)
+    for resolution, points in [("quarter", None), ("day", "x"), ("day", "2")]:
+        with pytest.raises(ValueError):
+            parse_downsampling(resolution, points)
+
+
+def test_period_start():
+    dates = np.array(["2025-04-01", "2025-04-06", "2025-04-07", "2025-05-31"],
+                     dtype="datetime64[D]")
+    assert np.datetime_as_string(period_start(dates, "week")).tolist() == [
+        "2025-03-31", "2025-03-31", "2025-04-07", "2025-05-26"]
+    assert np.datetime_as_string(period_start(dates, "month")).tolist() == [
+        "2025-04-01", "2025-04-01", "2025-04-01", "2025-05-01"]
+
+
+def test_aggregate_ignores_missing_values():
+    dates = np.array(["2025-04-01", "2025-04-02", "2025-05-01"], dtype="datetime64[D]")
+    values = np.array([[1.0, np.nan], [3.0, 4.0], [5.0, np.nan]])
+    periods, means = aggregate(dates, values, "month")
+    assert len(periods) == 2
+    assert means[0].tolist() == [2.0, 4.0]
+    assert means[1, 0] == 5.0 and np.isnan(means[1, 1])
+
+
+def test_lttb_keeps_endpoints_and_peaks():
+    x = np.arange(1000, dtype=np.float64)
+    y = np.zeros(1000)
+    y[420] = 10.0
+    y[777] = -7.0
+    keep = lttb(x, y, 20)
+    assert len(keep) == 20
+    assert keep[0] == 0 and keep[-1] == 999
+    assert np.all(np.diff(keep) > 0)
+    assert 420 in keep and 777 in keep
+
+
+def test_downsample_per_series():
+    rows = [
+        {"date": f"2025-04-{day:02d}", "country": country, "sentiment": float(day)}
+        for day in range(1, 31) for country in ("A", "B")
+    ]
+    out = downsample(rows, ["sentiment"], points=5, group_key="country")
+    assert len(out) == 10
+    assert [r["country"] for r in out[:2]] == ["A", "B"]
+    assert out[0]["date"] == "2025-04-01" and out[-1]["date"] == "2025-04-30"
+
+    weekly = downsample(rows, ["sentiment"], "week", group_key="country")
+    assert weekly[0] == {"date": "2025-03-31", "country": "A", "sentiment": 3.5}
+    assert len(weekly) == 10
@@ -0,0 +1,84 @@
+import json
+
+import geopandas as gpd
+import pytest
+from flask import Flask
+from shapely.geometry import box
+
+from app.services.geometry import GeometryRegistry
+
+
+def _write_regions(folder):
+    gdf = gpd.GeoDataFrame(
+        {"ROR1217": [101.0, 102.0]},
+        geometry=[box(0, 0, 1, 1), box(1, 0, 2, 1)],
+        crs="EPSG:4326"
+    )
+    path = folder / "regions.shp"
+    gdf.to_file(str(path))
+    return str(path)
+
+
+def _registry(tmp_path):
+    app = Flask(__name__)
+    app.config["REGIONS_SHAPEFILE"] = _write_regions(tmp_path)
+    return GeometryRegistry(app)
+
+
+def test_registry_loads_lazily(tmp_path):
+    registry = _registry(tmp_path)
+    assert registry._frame is None
+
+    assert set(registry.geometries) == {101, 102}
+    assert registry.geometries[102].equals(box(1, 0, 2, 1))
+
+
+def test_render_feature_collection_splices_values(tmp_path):
+    registry = _registry(tmp_path)
+
+    body = registry.render_feature_collection(
+        {101: 0.5, 102: float("nan")}, {101: "Mitte"}, date="2025-04-01"
+    )
+    collection = json.loads(body)
+
+    assert collection["date"] == "2025-04-01"
+    assert collection["type"] == "FeatureCollection"
+    by_id = {f["id"]: f for f in collection["features"]}
+    assert by_id["101.0"]["properties"] == {"value": 0.5, "NAME": "Mitte"}
+    assert by_id["102.0"]["properties"] == {"value": None, "NAME": "Unknown"}
+    assert by_id["102.0"]["geometry"]["type"] == "Polygon"
+
+
+def test_render_features_defaults_missing_values(tmp_path):
+    registry = _registry(tmp_path)
+
+    features = json.loads(b"[" + registry.render_features({}, {}) + b"]")
+
+    assert [f["properties"]["value"] for f in features] == [0, 0]
+
+
+def test_level_for_picks_coarsest_level_within_tolerance(tmp_path):
+    app = Flask(__name__)
+    app.config["REGIONS_SHAPEFILE"] = _write_regions(tmp_path)
+    app.config["GEOMETRY_TOLERANCES"] = (0.02, 0.005)
+    registry = GeometryRegistry(app)
+
+    assert registry.tolerances == (0.0, 0.005, 0.02)
+    assert registry.level_for() == 0
+    assert registry.level_for(tolerance="0.001") == 0
+    assert registry.level_for(tolerance="0.01") == 1
+    assert registry.level_for(zoom="3") == 2
+    assert registry.level_for(zoom="12") == 0
+    with pytest.raises(ValueError):
+        registry.level_for(zoom="far")
+
+
+def test_simplified_levels_keep_shared_edges(tmp_path):
+    app = Flask(__name__)
+    app.config["REGIONS_SHAPEFILE"] = _write_regions(tmp_path)
+    app.config["GEOMETRY_TOLERANCES"] = (0.1,)
+    registry = GeometryRegistry(app)
+
+    left, right = registry.level_geometries(1)
+    assert left.intersection(right).length == pytest.approx(1.0)
+    assert left.intersection(right).area == 0
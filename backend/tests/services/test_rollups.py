@@ -0,0 +1,62 @@
+from datetime import datetime
+
+import pytest
+
+from app import db
+from app.models.data_models import GlobalStats, RegionalData, RegionalRollup
+from app.services.data_ingestion import ingest
+from app.services.rollups import rebuild_rollups, rollup_series
+
+
+def _rollup(region_id, period, metric, start):
+    return db.session.query(RegionalRollup).filter_by(
+        region_id=region_id, period=period, metric=metric, period_start=start
+    ).one()
+
+
+def test_rollups_hold_sum_count_and_weighted_mean(app):
+    row = _rollup(101, "month", "val_av", datetime(2025, 4, 1))
+    assert row.value_count == 5
+    assert row.value_sum == pytest.approx(12.5)
+    # Weighted by num_news 10 + d
+    assert row.value_mean == pytest.approx(0.5 + 130 / 60)
+
+    # Counts are averaged without weights
+    row = _rollup(101, "year", "num_news", datetime(2025, 1, 1))
+    assert row.value_mean == pytest.approx(12)
+
+
+def test_incremental_rebuild_only_replaces_later_periods(app):
+    april = _rollup(101, "month", "val_av", datetime(2025, 4, 1))
+    year = _rollup(101, "year", "val_av", datetime(2025, 1, 1))
+    april_id, year_id = april.id, year.id
+
+    db.session.add(RegionalData(region_id=101, item_date_published=datetime(2025, 5, 2),
+                                val_av=9.0, num_news=60))
+    rebuild_rollups(since=datetime(2025, 5, 2))
+    db.session.commit()
+    db.session.expire_all()
+
+    assert _rollup(101, "month", "val_av", datetime(2025, 4, 1)).id == april_id
+    assert _rollup(101, "month", "val_av", datetime(2025, 5, 1)).value_mean == 9.0
+    year = _rollup(101, "year", "val_av", datetime(2025, 1, 1))
+    assert year.id != year_id
+    assert year.value_count == 6
+    assert year.value_mean == pytest.approx((0.5 * 60 + 130 + 9.0 * 60) / 120)
+
+
+def test_rollup_series_returns_overlapping_periods(app):
+    rows = rollup_series(GlobalStats, ["Deutschland"], {"news": "num_news"},
+                         "week", datetime(2025, 4, 3), datetime(2025, 4, 3))
+    assert rows == [{"date": "2025-03-31", "country": "Deutschland", "news": 102.0}]
+
+
+def test_ingest_maintains_rollups(app, data_folder):
+    ingest(str(data_folder), incremental=True)
+    row = _rollup(102, "week", "rauh_sents_av", datetime(2025, 3, 31))
+    assert row.value_count == 5
+    assert row.value_mean == pytest.approx(0.102 + 130 / 60)
+
+    ingest(str(data_folder))
+    assert db.session.query(RegionalRollup).filter_by(
+        region_id=102, period="week", metric="rauh_sents_av").count() == 1
@@ -0,0 +1,49 @@
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from app import create_app, db
+from app.models.data_models import Regions
+
+
+def _pragma(conn, name):
+    return conn.exec_driver_sql(f"PRAGMA {name}").scalar()
+
+
+def test_pragmas_applied(app):
+    with db.engine.connect() as conn:
+        assert _pragma(conn, "journal_mode") == "wal"
+        assert _pragma(conn, "synchronous") == 1  # NORMAL
+        assert _pragma(conn, "temp_store") == 2  # MEMORY
+        assert _pragma(conn, "cache_size") == -64 * 1024
+    with app.extensions["sqlite_read_engine"].connect() as conn:
+        assert _pragma(conn, "mmap_size") == 256 * 1024 * 1024
+        assert _pragma(conn, "busy_timeout") == 5000
+
+
+def test_read_engine_is_read_only(app):
+    with app.extensions["sqlite_read_engine"].connect() as conn:
+        assert conn.execute(text("SELECT COUNT(*) FROM regions")).scalar() == 2
+        with pytest.raises(OperationalError, match="readonly"):
+            conn.execute(text("DELETE FROM regions"))
+
+
+def test_requests_read_from_read_engine_and_flush_to_writer(app):
+    read_engine = app.extensions["sqlite_read_engine"]
+    with app.test_request_context("/api/status"):
+        assert db.session.get_bind() is read_engine
+        db.session.add(Regions(region_id=103, region_name="Süd", country="Germany"))
+        db.session.commit()
+    assert db.session.get_bind() is db.engine
+    assert db.session.get(Regions, 103).region_name == "Süd"
+
+
+def test_read_pool_can_be_disabled(tmp_path):
+    app = create_app({
+        "SQLALCHEMY_DATABASE_URI": f"sqlite:///{tmp_path / 'plain.sqlite'}",
+        "SQLITE_READ_POOL": False,
+        "SQLITE_PRAGMAS": {},
+    })
+    assert app.extensions["sqlite_read_engine"] is None
+    with app.app_context(), db.engine.connect() as conn:
+        assert _pragma(conn, "journal_mode") == "delete"
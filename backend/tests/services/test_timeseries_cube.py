@@ -0,0 +1,85 @@
+from datetime import datetime
+
+import numpy as np
+import pytest
+
+from app import db
+from app.models.data_models import RegionalData
+from app.services.data_generation import bump_generation
+from app.services.timeseries_cube import TimeSeriesCube, cube_store, to_python_floats
+from tests.conftest import NUM_DAYS, START_DATE
+
+
+def _get_json(app, client, url, cube):
+    app.config["TIMESERIES_CUBE"] = cube
+    resp = client.get(url)
+    assert resp.status_code == 200
+    return resp.get_json()
+
+
+def _rounded(obj):
+    """Cube values are float32; compare to about 6 significant digits."""
+    if isinstance(obj, float):
+        return float(f"{obj:.6g}")
+    if isinstance(obj, dict):
+        return {k: _rounded(v) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_rounded(v) for v in obj]
+    return obj
+
+
+def test_cube_layout(app):
+    cube = cube_store.get()
+    assert cube.region_ids.tolist() == [101, 102]
+    assert cube.region_names == {101: "Mitte", 102: "Nord"}
+    assert cube.values["rauh_sents_av"].shape == (2, NUM_DAYS)
+    assert cube.values["rauh_sents_av"].dtype == np.float32
+    assert cube.present.all()
+    assert cube.latest_day() == datetime(2025, 4, 5)
+
+
+def test_float32_values_round_trip_shortest():
+    values = np.array([0.101, 4.102, np.nan], dtype=np.float32)
+    assert to_python_floats(values) == [0.101, 4.102, None]
+
+
+@pytest.mark.parametrize("url", [
+    "/api/regions/region/101?from=2025-04-02&to=2025-04-04",
+    "/api/regions/region/102?metrics=sentiment_mean,valenz_mean",
+    "/api/trends/regional?regions=102,101&from=2025-04-01&to=2025-04-03",
+    "/api/map/heat?metric=happiness_mean&date=2025-04-02",
+])
+def test_cube_matches_sql(app, client, url):
+    cube = _get_json(app, client, url, True)
+    sql = _get_json(app, client, url, False)
+    assert _rounded(cube) == _rounded(sql)
+
+
+def test_cube_reloads_after_ingest(app, client):
+    first = cube_store.get()
+    assert cube_store.get() is first
+
+    row = db.session.get(RegionalData, 1)
+    row.rauh_sents_av = 9.5
+    bump_generation()
+    db.session.commit()
+
+    cube = cube_store.get()
+    assert cube is not first
+    dates, columns = cube.series(row.region_id, ["rauh_sents_av"],
+                                 START_DATE, START_DATE)
+    assert dates == ["2025-04-01"]
+    assert columns["rauh_sents_av"] == [9.5]
+
+
+def test_missing_days_are_absent(app):
+    db.session.query(RegionalData).filter(
+        RegionalData.region_id == 101,
+        RegionalData.item_date_published == datetime(2025, 4, 3),
+    ).delete()
+    db.session.commit()
+
+    cube = TimeSeriesCube.load(("test", 0))
+    dates, _ = cube.series(101, ["val_av"], START_DATE, datetime(2025, 4, 5))
+    assert dates == ["2025-04-01", "2025-04-02", "2025-04-04", "2025-04-05"]
+    assert 101 not in cube.day_values("val_av", datetime(2025, 4, 3))
@@ -0,0 +1,50 @@
+from shapely.geometry import MultiPolygon, Polygon, box
+
+from app.services.topology import build_topology
+
+
+def _decode_ring(transform, arcs, refs):
+    (kx, ky), (tx, ty) = transform["scale"], transform["translate"]
+    decoded = []
+    for arc in arcs:
+        x = y = 0
+        points = []
+        for dx, dy in arc:
+            x, y = x + dx, y + dy
+            points.append((x * kx + tx, y * ky + ty))
+        decoded.append(points)
+
+    ring = []
+    for ref in refs:
+        points = decoded[ref] if ref >= 0 else decoded[~ref][::-1]
+        ring.extend(points if not ring else points[1:])
+    return ring
+
+
+def test_shared_edge_is_encoded_once():
+    left, right = box(0, 0, 1, 1), box(1, 0, 2, 1)
+
+    transform, arcs, objects = build_topology([101, 102], [left, right])
+
+    (_, left_geom), (_, right_geom) = objects
+    left_refs, right_refs = left_geom["arcs"][0], right_geom["arcs"][0]
+    shared = {r if r >= 0 else ~r for r in left_refs} & {r if r >= 0 else ~r for r in right_refs}
+    assert len(shared) == 1
+    # Both sides traverse the shared arc in opposite directions
+    ref = shared.pop()
+    assert (ref in left_refs) != (ref in right_refs)
+    assert len(arcs) == 3
+
+
+def test_round_trip_within_quantization():
+    hole = Polygon([(0, 0), (4, 0), (4, 4), (0, 4)], [[(1, 1), (2, 1), (2, 2), (1, 2)]])
+    islands = MultiPolygon([box(5, 0, 6, 1), box(7, 0, 8, 1)])
+
+    transform, arcs, objects = build_topology([1, 2], [hole, islands], quantization=1001)
+
+    (_, poly), (_, multi) = objects
+    assert poly["type"] == "Polygon" and len(poly["arcs"]) == 2
+    assert multi["type"] == "MultiPolygon" and len(multi["arcs"]) == 2
+    outer = Polygon(_decode_ring(transform, arcs, poly["arcs"][0]),
+                    [_decode_ring(transform, arcs, poly["arcs"][1])])
+    assert outer.symmetric_difference(hole).area < 1e-6
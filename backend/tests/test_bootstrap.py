@@ -0,0 +1,31 @@
+import json
+
+from app.services.response_cache import MemoryBackend
+
+
+def test_bootstrap_matches_endpoints(client):
+    resp = client.get("/api/bootstrap?countries=Deutschland")
+    assert resp.status_code == 200
+    data = resp.get_json()
+
+    assert list(data) == ["status", "regions", "map", "global_trends"]
+    assert data["status"] == client.get("/api/status").get_json()
+    assert data["regions"] == client.get("/api/trends/regions").get_json()
+    assert data["map"] == client.get("/api/map/heat?metric=sentiment_mean").get_json()
+    assert data["global_trends"] == client.get(
+        "/api/trends/global?countries=Deutschland&metric=sentiment").get_json()
+
+
+def test_bootstrap_fills_endpoint_caches(app, client):
+    cache = app.extensions["response_cache"] = MemoryBackend(16)
+    client.get("/api/bootstrap")
+    assert len(cache) == 3
+
+    client.get("/api/trends/regions")
+    assert cache.stats.hits == 1
+
+
+def test_bootstrap_reports_failing_part(client):
+    resp = client.get("/api/bootstrap?map_metric=nope")
+    assert resp.status_code == 400
+    assert json.loads(resp.data) == {"error": "map: Invalid metric key"}
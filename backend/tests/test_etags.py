@@ -0,0 +1,63 @@
+import pytest
+from sqlalchemy import event
+
+from app import db
+from app.services.data_generation import bump_generation
+
+
+@pytest.mark.parametrize("url", [
+    "/api/status",
+    "/api/trends/regional?regions=101,102",
+    "/api/trends/regions",
+    "/api/regions/region/101",
+    "/api/map/heat?metric=sentiment_mean",
+])
+def test_matching_etag_returns_304_without_queries(app, client, url):
+    first = client.get(url)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    statements = []
+    capture = lambda *args: statements.append(args[2])
+    # Requests read through the read-only pool
+    engine = app.extensions["sqlite_read_engine"] or db.engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        resp = client.get(url, headers={"If-None-Match": etag})
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert resp.status_code == 304
+    assert resp.data == b""
+    assert resp.headers["ETag"] == etag
+    # Only the data generation is read
+    assert len(statements) == 1 and "data_generation" in statements[0]
+
+
+def test_etag_ignores_parameter_order(client):
+    a = client.get("/api/regions/region/101?from=2025-04-01&metrics=valenz_mean")
+    b = client.get("/api/regions/region/101?metrics=valenz_mean&from=2025-04-01")
+    c = client.get("/api/regions/region/101?metrics=sentiment_mean&from=2025-04-01")
+    assert a.headers["ETag"] == b.headers["ETag"] != c.headers["ETag"]
+
+
+def test_etag_changes_with_generation(client):
+    etag = client.get("/api/status").headers["ETag"]
+    bump_generation()
+    db.session.commit()
+    resp = client.get("/api/status", headers={"If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.headers["ETag"] != etag
+
+
+def test_errors_carry_no_etag(client):
+    resp = client.get("/api/map/heat?metric=nope")
+    assert resp.status_code == 400
+    assert "ETag" not in resp.headers
+
+
+def test_geojson_keeps_content_etag(client):
+    first = client.get("/api/geojson/regions-with-sentiment")
+    assert not first.headers["ETag"].strip('"').startswith("g")
+    resp = client.get("/api/geojson/regions-with-sentiment",
+                      headers={"If-None-Match": first.headers["ETag"]})
+    assert resp.status_code == 304
@@ -0,0 +1,56 @@
+import io
+
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+
+def test_regional_export_arrow(app, client):
+    app.config["EXPORT_BATCH_SIZE"] = 3
+    resp = client.get("/api/export/regional_data?regions=102,101&metrics=val_av,num_news"
+                      "&from=2025-04-02&to=2025-04-04")
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/vnd.apache.arrow.stream"
+
+    reader = pa.ipc.open_stream(resp.data)
+    batches = list(reader)
+    assert [b.num_rows for b in batches] == [3, 3]
+    table = pa.Table.from_batches(batches)
+    assert table.schema.names == ["region_id", "item_date_published", "val_av", "num_news"]
+    assert table.schema.field("num_news").type == pa.int64()
+
+    df = table.to_pandas()
+    assert df["region_id"].tolist() == [101, 101, 101, 102, 102, 102]
+    assert df["item_date_published"].dt.strftime("%Y-%m-%d").tolist()[:3] == [
+        "2025-04-02", "2025-04-03", "2025-04-04"]
+    assert df["val_av"].tolist()[:3] == pytest.approx([1.5, 2.5, 3.5])
+
+
+def test_global_export_parquet(client):
+    resp = client.get("/api/export/global_stats?format=parquet&countries=Deutschland")
+    assert resp.status_code == 200
+    assert resp.headers["Content-Disposition"] == 'attachment; filename="global_stats.parquet"'
+
+    df = pd.read_parquet(io.BytesIO(resp.data))
+    assert df.columns.tolist() == ["country", "item_date_published", "num_newspaper",
+                                   "num_feeds", "av_sents", "num_news"]
+    assert df["num_news"].tolist() == [100, 101, 102, 103, 104]
+
+
+def test_empty_export_has_schema(client):
+    resp = client.get("/api/export/global_stats?countries=Schweiz")
+    table = pa.ipc.open_stream(resp.data).read_all()
+    assert table.num_rows == 0
+    assert table.schema.names[0] == "country"
+
+
+@pytest.mark.parametrize("url", [
+    "/api/export/regional_data?format=csv",
+    "/api/export/regional_data?metrics=av_sents",
+    "/api/export/regional_data?regions=abc",
+    "/api/export/global_stats?from=yesterday",
+])
+def test_invalid_export(client, url):
+    resp = client.get(url)
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
@@ -0,0 +1,27 @@
+import os
+
+from app.services.geojson import build_regions_geojson, current_regions_geojson
+
+
+def test_artifact_is_content_addressed(app):
+    first = build_regions_geojson()
+    second = build_regions_geojson()
+
+    assert first["etag"] == second["etag"]
+    assert first["path"] == second["path"]
+    assert first["etag"][:16] in os.path.basename(first["path"])
+    assert current_regions_geojson()["path"] == first["path"]
+
+
+def test_conditional_get_returns_304(client):
+    response = client.get("/api/geojson/regions-with-sentiment")
+    assert response.status_code == 200
+    assert response.headers["Last-Modified"]
+    etag = response.headers["ETag"]
+    assert len(response.get_json()["features"]) == 2
+    response.close()
+
+    cached = client.get("/api/geojson/regions-with-sentiment",
+                        headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.data == b""
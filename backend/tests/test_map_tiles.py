@@ -0,0 +1,40 @@
+import mapbox_vector_tile
+
+from app import db
+from app.services.data_generation import bump_generation
+from app.services.vector_tiles import MVT_MIMETYPE, tile_cache
+
+
+def test_tile_encodes_metric_per_region(client):
+    response = client.get("/api/map/tiles/0/0/0.mvt?metric=sentiment_mean")
+
+    assert response.status_code == 200
+    assert response.mimetype == MVT_MIMETYPE
+    features = mapbox_vector_tile.decode(response.data)["regions"]["features"]
+    props = {f["properties"]["region_id"]: f["properties"] for f in features}
+    assert props[101]["NAME"] == "Mitte"
+    assert props[102]["value"] == 0.102 + 4
+
+
+def test_tiles_outside_regions_are_empty(client):
+    response = client.get("/api/map/tiles/4/0/0.mvt?metric=sentiment_mean")
+    assert response.status_code == 204
+
+
+def test_tile_cache_is_invalidated_by_new_generation(client):
+    tile_cache.clear()
+    client.get("/api/map/tiles/0/0/0.mvt?metric=valenz_mean")
+    assert len(tile_cache._tiles) == 1
+
+    client.get("/api/map/tiles/0/0/0.mvt?metric=valenz_mean")
+    assert len(tile_cache._tiles) == 1
+
+    bump_generation()
+    db.session.commit()
+    client.get("/api/map/tiles/0/0/0.mvt?metric=valenz_mean")
+    assert len(tile_cache._tiles) == 2
+
+
+def test_invalid_tile_requests(client):
+    assert client.get("/api/map/tiles/0/0/0.mvt?metric=bogus").status_code == 400
+    assert client.get("/api/map/tiles/2/4/0.mvt?metric=valenz_mean").status_code == 404
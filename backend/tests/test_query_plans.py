@@ -0,0 +1,71 @@
+import pytest
+from sqlalchemy import event
+
+from app import db
+
+# Tables whose rows grow with history; no route may read them in full
+FACT_TABLES = ("regional_data", "global_stats")
+
+
+def _captured_selects(app, client, url):
+    """Runs one request with the SQL paths enabled and returns its SELECTs."""
+    app.config["TIMESERIES_CUBE"] = False
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    # Requests read through the read-only pool
+    engine = app.extensions["sqlite_read_engine"] or db.engine
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        resp = client.get(url)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    assert resp.status_code in (200, 204), resp.data
+    return statements
+
+
+def _plan(statement, parameters) -> list:
+    with db.engine.connect() as conn:
+        rows = conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters)
+        return [row[3] for row in rows]
+
+
+def _plan_problems(plan, allowed_scans=()) -> list:
+    problems = []
+    for step in plan:
+        if "TEMP B-TREE" in step:
+            problems.append(step)
+        elif step.startswith("SCAN "):
+            table = step.split()[1]
+            if table in allowed_scans:
+                continue
+            if "USING" not in step or table in FACT_TABLES:
+                problems.append(step)
+    return problems
+
+
+@pytest.mark.parametrize("url, allowed_scans", [
+    ("/api/status", ()),
+    ("/api/trends/regional?regions=102,101&from=2025-04-01&to=2025-04-04", ()),
+    ("/api/trends/global?countries=Deutschland,Schweiz&from=2025-04-01", ()),
+    ("/api/trends/regions", ()),
+    ("/api/trends/regional?regions=102,101&resolution=month", ()),
+    ("/api/trends/global?countries=Deutschland,Schweiz&resolution=week", ()),
+    ("/api/regions/region/101?from=2025-04-02", ()),
+    ("/api/regions/region/101?resolution=year", ()),
+    ("/api/map/heat?metric=sentiment_mean", ()),
+    ("/api/map/heat?metric=valenz_mean&date=2025-04-03", ()),
+    ("/api/map/tiles/0/0/0.mvt?metric=happiness_mean", ()),
+    ("/api/geojson/regions-with-sentiment", ()),
+    ("/api/export/regional_data?regions=102,101&from=2025-04-02", ()),
+    ("/api/export/global_stats?countries=Deutschland&format=parquet", ()),
+])
+def test_route_queries_use_indexes(app, client, url, allowed_scans):
+    statements = _captured_selects(app, client, url)
+    assert statements
+    for statement, parameters in statements:
+        plan = _plan(statement, parameters)
+        assert _plan_problems(plan, allowed_scans) == [], (statement, plan)
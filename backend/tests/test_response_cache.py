@@ -0,0 +1,89 @@
+from datetime import date
+
+import pytest
+
+from app import db
+from app.services.data_generation import bump_generation
+from app.services.response_cache import MemoryBackend, SQLiteBackend
+
+
+@pytest.fixture
+def cache(app):
+    backend = MemoryBackend(16)
+    app.extensions["response_cache"] = backend
+    return backend
+
+
+def test_list_params_are_order_insensitive(client, cache):
+    first = client.get("/api/trends/regional?regions=102,101&from=2025-04-01")
+    second = client.get("/api/trends/regional?regions=101, 102&from=2025-04-01")
+
+    assert first.status_code == second.status_code == 200
+    assert first.get_json() == second.get_json()
+    assert cache.stats.as_dict() == {"hits": 1, "misses": 1, "evictions": 0}
+
+
+def test_defaults_are_resolved_before_keying(client, cache):
+    today = date.today().isoformat()
+    client.get("/api/regions/region/101?metrics=sentiment_mean")
+    client.get(f"/api/regions/region/101?metrics=sentiment_mean&from=2019-01-01&to={today}")
+
+    assert cache.stats.hits == 1
+    assert len(cache) == 1
+
+
+def test_new_generation_misses(app, client, cache):
+    url = "/api/trends/global?countries=Deutschland"
+    client.get(url)
+    bump_generation()
+    db.session.commit()
+    client.get(url)
+
+    assert cache.stats.as_dict() == {"hits": 0, "misses": 2, "evictions": 0}
+
+
+def test_errors_are_not_cached(client, cache):
+    assert client.get("/api/trends/regional?regions=abc").status_code == 400
+    assert client.get("/api/trends/regional?regions=abc").status_code == 400
+    assert len(cache) == 0
+
+
+def test_stats_endpoint(client, cache):
+    client.get("/api/trends/regions")
+    client.get("/api/trends/regions")
+
+    resp = client.get("/api/status/cache")
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "backend": "memory", "entries": 1, "hits": 1, "misses": 1, "evictions": 0,
+    }
+
+
+def test_memory_backend_evicts_lru_and_expired():
+    backend = MemoryBackend(2)
+    backend.set("a", b"1", ttl=60)
+    backend.set("b", b"2", ttl=60)
+    backend.get("a")
+    backend.set("c", b"3", ttl=60)
+    assert backend.get("b") is None
+    assert backend.get("a") == b"1"
+
+    backend.set("d", b"4", ttl=-1)
+    assert backend.get("d") is None
+    assert backend.stats.evictions == 2
+
+
+def test_sqlite_backend_is_shared(tmp_path):
+    path = str(tmp_path / "cache" / "responses.sqlite")
+    writer, reader = SQLiteBackend(path, 2), SQLiteBackend(path, 2)
+
+    writer.set("a", (b"[1]", "application/json"), ttl=60)
+    assert reader.get("a") == (b"[1]", "application/json")
+
+    writer.set("b", (b"[2]", "application/json"), ttl=60)
+    writer.set("c", (b"[3]", "application/json"), ttl=60)
+    assert len(reader) == 2
+    assert writer.stats.evictions == 1
+
+    reader.clear()
+    assert writer.get("c") is None
@@ -0,0 +1,12 @@
+import waitress
+
+
+def test_serve_uses_configured_threads(app, monkeypatch):
+    calls = []
+    monkeypatch.setattr(waitress, "serve", lambda wsgi_app, **kw: calls.append((wsgi_app, kw)))
+    app.config["SERVE_THREADS"] = 12
+
+    result = app.test_cli_runner().invoke(args=["serve", "--port", "8123"])
+
+    assert result.exit_code == 0, result.output
+    assert calls == [(app, {"host": "127.0.0.1", "port": 8123, "threads": 12})]
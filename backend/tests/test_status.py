@@ -0,0 +1,49 @@
+from datetime import date, datetime
+
+from app import db
+from app.models.data_models import DailyCounter, DashboardSummary, GlobalStats
+from app.services.dashboard_summary import refresh_summary
+from app.services.data_generation import bump_generation
+
+
+def test_status_from_summary(client):
+    resp = client.get("/api/status")
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "last_update": "2025-04-05",
+        "total_news": 510,
+        "channels_count": 30,
+        "sources_count": 20,
+        "news_today": 0,
+        "sentiment_today": None,
+    }
+
+
+def test_status_falls_back_without_summary(client):
+    expected = client.get("/api/status").get_json()
+    db.session.query(DashboardSummary).delete()
+    bump_generation()
+    db.session.commit()
+    assert client.get("/api/status").get_json() == expected
+
+
+def test_refresh_updates_today_and_total(client):
+    client.get("/api/status")
+    today = datetime.combine(date.today(), datetime.min.time())
+    db.session.add_all([
+        GlobalStats(country="Deutschland", item_date_published=today,
+                    num_newspaper=21, num_feeds=31, av_sents=0.2, num_news=30),
+        GlobalStats(country="Schweiz", item_date_published=today,
+                    num_newspaper=5, num_feeds=6, av_sents=0.6, num_news=10),
+    ])
+    refresh_summary(since=today)
+    bump_generation()
+    db.session.commit()
+
+    data = client.get("/api/status").get_json()
+    assert data["total_news"] == 550
+    assert data["last_update"] == date.today().isoformat()
+    assert data["news_today"] == 40
+    # num_news-weighted over countries
+    assert abs(data["sentiment_today"] - 0.3) < 1e-9
+    assert db.session.query(DailyCounter).count() == 6
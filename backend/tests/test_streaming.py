@@ -0,0 +1,79 @@
+import csv
+import io
+import json
+
+import pytest
+
+from app.services.response_cache import MemoryBackend
+
+NDJSON = {"Accept": "application/x-ndjson"}
+
+
+def _ndjson(resp):
+    return [json.loads(line) for line in resp.data.decode().splitlines()]
+
+
+@pytest.mark.parametrize("url, key", [
+    ("/api/trends/regional?regions=102,101&from=2025-04-02&to=2025-04-04", "region_id"),
+    ("/api/trends/regional?regions=101,102&points=3", "region_id"),
+    ("/api/trends/regional?regions=101,102&resolution=week", "region_id"),
+    ("/api/trends/global?countries=Deutschland&from=2025-04-02", "country"),
+])
+def test_ndjson_matches_json(client, url, key):
+    rows = client.get(url).get_json()
+    resp = client.get(url, headers=NDJSON)
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
+    assert "Accept" in resp.headers["Vary"]
+
+    streamed = _ndjson(resp)
+    # Streams are series-major, the JSON array is date-major
+    assert streamed == sorted(rows, key=lambda r: (r[key], r["date"]))
+
+
+def test_region_details_csv(client):
+    resp = client.get("/api/regions/region/101?from=2025-04-01&to=2025-04-02"
+                      "&metrics=valenz_mean,happiness_mean",
+                      headers={"Accept": "text/csv"})
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/csv"
+    rows = list(csv.reader(io.StringIO(resp.data.decode())))
+    assert rows == [["date", "valenz_mean", "happiness_mean"],
+                    ["2025-04-01", "0.5", "0.3"],
+                    ["2025-04-02", "1.5", "1.3"]]
+
+
+def test_empty_csv_has_header(client):
+    resp = client.get("/api/trends/global?countries=Schweiz", headers={"Accept": "text/csv"})
+    assert resp.data == b"date,country,sentiment\n"
+
+
+def test_small_batches(app, client):
+    app.config["STREAM_BATCH_SIZE"] = 2
+    resp = client.get("/api/trends/regional?regions=101,102", headers=NDJSON)
+    assert len(_ndjson(resp)) == 10
+
+
+@pytest.mark.parametrize("accept", ["*/*", "application/json",
+                                    "application/json, application/x-ndjson;q=0.5"])
+def test_json_is_the_default(client, accept):
+    resp = client.get("/api/trends/regional?regions=101", headers={"Accept": accept})
+    assert resp.mimetype == "application/json"
+    assert isinstance(resp.get_json(), list)
+
+
+def test_streams_bypass_response_cache(app, client):
+    cache = app.extensions["response_cache"] = MemoryBackend(8)
+    url = "/api/trends/regional?regions=101"
+    client.get(url)
+    resp = client.get(url, headers=NDJSON)
+    assert resp.mimetype == "application/x-ndjson"
+    assert len(cache) == 1
+
+
+def test_etag_depends_on_accept(client):
+    url = "/api/trends/regional?regions=101"
+    etag = client.get(url).headers["ETag"]
+    resp = client.get(url, headers={**NDJSON, "If-None-Match": etag})
+    assert resp.status_code == 200
+    assert resp.mimetype == "application/x-ndjson"
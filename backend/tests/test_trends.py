@@ -0,0 +1,98 @@
+import pytest
+
+
+@pytest.mark.parametrize("cube", [True, False])
+def test_regional_trends_weekly(app, client, cube):
+    app.config["TIMESERIES_CUBE"] = cube
+    resp = client.get("/api/trends/regional?regions=101,102&from=2025-04-01"
+                      "&to=2025-04-05&resolution=week")
+    assert resp.status_code == 200
+    data = resp.get_json()
+    # 2025-04-01 .. 04-05 fall in the week starting Monday 2025-03-31
+    assert [(r["date"], r["region_id"], r["region_name"]) for r in data] == [
+        ("2025-03-31", 101, "Mitte"), ("2025-03-31", 102, "Nord")]
+    # val_av 0.5 + d weighted by num_news 10 + d
+    assert data[0]["valenz"] == pytest.approx(0.5 + 130 / 60)
+
+
+def test_region_details_points(client):
+    resp = client.get("/api/regions/region/101?from=2025-04-01&to=2025-04-05"
+                      "&metrics=valenz_mean&points=3")
+    assert resp.status_code == 200
+    dates = [r["date"] for r in resp.get_json()["data"]]
+    assert len(dates) == 3
+    assert dates[0] == "2025-04-01" and dates[-1] == "2025-04-05"
+
+
+def test_global_trends_monthly(client):
+    resp = client.get("/api/trends/global?countries=Deutschland&from=2025-04-01"
+                      "&to=2025-04-30&resolution=month")
+    assert resp.status_code == 200
+    assert resp.get_json() == [
+        {"date": "2025-04-01", "country": "Deutschland",
+         "sentiment": pytest.approx(0.01 * 1030 / 510)}]
+
+
+@pytest.mark.parametrize("query", ["resolution=quarter", "points=1", "points=abc"])
+def test_invalid_downsampling(client, query):
+    resp = client.get(f"/api/trends/regional?regions=101&{query}")
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
+
+
+def _rows_by_series(data, key):
+    return {(r["date"], r[key]): r for r in data}
+
+
+@pytest.mark.parametrize("cube", [True, False])
+@pytest.mark.parametrize("query", ["", "&resolution=week", "&points=3"])
+def test_regional_trends_columnar_matches_rows(app, client, cube, query):
+    app.config["TIMESERIES_CUBE"] = cube
+    url = f"/api/trends/regional?regions=102,101&from=2025-04-02&to=2025-04-05{query}"
+    rows = client.get(url).get_json()
+    resp = client.get(url + "&format=columnar")
+    assert resp.status_code == 200
+    data = resp.get_json()
+
+    assert data["regions"] == {"101": "Mitte", "102": "Nord"}
+    assert data["dates"] == sorted({r["date"] for r in rows})
+    by_series = _rows_by_series(rows, "region_id")
+    for rid, columns in data["series"].items():
+        for i, day in enumerate(data["dates"]):
+            row = by_series[(day, int(rid))]
+            for key in ("rauh", "happiness", "valenz"):
+                assert columns[key][i] == pytest.approx(row[key], rel=1e-6)
+
+
+def test_global_trends_columnar(client):
+    resp = client.get("/api/trends/global?countries=Deutschland&from=2025-04-01"
+                      "&to=2025-04-03&format=columnar")
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "dates": ["2025-04-01", "2025-04-02", "2025-04-03"],
+        "series": {"Deutschland": {"sentiment": [0.0, 0.01, 0.02]}},
+    }
+
+
+@pytest.mark.parametrize("cube", [True, False])
+def test_region_details_columnar(app, client, cube):
+    app.config["TIMESERIES_CUBE"] = cube
+    resp = client.get("/api/regions/region/101?from=2025-04-02&to=2025-04-03"
+                      "&metrics=valenz_mean,happiness_mean&format=columnar")
+    assert resp.status_code == 200
+    assert resp.get_json() == {
+        "region_id": 101,
+        "region_name": "Mitte",
+        "dates": ["2025-04-02", "2025-04-03"],
+        "series": {"valenz_mean": [1.5, 2.5], "happiness_mean": [1.3, 2.3]},
+    }
+
+
+@pytest.mark.parametrize("url", [
+    "/api/trends/regional?regions=101&format=csv",
+    "/api/regions/region/101?format=csv",
+])
+def test_invalid_format(client, url):
+    resp = client.get(url)
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()